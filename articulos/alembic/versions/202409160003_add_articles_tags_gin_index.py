@@ -0,0 +1,31 @@
+"""Agrega el índice GIN sobre tags"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# Revisiones de Alembic.
+revision: str = "202409160003"
+down_revision: Union[str, None] = "202409160002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # ``CONCURRENTLY`` no bloquea las escrituras sobre ``articles`` mientras se
+    # construye el índice, pero no puede correr dentro de una transacción.
+    # Si falla deja un índice ``INVALID``: hay que borrarlo antes de reintentar.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_articles_tags",
+            "articles",
+            ["tags"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_articles_tags", table_name="articles", postgresql_concurrently=True)
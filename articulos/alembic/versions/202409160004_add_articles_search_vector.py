@@ -0,0 +1,54 @@
+"""Agrega la columna tsvector generada y su índice GIN para la búsqueda
+
+Atención: agregar una columna generada ``STORED`` reescribe toda la tabla
+``articles`` bajo un lock ``ACCESS EXCLUSIVE``; mientras dura no se puede ni
+leer ni escribir la tabla. En tablas grandes hay que correrla en una ventana
+de mantenimiento (o agregar una columna normal, poblarla por lotes y mantenerla
+con un trigger). El índice GIN sí se construye ``CONCURRENTLY``.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# Revisiones de Alembic.
+revision: str = "202409160004"
+down_revision: Union[str, None] = "202409160003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "articles",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "setweight(to_tsvector('spanish', coalesce(title, '')), 'A') || "
+                "setweight(to_tsvector('spanish', coalesce(body, '')), 'B')",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    # Fuera de la transacción (``CONCURRENTLY``): no bloquea las escrituras.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_articles_search_vector",
+            "articles",
+            ["search_vector"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_articles_search_vector", table_name="articles", postgresql_concurrently=True
+        )
+    op.drop_column("articles", "search_vector")
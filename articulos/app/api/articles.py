@@ -3,98 +3,453 @@
 
 from __future__ import annotations
 
-from typing import Optional
+import inspect
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from starlette.concurrency import run_in_threadpool
 
 from app.api.deps import (
     enforce_api_key,
     get_article_service,
+    get_async_article_service,
+    get_async_export_sessions,
+    get_export_sessions,
 )
+from app.api.http_cache import (
+    article_etag,
+    body_etag,
+    has_conditions,
+    is_not_modified,
+    not_modified,
+    validator_headers,
+)
+from app.config import settings
+from app.profiling import in_thread
 from app.schemas import (
+    ArticleBatchRequest,
+    ArticleBatchResponse,
+    ArticleBulkDeleteResponse,
+    ArticleBulkItem,
+    ArticleBulkResponse,
     ArticleCreate,
+    ArticleListItem,
     ArticleListResponse,
     ArticleResponse,
+    ArticleSearchItem,
+    ArticleSearchResponse,
+    ArticleSummary,
     ArticleUpdate,
 )
-from app.services import ArticleService
-from app.services.article_service import ArticleCreateData, ArticleDTO, ArticleUpdateData
-from app.services.exceptions import ArticleAlreadyExistsError, ArticleNotFoundError
+from app.services import ArticleService, AsyncArticleService
+from app.services.article_service import (
+    ArticleCreateData,
+    ArticleUpdateData,
+    BulkStatus,
+    TotalMode,
+    render_article,
+    render_batch,
+    render_page,
+)
+from app.services.exceptions import (
+    ArticleAlreadyExistsError,
+    ArticleNotFoundError,
+    InvalidCursorError,
+)
+from app.services.export import ExportFormat, aiter_export, iter_export
 
 router = APIRouter(prefix="/articles", tags=["articles"], dependencies=[Depends(enforce_api_key)])
 
+# ASYNC_MODE decide qué implementación del servicio recibe cada endpoint.
+_service_dependency = get_async_article_service if settings.async_mode else get_article_service
+_export_sessions_dependency = get_async_export_sessions if settings.async_mode else get_export_sessions
+
+AnyArticleService = Union[ArticleService, AsyncArticleService]
+
+
+async def _call(method: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Invoca el servicio sin bloquear el event loop.
+
+    El servicio asíncrono se espera directamente; el síncrono se delega al
+    threadpool, igual que ocurría cuando los endpoints eran ``def``.
+    """
+    if inspect.iscoroutinefunction(method):
+        return await method(*args, **kwargs)
+    return await run_in_threadpool(in_thread(method), *args, **kwargs)
+
+
+def _article_headers(
+    article_id: str, updated_at: Optional[datetime], fields: Optional[Iterable[str]] = None
+) -> Dict[str, str]:
+    """Validadores de un artículo; sin ``updated_at`` sólo se envía ``Cache-Control``."""
+    if updated_at is None:
+        return validator_headers("get_article")
+    return validator_headers("get_article", article_etag(article_id, updated_at, fields), updated_at)
+
+
+def _json(
+    body: bytes, *, status_code: int = status.HTTP_200_OK, headers: Optional[Dict[str, str]] = None
+) -> Response:
+    """Respuesta con el JSON ya renderizado por el servicio.
+
+    Al devolver un ``Response`` FastAPI no vuelve a validar ni serializar con
+    ``response_model``, que queda sólo para documentar el esquema en OpenAPI.
+    """
+    return Response(content=body, status_code=status_code, media_type="application/json", headers=headers)
+
 
-def _to_response(dto: ArticleDTO) -> ArticleResponse:
-    """Convierte el DTO del servicio al esquema de respuesta del API."""
-    return ArticleResponse.model_validate(dto.to_dict())
+# ``fields=summary`` equivale a los campos de :class:`ArticleSummary`.
+_FIELD_PRESETS = {"summary": frozenset(ArticleSummary.model_fields)}
+
+_FIELDS_DESCRIPTION = (
+    "Campos a devolver separados por comas (`id` siempre se incluye) o `summary`; "
+    "sólo esas columnas se leen de PostgreSQL."
+)
+
+
+def _parse_fields(fields: Optional[str]) -> Optional[frozenset[str]]:
+    """Interpreta ``fields=a,b`` (sparse fieldset); ``None`` significa todos los campos."""
+    if fields is None:
+        return None
+    selected: frozenset[str] = frozenset()
+    for name in (part.strip() for part in fields.split(",")):
+        if name:
+            selected |= _FIELD_PRESETS.get(name, {name})
+    unknown = selected - ArticleListItem.model_fields.keys()
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Campos desconocidos: {', '.join(sorted(unknown))}",
+        )
+    return selected | {"id"}
 
 
 @router.post("/", response_model=ArticleResponse, status_code=status.HTTP_201_CREATED)
-def create_article_endpoint(
+async def create_article_endpoint(
     payload: ArticleCreate,
-    service: ArticleService = Depends(get_article_service),
-) -> ArticleResponse:
+    service: AnyArticleService = Depends(_service_dependency),
+) -> Response:
     try:
-        dto = service.create(
+        dto = await _call(
+            service.create,
             ArticleCreateData(
                 title=payload.title,
                 body=payload.body,
                 tags=payload.tags,
                 author=payload.author,
                 published_at=payload.published_at,
-            )
+            ),
         )
     except ArticleAlreadyExistsError as exc:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=str(exc),
         ) from exc
-    return _to_response(dto)
+    return _json(render_article(dto), status_code=status.HTTP_201_CREATED)
+
+
+@router.post("/bulk", response_model=ArticleBulkResponse)
+async def bulk_create_articles_endpoint(
+    payload: List[Any] = Body(..., description="Lista de artículos con el formato de `POST /articles/`."),
+    on_conflict: str = Query(
+        default="ignore",
+        pattern="^(ignore|update)$",
+        description="`ignore` reporta los (title, author) existentes como conflicto; `update` los sobrescribe.",
+    ),
+    service: AnyArticleService = Depends(_service_dependency),
+) -> ArticleBulkResponse:
+    if len(payload) > settings.bulk_max_items:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"El lote admite como máximo {settings.bulk_max_items} artículos",
+        )
+
+    # Cada elemento se valida por separado: uno inválido no rechaza el lote completo.
+    items: List[ArticleBulkItem] = []
+    valid_indexes: List[int] = []
+    valid: List[ArticleCreateData] = []
+    for index, raw in enumerate(payload):
+        try:
+            article = ArticleCreate.model_validate(raw)
+        except ValidationError as exc:
+            items.append(ArticleBulkItem(index=index, status=BulkStatus.INVALID.value, error=str(exc)))
+            continue
+        valid_indexes.append(index)
+        valid.append(
+            ArticleCreateData(
+                title=article.title,
+                body=article.body,
+                tags=article.tags,
+                author=article.author,
+                published_at=article.published_at,
+            )
+        )
+
+    results = await _call(service.bulk_create, valid, update_existing=on_conflict == "update")
+    for index, result in zip(valid_indexes, results):
+        items.append(
+            ArticleBulkItem(
+                index=index,
+                status=result.status.value,
+                id=result.article.id if result.article else None,
+                error=result.error,
+            )
+        )
+    items.sort(key=lambda item: item.index)
+    counts = {state: 0 for state in BulkStatus}
+    for item in items:
+        counts[BulkStatus(item.status)] += 1
+    return ArticleBulkResponse(
+        created=counts[BulkStatus.CREATED],
+        updated=counts[BulkStatus.UPDATED],
+        conflicts=counts[BulkStatus.CONFLICT],
+        invalid=counts[BulkStatus.INVALID],
+        items=items,
+    )
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_articles_endpoint(
+    export_format: ExportFormat = Query(default=ExportFormat.NDJSON, alias="format"),
+    author: Optional[str] = Query(default=None),
+    tag: List[str] = Query(default=[], description="Etiqueta a filtrar; puede repetirse."),
+    tag_mode: str = Query(default="all", pattern="^(any|all)$"),
+    order: str = Query(default="desc", pattern="^(asc|desc)$"),
+    sessions: Any = Depends(_export_sessions_dependency),
+) -> StreamingResponse:
+    """Descarga todos los artículos filtrados en NDJSON o CSV, sin paginar."""
+    export = aiter_export if settings.async_mode else iter_export
+    chunks = export(
+        sessions,
+        export_format,
+        author=author,
+        tags=tag,
+        tag_mode=tag_mode,
+        order_desc=order == "desc",
+    )
+    return StreamingResponse(
+        chunks,
+        media_type=export_format.media_type,
+        headers={"Content-Disposition": f'attachment; filename="articles.{export_format.value}"'},
+    )
+
+
+# Tope de IDs por petición en ``/articles/batch`` (igual que ``limit`` en los listados).
+MAX_BATCH_IDS = 100
 
 
-@router.get("/{article_id}", response_model=ArticleResponse)
-def get_article_endpoint(
+def _split_ids(values: List[str]) -> List[str]:
+    """Admite ``?ids=a&ids=b`` y ``?ids=a,b``."""
+    return [article_id for value in values for article_id in value.split(",") if article_id]
+
+
+async def _batch(service: AnyArticleService, ids: List[str]) -> Response:
+    if len(ids) > MAX_BATCH_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Se admiten como máximo {MAX_BATCH_IDS} IDs por petición",
+        )
+    batch = await _call(service.get_batch, ids)
+    return _json(render_batch(batch))
+
+
+@router.get("/batch", response_model=ArticleBatchResponse)
+async def get_articles_batch_endpoint(
+    ids: List[str] = Query(
+        ...,
+        description="IDs a recuperar; puede repetirse (`?ids=a&ids=b`) o separarse por comas.",
+    ),
+    service: AnyArticleService = Depends(_service_dependency),
+) -> Response:
+    return await _batch(service, _split_ids(ids))
+
+
+@router.post("/batch", response_model=ArticleBatchResponse)
+async def post_articles_batch_endpoint(
+    payload: ArticleBatchRequest,
+    service: AnyArticleService = Depends(_service_dependency),
+) -> Response:
+    return await _batch(service, payload.ids)
+
+
+@router.delete("/batch", response_model=ArticleBulkDeleteResponse)
+async def delete_articles_batch_endpoint(
+    ids: List[str] = Query(
+        ...,
+        description="IDs a borrar; puede repetirse (`?ids=a&ids=b`) o separarse por comas.",
+    ),
+    service: AnyArticleService = Depends(_service_dependency),
+) -> ArticleBulkDeleteResponse:
+    requested = _split_ids(ids)
+    if len(requested) > MAX_BATCH_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Se admiten como máximo {MAX_BATCH_IDS} IDs por petición",
+        )
+    deleted = await _call(service.delete_many, article_ids=requested)
+    return ArticleBulkDeleteResponse(deleted=len(deleted), ids=deleted)
+
+
+@router.get("/search", response_model=ArticleSearchResponse)
+async def search_articles_endpoint(
+    q: str = Query(
+        min_length=1,
+        max_length=200,
+        description="Texto a buscar en título y cuerpo (sintaxis de `websearch_to_tsquery`).",
+    ),
+    limit: int = Query(default=20, ge=1, le=100),
+    author: Optional[str] = Query(default=None),
+    tag: List[str] = Query(default=[], description="Etiqueta a filtrar; puede repetirse."),
+    tag_mode: str = Query(default="all", pattern="^(any|all)$"),
+    cursor: Optional[str] = Query(default=None, description="Cursor opaco devuelto en `next_cursor`."),
+    service: AnyArticleService = Depends(_service_dependency),
+) -> ArticleSearchResponse:
+    try:
+        page = await _call(
+            service.search,
+            q,
+            limit=limit,
+            author=author,
+            tags=tag,
+            tag_mode=tag_mode,
+            cursor=cursor,
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return ArticleSearchResponse(
+        items=[
+            ArticleSearchItem(
+                **hit.article.project(ArticleSummary.model_fields), rank=hit.rank, snippet=hit.snippet
+            )
+            for hit in page.items
+        ],
+        limit=limit,
+        next_cursor=page.next_cursor,
+    )
+
+
+@router.get(
+    "/{article_id}",
+    response_model=ArticleResponse,
+    responses={200: {"description": "Con `fields`, sólo los campos pedidos (ver `ArticleListItem`)."}},
+)
+async def get_article_endpoint(
     article_id: str,
-    service: ArticleService = Depends(get_article_service),
-) -> ArticleResponse:
+    request: Request,
+    fields: Optional[str] = Query(default=None, description=_FIELDS_DESCRIPTION),
+    service: AnyArticleService = Depends(_service_dependency),
+) -> Response:
+    selected = _parse_fields(fields)
+    conditional = has_conditions(request)
+    if conditional:
+        # 304 con el ``updated_at`` cacheado: ni cuerpo ni PostgreSQL.
+        last_modified = await _call(service.get_last_modified, article_id)
+        if last_modified is not None:
+            headers = _article_headers(article_id, last_modified, selected)
+            if is_not_modified(request, headers.get("ETag"), last_modified):
+                return not_modified(headers)
+
+    if selected is not None:
+        try:
+            dto = await _call(service.get, article_id, fields=selected)
+        except ArticleNotFoundError as exc:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+        headers = _article_headers(article_id, dto.updated_at, selected)
+        if conditional and is_not_modified(request, headers.get("ETag"), dto.updated_at):
+            return not_modified(headers)
+        return _json(render_article(dto, selected), headers=headers)
+
+    # Acierto de caché: el cuerpo JSON ya renderizado sale sin parsear ni validar.
+    rendered = await _call(service.get_rendered, article_id)
+    if rendered is not None:
+        return _json(rendered.body, headers=_article_headers(article_id, rendered.updated_at))
     try:
-        dto = service.get(article_id)
+        dto = await _call(service.get, article_id)
     except ArticleNotFoundError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
-    return _to_response(dto)
+    headers = _article_headers(article_id, dto.updated_at)
+    if conditional and is_not_modified(request, headers.get("ETag"), dto.updated_at):
+        return not_modified(headers)
+    return _json(render_article(dto), headers=headers)
 
 
 @router.get("/", response_model=ArticleListResponse)
-def list_articles_endpoint(
+async def list_articles_endpoint(
+    request: Request,
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=50, ge=1, le=100),
     author: Optional[str] = Query(default=None),
-    tag: Optional[str] = Query(default=None),
+    tag: List[str] = Query(
+        default=[],
+        description="Etiqueta a filtrar; puede repetirse (`?tag=a&tag=b`).",
+    ),
+    tag_mode: str = Query(
+        default="all",
+        pattern="^(any|all)$",
+        description="Con varias etiquetas: `all` exige todas, `any` basta con una.",
+    ),
     order: str = Query(default="desc", pattern="^(asc|desc)$"),
-    service: ArticleService = Depends(get_article_service),
-) -> ArticleListResponse:
+    cursor: Optional[str] = Query(
+        default=None,
+        description="Cursor opaco devuelto en `next_cursor`; si se envía, `skip` se ignora.",
+    ),
+    total: TotalMode = Query(
+        default=TotalMode.EXACT,
+        description="`exact` (cacheado), `estimate` (estadísticas de PostgreSQL) o `none`.",
+    ),
+    fields: Optional[str] = Query(default=None, description=_FIELDS_DESCRIPTION),
+    service: AnyArticleService = Depends(_service_dependency),
+) -> Response:
     order_desc = order != "asc"
-    items, total = service.list(
-        skip=skip,
-        limit=limit,
-        author=author,
-        tag=tag,
-        order_desc=order_desc,
-    )
-    return ArticleListResponse(
-        items=[_to_response(dto) for dto in items],
-        total=total,
-        limit=limit,
-        skip=skip,
-    )
+    selected = _parse_fields(fields)
+    try:
+        page = await _call(
+            service.list,
+            skip=skip,
+            limit=limit,
+            author=author,
+            tags=tag,
+            tag_mode=tag_mode,
+            order_desc=order_desc,
+            cursor=cursor,
+            total_mode=total,
+            fields=selected,
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    body = render_page(page, limit=limit, skip=0 if cursor is not None else skip, fields=selected)
+    # ETag fuerte sobre el contenido exacto de la página.
+    headers = validator_headers("list_articles", body_etag(body))
+    if is_not_modified(request, headers["ETag"]):
+        return not_modified(headers)
+    return _json(body, headers=headers)
+
+
+@router.delete("/", response_model=ArticleBulkDeleteResponse)
+async def delete_articles_endpoint(
+    author: Optional[str] = Query(default=None),
+    tag: List[str] = Query(default=[], description="Etiqueta a filtrar; puede repetirse."),
+    tag_mode: str = Query(default="all", pattern="^(any|all)$"),
+    service: AnyArticleService = Depends(_service_dependency),
+) -> ArticleBulkDeleteResponse:
+    if not author and not tag:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Se requiere al menos un filtro (`author` o `tag`) para borrar en bloque",
+        )
+    deleted = await _call(service.delete_many, author=author, tags=tag, tag_mode=tag_mode)
+    return ArticleBulkDeleteResponse(deleted=len(deleted), ids=deleted)
 
 
 @router.put("/{article_id}", response_model=ArticleResponse)
-def update_article_endpoint(
+async def update_article_endpoint(
     article_id: str,
     payload: ArticleUpdate,
-    service: ArticleService = Depends(get_article_service),
-) -> ArticleResponse:
+    service: AnyArticleService = Depends(_service_dependency),
+) -> Response:
     data = ArticleUpdateData(
         title=payload.title,
         body=payload.body,
@@ -103,21 +458,21 @@ def update_article_endpoint(
         published_at=payload.published_at,
     )
     try:
-        dto = service.update(article_id, data)
+        dto = await _call(service.update, article_id, data)
     except ArticleNotFoundError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
     except ArticleAlreadyExistsError as exc:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
-    return _to_response(dto)
+    return _json(render_article(dto))
 
 
 @router.delete("/{article_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_article_endpoint(
+async def delete_article_endpoint(
     article_id: str,
-    service: ArticleService = Depends(get_article_service),
+    service: AnyArticleService = Depends(_service_dependency),
 ) -> Response:
     try:
-        service.delete(article_id)
+        await _call(service.delete, article_id)
     except ArticleNotFoundError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
     return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -2,16 +2,27 @@
 
 from __future__ import annotations
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Callable, Generator
+from contextlib import AbstractAsyncContextManager, AbstractContextManager
+from functools import partial
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import APIKeyHeader
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.cache import ArticleCache, get_redis_client
+from app.cache import (
+    ArticleCache,
+    get_access_counter,
+    get_async_redis_client,
+    get_cache_codec,
+    get_local_cache,
+    get_redis_client,
+)
 from app.config import settings
-from app.database import get_db
-from app.services.article_service import ArticleService
+from app.database import AsyncSessionLocal, SessionLocal, get_async_db, get_db
+from app.replicas import current_routing
+from app.services.article_service import ArticleService, AsyncArticleService
 
 API_KEY_HEADER = "x-api-key"
 _api_key_header = APIKeyHeader(name=API_KEY_HEADER, auto_error=False)
@@ -23,11 +34,48 @@ def get_db_session() -> Generator[Session, None, None]:
     yield from get_db()
 
 
+async def get_async_db_session() -> AsyncGenerator[AsyncSession, None]:
+    """Inyecta una sesión asíncrona por petición HTTP (``ASYNC_MODE``)."""
+
+    async for session in get_async_db():
+        yield session
+
+
+def get_export_sessions() -> Callable[[], AbstractContextManager[Session]]:
+    """Fábrica de sesiones para respuestas en streaming.
+
+    La sesión por petición se cierra antes de que empiece el streaming, así que
+    el generador abre la suya con esta fábrica (con el mismo enrutamiento a
+    réplicas que la petición).
+    """
+
+    return partial(SessionLocal, routing=current_routing())
+
+
+def get_async_export_sessions() -> Callable[[], AbstractAsyncContextManager[AsyncSession]]:
+    """Equivalente asíncrono de :func:`get_export_sessions` (``ASYNC_MODE``)."""
+
+    return partial(AsyncSessionLocal, routing=current_routing())
+
+
 def get_article_cache() -> ArticleCache:
     """Devuelve la instancia de caché configurada."""
 
     client = get_redis_client()
-    return ArticleCache(client=client)
+    return ArticleCache(
+        client=client, local=get_local_cache(), codec=get_cache_codec(), access=get_access_counter()
+    )
+
+
+def get_async_article_cache() -> ArticleCache:
+    """Devuelve la caché respaldada por ``redis.asyncio``."""
+
+    return ArticleCache(
+        client=get_async_redis_client(),
+        local=get_local_cache(),
+        codec=get_cache_codec(),
+        access=get_access_counter(),
+    )
 
 
 def get_article_service(
@@ -38,6 +86,14 @@ def get_article_service(
     return ArticleService(session=db, cache=cache)
 
 
+def get_async_article_service(
+    db: AsyncSession = Depends(get_async_db_session),
+    cache: ArticleCache = Depends(get_async_article_cache),
+) -> AsyncArticleService:
+    """Construye el servicio asíncrono sobre ``AsyncSession`` y ``redis.asyncio``."""
+    return AsyncArticleService(session=db, cache=cache)
+
+
 def enforce_api_key(api_key: str | None = Depends(_api_key_header)) -> None:
     """Valida el API Key recibido en `x-api-key`."""
 
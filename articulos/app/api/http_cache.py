@@ -0,0 +1,84 @@
+"""Peticiones condicionales (ETag / Last-Modified / 304) y ``Cache-Control`` por ruta."""
+
+from __future__ import annotations
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Iterable, Optional
+
+from fastapi import Request, Response, status
+
+from app.config import settings
+
+
+def article_etag(article_id: str, updated_at: datetime, fields: Optional[Iterable[str]] = None) -> str:
+    """ETag fuerte de un artículo: ``id`` + ``updated_at`` (+ la proyección pedida)."""
+    seed = f"{article_id}:{updated_at.isoformat()}"
+    if fields is not None:
+        seed += ":" + ",".join(sorted(fields))
+    return f'"{hashlib.blake2b(seed.encode("utf-8"), digest_size=16).hexdigest()}"'
+
+
+def body_etag(body: bytes) -> str:
+    """ETag fuerte a partir del contenido exacto (páginas de listados)."""
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def has_conditions(request: Request) -> bool:
+    return "if-none-match" in request.headers or "if-modified-since" in request.headers
+
+
+def _if_modified_since(request: Request) -> Optional[datetime]:
+    value = request.headers.get("if-modified-since")
+    if not value:
+        return None
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _opaque_tag(etag: str) -> str:
+    """Quita el prefijo ``W/``: ``If-None-Match`` usa comparación débil (RFC 9110 §13.1.2)."""
+    etag = etag.strip()
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def is_not_modified(
+    request: Request, etag: Optional[str], last_modified: Optional[datetime] = None
+) -> bool:
+    """Evalúa ``If-None-Match`` y, sólo si no viene, ``If-Modified-Since``."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if etag is None:
+            return False
+        # Proxies y compresores (p. ej. gzip de nginx) debilitan el ETag a ``W/"..."``.
+        candidates = {_opaque_tag(candidate) for candidate in if_none_match.split(",")}
+        return "*" in candidates or _opaque_tag(etag) in candidates
+    since = _if_modified_since(request)
+    if since is None or last_modified is None:
+        return False
+    # ``Last-Modified`` tiene resolución de segundos.
+    return last_modified.replace(microsecond=0) <= since
+
+
+def validator_headers(
+    route: str, etag: Optional[str] = None, last_modified: Optional[datetime] = None
+) -> Dict[str, str]:
+    """``ETag``, ``Last-Modified`` y el ``Cache-Control`` configurado para ``route``."""
+    headers: Dict[str, str] = {}
+    if etag is not None:
+        headers["ETag"] = etag
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(last_modified.astimezone(timezone.utc), usegmt=True)
+    cache_control = settings.http_cache_control.get(route)
+    if cache_control:
+        headers["Cache-Control"] = cache_control
+    return headers
+
+
+def not_modified(headers: Dict[str, str]) -> Response:
+    """Respuesta 304 sin cuerpo con los validadores de la representación vigente."""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
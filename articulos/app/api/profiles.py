@@ -0,0 +1,47 @@
+"""Consulta de los perfiles capturados por :class:`~app.profiling.ProfilingMiddleware`."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import PlainTextResponse
+
+from app.api.deps import enforce_api_key
+from app.profiling import StoredProfile, profile_store
+
+router = APIRouter(prefix="/debug/profiles", tags=["debug"], dependencies=[Depends(enforce_api_key)])
+
+_SORT_KEYS = ("cumulative", "tottime", "calls")
+
+
+def _get_profile(profile_id: str) -> StoredProfile:
+    profile = profile_store.get(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Perfil no encontrado")
+    return profile
+
+
+@router.get("")
+async def list_profiles_endpoint() -> List[Dict[str, Any]]:
+    """Perfiles guardados en este worker, del más reciente al más antiguo."""
+    return profile_store.list()
+
+
+@router.get("/{profile_id}")
+async def get_profile_endpoint(
+    profile_id: str,
+    format: str = Query(default="text", pattern="^(text|pstats)$"),
+    sort: str = Query(default="cumulative", pattern=f"^({'|'.join(_SORT_KEYS)})$"),
+    limit: int = Query(default=60, ge=1, le=1000),
+) -> Response:
+    """Perfil en texto (``pstats``) o en binario ``.prof`` para ``snakeviz``/``flameprof``."""
+    profile = _get_profile(profile_id)
+    if format == "pstats":
+        return Response(
+            content=profile.stats,
+            media_type="application/octet-stream",
+            headers={"Content-Disposition": f'attachment; filename="{profile.id}.prof"'},
+        )
+    header = f"{profile.method} {profile.path} -> {profile.status} ({profile.server_timing})\n\n"
+    return PlainTextResponse(header + profile.as_text(sort=sort, limit=limit))
@@ -2,47 +2,923 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
-from typing import Any, Dict, Optional
+import logging
+import math
+import random
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
 
 import redis
+import redis.asyncio as aioredis
 
+try:  # Codecs opcionales: se habilitan si el paquete está instalado.
+    import orjson
+except ImportError:  # pragma: no cover - depende del entorno
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - depende del entorno
+    msgpack = None
+
+from app.concurrency import AwaitingProxy, sleep
 from app.config import settings
+from app.metrics import timed_cache
 
 DEFAULT_TTL_SECONDS = 120
+GENERATION_PREFIX = "articles:gen"
+INVALIDATION_CHANNEL = "articles:l1:invalidate"
+# Ranking compartido de lecturas por artículo (ZSET) y lock del refresco de claves calientes.
+HOT_KEYS_KEY = "articles:hot"
+REFRESH_LOCK_KEY = "articles:refresh:lock"
+# Claves por ``DEL`` al desalojar artículos en bloque (``invalidate_many``).
+_EVICT_CHUNK_KEYS = 1000
+
+logger = logging.getLogger(__name__)
+
+# Identifica a este proceso en los mensajes de invalidación (ignora los propios).
+_PROCESS_ID = uuid.uuid4().hex
+
+
+def should_refresh_early(remaining_seconds: float, recompute_seconds: float, beta: float = 1.0) -> bool:
+    """Decide con XFetch si una clave debe recalcularse antes de expirar.
+
+    La probabilidad crece a medida que se acerca la expiración y con el costo de
+    recalcular (``recompute_seconds``); así una clave popular se renueva antes de
+    vencer y las peticiones no fallan todas a la vez.
+    """
+    # ``1 - random()`` está en (0, 1]: evita log(0).
+    gap = -recompute_seconds * beta * math.log(1.0 - random.random())
+    return gap >= remaining_seconds
+
+
+# Libera el lock sólo si sigue perteneciendo a quien lo tomó.
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+def filter_scopes(author: Optional[str], tags: Sequence[str]) -> List[str]:
+    """Devuelve los ámbitos de invalidación de los que depende un filtro.
+
+    Todo artículo que cumpla el filtro tiene ese autor (si se filtra por autor) o
+    alguna de esas etiquetas, así que basta con observar esas generaciones: una
+    escritura del autor X no invalida los listados de otros autores.
+    """
+    if author:
+        return [f"author:{author}"]
+    if tags:
+        return [f"tag:{tag}" for tag in sorted(set(tags))]
+    return ["all"]
+
+
+class JsonCodec:
+    """Codec por defecto (``json`` de la librería estándar)."""
+
+    name = "json"
+
+    @staticmethod
+    def dumps(value: Any) -> bytes:
+        return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    @staticmethod
+    def loads(raw: bytes) -> Any:
+        return json.loads(raw)
+
+
+class OrjsonCodec:
+    """JSON con ``orjson``; mismo formato que :class:`JsonCodec`, varias veces más rápido."""
+
+    name = "orjson"
+
+    @staticmethod
+    def dumps(value: Any) -> bytes:
+        return orjson.dumps(value)
+
+    @staticmethod
+    def loads(raw: bytes) -> Any:
+        return orjson.loads(raw)
+
+
+class MsgpackCodec:
+    """Formato binario ``msgpack``: entradas más pequeñas que JSON."""
+
+    name = "msgpack"
+
+    @staticmethod
+    def dumps(value: Any) -> bytes:
+        return msgpack.packb(value, use_bin_type=True)
+
+    @staticmethod
+    def loads(raw: bytes) -> Any:
+        return msgpack.unpackb(raw, raw=False)
+
+
+Codec = Union[JsonCodec, OrjsonCodec, MsgpackCodec]
+
+_CODECS: Dict[str, Tuple[type, Any]] = {
+    JsonCodec.name: (JsonCodec, json),
+    OrjsonCodec.name: (OrjsonCodec, orjson),
+    MsgpackCodec.name: (MsgpackCodec, msgpack),
+}
+
+
+def get_codec(name: Optional[str] = None) -> Codec:
+    """Devuelve el codec ``name`` (por defecto ``CACHE_CODEC``)."""
+    name = name or settings.cache_codec
+    if name not in _CODECS:
+        raise ValueError(f"Codec de caché desconocido: {name!r}")
+    codec_class, module = _CODECS[name]
+    if module is None:
+        raise RuntimeError(f"El codec {name!r} requiere instalar el paquete {name!r}")
+    return codec_class()
+
+
+# Codec del proceso: se resuelve una vez (en el lifespan) y se comparte entre peticiones.
+_cache_codec: Optional[Codec] = None
+
+
+def init_cache_codec() -> Codec:
+    """Resuelve y valida ``CACHE_CODEC``; un codec no instalado falla al arrancar."""
+    global _cache_codec
+    if _cache_codec is None:
+        _cache_codec = get_codec()
+    return _cache_codec
+
+
+def get_cache_codec() -> Codec:
+    """Codec compartido del proceso (lo resuelve si aún no se hizo, p. ej. en scripts)."""
+    return _cache_codec or init_cache_codec()
+
+
+@dataclass
+class TierStats:
+    """Contadores de un nivel de caché (expuestos en ``/health/cache``)."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+CACHE_STATS: Dict[str, TierStats] = {"l1": TierStats(), "redis": TierStats()}
+
+
+@dataclass(slots=True)
+class _LocalEntry:
+    payload: Dict[str, Any]
+    raw: bytes
+    expires_at: float
+    # Momento en que vence la copia en Redis; alimenta XFetch en los aciertos L1.
+    source_deadline: float
+
+
+class LocalCache:
+    """Caché L1 en memoria del proceso: LRU con TTL y tamaño acotado en bytes.
+
+    Guarda el payload decodificado (de sólo lectura) junto a los bytes crudos,
+    cuyo tamaño se usa para respetar ``max_bytes``.
+    """
+
+    def __init__(self, *, max_bytes: int, ttl_seconds: float, stats: Optional[TierStats] = None) -> None:
+        self._max_bytes = max_bytes
+        self._ttl = ttl_seconds
+        self._stats = stats if stats is not None else TierStats()
+        self._entries: "OrderedDict[str, _LocalEntry]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size
+
+    def get(self, key: str) -> Optional[Tuple[Dict[str, Any], bytes, float]]:
+        """Devuelve ``(payload, raw, segundos hasta que vence en Redis)`` o ``None``."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.expires_at <= now:
+                if entry is not None:
+                    self._drop(key)
+                self._stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return entry.payload, entry.raw, entry.source_deadline - now
+
+    def set(self, key: str, raw: bytes, payload: Dict[str, Any], *, max_age: float = math.inf) -> None:
+        size = len(raw)
+        if size > self._max_bytes:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = _LocalEntry(
+                payload=payload,
+                raw=raw,
+                expires_at=now + min(self._ttl, max_age),
+                source_deadline=now + max_age,
+            )
+            self._size += size
+            while self._size > self._max_bytes:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self._stats.evictions += 1
+
+    def delete(self, keys: Iterable[str]) -> None:
+        with self._lock:
+            for key in keys:
+                if key in self._entries:
+                    self._drop(key)
+                    self._stats.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._size -= len(entry.raw)
+
+
+class AccessCounter:
+    """Lecturas por artículo en este worker, para detectar las claves calientes.
+
+    Registrar una lectura es sólo un incremento en memoria (con muestreo
+    opcional); el refresco periódico (:mod:`app.warmup`) vuelca los conteos al
+    ranking compartido ``articles:hot`` con :meth:`ArticleCache.record_accesses`.
+    """
+
+    def __init__(self, sample_rate: float = 1.0) -> None:
+        self._counts: Counter[str] = Counter()
+        self._sample_rate = sample_rate
+        self._lock = threading.Lock()
+
+    def record(self, article_id: str) -> None:
+        if self._sample_rate < 1.0 and random.random() >= self._sample_rate:
+            return
+        with self._lock:
+            self._counts[article_id] += 1
+
+    def drain(self) -> Dict[str, int]:
+        """Devuelve los conteos acumulados y empieza de cero."""
+        with self._lock:
+            counts, self._counts = self._counts, Counter()
+        return dict(counts)
+
+
+def _found(result: Any) -> bool:
+    return result is not None
+
+
+def _first_found(result: Tuple[Any, ...]) -> bool:
+    return result[0] is not None
 
 
 class ArticleCache:
-    """Provee operaciones `get` / `set` / `invalidate` para artículos."""
+    """Provee operaciones `get` / `set` / `invalidate` para artículos.
+
+    Los valores se serializan con el codec configurado (``CACHE_CODEC``). Junto a
+    cada artículo puede guardarse además el cuerpo JSON ya renderizado de su
+    respuesta (``article:{id}:json``) para devolverlo tal cual en los aciertos.
+
+    Si recibe una :class:`LocalCache` la usa como nivel L1 delante de Redis: los
+    artículos se sirven desde memoria durante unos segundos y cada escritura o
+    invalidación se publica por pub/sub para que los demás workers los descarten.
+
+    Además cachea resultados de listados (IDs de la página + total) y conteos por
+    combinación de filtros. Esas entradas llevan un *sello* con las generaciones
+    de los autores/etiquetas de los que dependen; las escrituras incrementan esas
+    generaciones (:meth:`bump_generations`) y así invalidan sólo lo afectado.
 
-    def __init__(self, client: redis.Redis, ttl_seconds: int = DEFAULT_TTL_SECONDS) -> None:
+    Con un :class:`AccessCounter` cada lectura de un artículo se cuenta para el
+    ranking de claves calientes que precarga y refresca :mod:`app.warmup`.
+    """
+
+    def __init__(
+        self,
+        client: redis.Redis,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        *,
+        count_ttl_seconds: Optional[int] = None,
+        list_ttl_seconds: Optional[int] = None,
+        local: Optional[LocalCache] = None,
+        codec: Optional[Codec] = None,
+        access: Optional[AccessCounter] = None,
+    ) -> None:
         # El cliente Redis se inyecta desde las dependencias (permite usar stubs en tests).
         self._client = client
+        self._local = local
+        self._access = access
+        self._codec = codec or get_cache_codec()
+        self._stats = CACHE_STATS["redis"]
         self._ttl = ttl_seconds
+        self._count_ttl = count_ttl_seconds or settings.count_cache_ttl_seconds
+        self._list_ttl = list_ttl_seconds or settings.list_cache_ttl_seconds
 
     @staticmethod
     def _key(article_id: str) -> str:
         return f"article:{article_id}"
 
-    def get(self, article_id: str) -> Optional[Dict[str, Any]]:
-        """Lee del cache; si no existe devuelve ``None``."""
-        raw = self._client.get(self._key(article_id))
+    @staticmethod
+    def _rendered_key(article_id: str) -> str:
+        return f"article:{article_id}:json"
+
+    @staticmethod
+    def _projection_key(article_id: str) -> str:
+        # Hash con una entrada por proyección (``fields``); se borra entero al escribir.
+        return f"article:{article_id}:fields"
+
+    @staticmethod
+    def _meta_key(article_id: str) -> str:
+        # ``updated_at`` del artículo: basta para responder 304 sin leer el cuerpo.
+        return f"article:{article_id}:meta"
+
+    def _article_keys(self, article_id: str) -> List[str]:
+        return [
+            self._key(article_id),
+            self._rendered_key(article_id),
+            self._projection_key(article_id),
+            self._meta_key(article_id),
+        ]
+
+    @staticmethod
+    def projection_signature(fields: Iterable[str]) -> str:
+        return ",".join(sorted(set(fields)))
+
+    def _decode(self, raw: Optional[bytes]) -> Optional[Dict[str, Any]]:
         if raw is None:
             return None
         try:
-            return json.loads(raw.decode("utf-8"))
-        except (json.JSONDecodeError, AttributeError, UnicodeDecodeError):
+            value = self._codec.loads(raw)
+        except (ValueError, TypeError):
+            # Incluye entradas escritas con otro codec: se tratan como fallo de caché.
             return None
+        return value if isinstance(value, dict) else None
+
+    def _record(self, payload: Optional[Any]) -> None:
+        if payload is None:
+            self._stats.misses += 1
+        else:
+            self._stats.hits += 1
 
-    def set(self, article_id: str, payload: Dict[str, Any]) -> None:
-        """Serializa el payload a JSON y lo almacena con expiración."""
-        self._client.setex(self._key(article_id), self._ttl, json.dumps(payload))
+    def _remember(self, key: str, raw: bytes, payload: Dict[str, Any], max_age: float = math.inf) -> None:
+        if self._local is not None:
+            self._local.set(key, raw, payload, max_age=max_age)
 
+    def _broadcast(self, pipe: Any, keys: List[str]) -> None:
+        """Encola en ``pipe`` el aviso para que los otros workers descarten su L1."""
+        if self._local is None:
+            return
+        self._local.delete(keys)
+        pipe.publish(INVALIDATION_CHANNEL, json.dumps({"o": _PROCESS_ID, "k": keys}))
+
+    @timed_cache("get", hit=_found)
+    def get(self, article_id: str) -> Optional[Dict[str, Any]]:
+        """Lee del cache; si no existe devuelve ``None``."""
+        key = self._key(article_id)
+        if self._access is not None:
+            self._access.record(article_id)
+        if self._local is not None:
+            local = self._local.get(key)
+            if local is not None:
+                return local[0]
+        raw = self._client.get(key)
+        payload = self._decode(raw)
+        self._record(payload)
+        if payload is not None:
+            self._remember(key, raw, payload)
+        return payload
+
+    def set(self, article_id: str, payload: Dict[str, Any], *, rendered: Optional[bytes] = None) -> None:
+        """Serializa el payload y lo almacena con expiración.
+
+        ``rendered`` es el cuerpo JSON de la respuesta; se guarda aparte para
+        servir los aciertos sin decodificar (ver :meth:`get_rendered`).
+        """
+        self.set_many({article_id: payload}, rendered={article_id: rendered} if rendered else None)
+
+    @timed_cache("invalidate")
     def invalidate(self, article_id: str) -> None:
         """Elimina la clave del cache (se usa tras borrar o actualizar)."""
-        self._client.delete(self._key(article_id))
+        keys = self._article_keys(article_id)
+        self._stats.invalidations += 1
+        if self._local is None:
+            self._client.delete(*keys)
+            return
+        pipe = self._client.pipeline(transaction=False)
+        pipe.delete(*keys)
+        self._broadcast(pipe, keys)
+        pipe.execute()
+
+    @timed_cache("invalidate_many")
+    def invalidate_many(self, article_ids: Sequence[str]) -> None:
+        """Elimina varios artículos (y sus variantes) con un único pipeline.
+
+        Las claves se reparten en varios ``DEL`` de :data:`_EVICT_CHUNK_KEYS` para
+        no bloquear Redis con un solo comando enorme en borrados masivos.
+        """
+        if not article_ids:
+            return
+        keys = [key for article_id in article_ids for key in self._article_keys(article_id)]
+        self._stats.invalidations += len(article_ids)
+        pipe = self._client.pipeline(transaction=False)
+        for start in range(0, len(keys), _EVICT_CHUNK_KEYS):
+            chunk = keys[start : start + _EVICT_CHUNK_KEYS]
+            pipe.delete(*chunk)
+            self._broadcast(pipe, chunk)
+        pipe.execute()
+
+    @timed_cache("get_entry", hit=_first_found)
+    def get_entry(self, article_id: str) -> Tuple[Optional[Dict[str, Any]], float]:
+        """Lee un artículo junto a su vida restante en segundos (``GET`` + ``PTTL``)."""
+        key = self._key(article_id)
+        if self._access is not None:
+            self._access.record(article_id)
+        if self._local is not None:
+            local = self._local.get(key)
+            if local is not None:
+                return local[0], local[2]
+        pipe = self._client.pipeline(transaction=False)
+        pipe.get(key)
+        pipe.pttl(key)
+        raw, ttl_ms = pipe.execute()
+        payload = self._decode(raw)
+        self._record(payload)
+        if payload is None:
+            return None, 0.0
+        remaining = math.inf if ttl_ms is None or ttl_ms < 0 else ttl_ms / 1000
+        self._remember(key, raw, payload, remaining)
+        return payload, remaining
+
+    @timed_cache("get_rendered", hit=_first_found)
+    def get_rendered(self, article_id: str) -> Tuple[Optional[bytes], float, Optional[str]]:
+        """Cuerpo JSON ya renderizado, su vida restante y ``updated_at``, sin decodificar nada."""
+        key, meta_key = self._rendered_key(article_id), self._meta_key(article_id)
+        if self._access is not None:
+            self._access.record(article_id)
+        if self._local is not None:
+            local, meta = self._local.get(key), self._local.get(meta_key)
+            if local is not None and meta is not None:
+                return local[1], local[2], meta[1].decode("ascii")
+        pipe = self._client.pipeline(transaction=False)
+        pipe.get(key)
+        pipe.pttl(key)
+        pipe.get(meta_key)
+        raw, ttl_ms, meta_raw = pipe.execute()
+        self._record(raw)
+        if raw is None:
+            return None, 0.0, None
+        remaining = math.inf if ttl_ms is None or ttl_ms < 0 else ttl_ms / 1000
+        self._remember(key, raw, {}, remaining)
+        if meta_raw is None:
+            return raw, remaining, None
+        self._remember(meta_key, meta_raw, {}, remaining)
+        return raw, remaining, meta_raw.decode("ascii")
+
+    @timed_cache("get_last_modified", hit=_found)
+    def get_last_modified(self, article_id: str) -> Optional[str]:
+        """``updated_at`` (ISO 8601) cacheado del artículo, para validar peticiones condicionales."""
+        key = self._meta_key(article_id)
+        if self._local is not None:
+            local = self._local.get(key)
+            if local is not None:
+                return local[1].decode("ascii")
+        raw = self._client.get(key)
+        return raw.decode("ascii") if isinstance(raw, bytes) else raw
+
+    @timed_cache("get_projection", hit=_found)
+    def get_projection(self, article_id: str, fields: Iterable[str]) -> Optional[Dict[str, Any]]:
+        """Lee la proyección ``fields`` de un artículo (cacheada aparte del artículo completo)."""
+        raw = self._client.hget(self._projection_key(article_id), self.projection_signature(fields))
+        payload = self._decode(raw)
+        self._record(payload)
+        return payload
+
+    @timed_cache("set_projection")
+    def set_projection(self, article_id: str, fields: Iterable[str], payload: Dict[str, Any]) -> None:
+        """Guarda una proyección; comparte la vigencia de las claves de artículo."""
+        key = self._projection_key(article_id)
+        pipe = self._client.pipeline(transaction=False)
+        pipe.hset(key, self.projection_signature(fields), self._codec.dumps(payload))
+        pipe.expire(key, self._ttl)
+        pipe.execute()
+
+    @staticmethod
+    def _lock_key(article_id: str) -> str:
+        return f"article:lock:{article_id}"
+
+    @timed_cache("acquire_lock")
+    def acquire_lock(self, article_id: str, *, ttl_ms: Optional[int] = None) -> Optional[str]:
+        """Intenta tomar el lock de recálculo (``SET NX PX``); devuelve el token o ``None``."""
+        token = uuid.uuid4().hex
+        acquired = self._client.set(
+            self._lock_key(article_id), token, nx=True, px=ttl_ms or settings.cache_lock_ttl_ms
+        )
+        return token if acquired else None
+
+    def release_lock(self, article_id: str, token: str) -> None:
+        """Libera el lock si todavía es nuestro (puede haber expirado y pasado a otro)."""
+        self._client.eval(_RELEASE_LOCK_SCRIPT, 1, self._lock_key(article_id), token)
+
+    def wait_for(self, article_id: str) -> Optional[Dict[str, Any]]:
+        """Espera brevemente a que quien tiene el lock publique el artículo en caché."""
+        interval = settings.cache_lock_poll_interval_ms / 1000
+        for _ in range(settings.cache_lock_wait_attempts):
+            sleep(interval)
+            payload = self.get(article_id)
+            if payload is not None:
+                return payload
+        return None
+
+    @timed_cache("get_many")
+    def get_many(self, article_ids: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+        """Lee varios artículos con un único ``MGET``; omite los que no están."""
+        found: Dict[str, Dict[str, Any]] = {}
+        pending: List[str] = []
+        for article_id in article_ids:
+            local = self._local.get(self._key(article_id)) if self._local is not None else None
+            if local is not None:
+                found[article_id] = local[0]
+            else:
+                pending.append(article_id)
+        if not pending:
+            return found
+        keys = [self._key(article_id) for article_id in pending]
+        raws = self._client.mget(keys)
+        for article_id, key, raw in zip(pending, keys, raws):
+            payload = self._decode(raw)
+            self._record(payload)
+            if payload is not None:
+                found[article_id] = payload
+                self._remember(key, raw, payload)
+        return found
+
+    @timed_cache("set_many")
+    def set_many(
+        self,
+        payloads: Mapping[str, Dict[str, Any]],
+        *,
+        rendered: Optional[Mapping[str, bytes]] = None,
+    ) -> None:
+        """Guarda varios artículos con ``SETEX`` en un pipeline (un round trip)."""
+        if not payloads:
+            return
+        pipe = self._client.pipeline(transaction=False)
+        keys = []
+        for article_id, payload in payloads.items():
+            key = self._key(article_id)
+            pipe.setex(key, self._ttl, self._codec.dumps(payload))
+            # Las proyecciones guardadas podían venir de la versión anterior.
+            pipe.delete(self._projection_key(article_id))
+            keys.append(key)
+            if payload.get("updated_at"):
+                pipe.setex(self._meta_key(article_id), self._ttl, payload["updated_at"])
+                keys.append(self._meta_key(article_id))
+            body = rendered.get(article_id) if rendered else None
+            if body is not None:
+                pipe.setex(self._rendered_key(article_id), self._ttl, body)
+                keys.append(self._rendered_key(article_id))
+        self._broadcast(pipe, keys)
+        pipe.execute()
+
+    @timed_cache("expiring")
+    def expiring(self, article_ids: Sequence[str], within_seconds: float) -> List[str]:
+        """IDs cuyo ``article:{id}`` falta o vence en menos de ``within_seconds``.
+
+        Un ``PTTL`` por artículo, todos en un pipeline.
+        """
+        if not article_ids:
+            return []
+        pipe = self._client.pipeline(transaction=False)
+        for article_id in article_ids:
+            pipe.pttl(self._key(article_id))
+        ttls = pipe.execute()
+        # ``-2``: la clave no existe; ``-1``: no expira.
+        return [
+            article_id
+            for article_id, ttl_ms in zip(article_ids, ttls)
+            if ttl_ms == -2 or 0 <= ttl_ms < within_seconds * 1000
+        ]
+
+    @timed_cache("record_accesses")
+    def record_accesses(self, counts: Mapping[str, int]) -> None:
+        """Suma lecturas al ranking ``articles:hot`` con un pipeline de ``ZINCRBY``."""
+        if not counts:
+            return
+        pipe = self._client.pipeline(transaction=False)
+        for article_id, count in counts.items():
+            pipe.zincrby(HOT_KEYS_KEY, count, article_id)
+        pipe.execute()
+
+    def decay_hot(self, factor: float, max_keys: int) -> None:
+        """Atenúa el ranking (multiplica cada puntuación por ``factor``) y lo recorta a ``max_keys``.
+
+        Así pesan más las lecturas recientes y el ZSET no crece sin límite.
+        """
+        pipe = self._client.pipeline(transaction=False)
+        pipe.zunionstore(HOT_KEYS_KEY, {HOT_KEYS_KEY: factor})
+        pipe.zremrangebyrank(HOT_KEYS_KEY, 0, -max_keys - 1)
+        pipe.execute()
+
+    @timed_cache("hot_articles")
+    def hot_articles(self, limit: int) -> List[str]:
+        """Los ``limit`` artículos más leídos según ``articles:hot``."""
+        members = self._client.zrevrange(HOT_KEYS_KEY, 0, limit - 1)
+        return [member.decode("utf-8") if isinstance(member, bytes) else member for member in members]
+
+    def forget_hot(self, article_ids: Sequence[str]) -> None:
+        """Quita del ranking artículos que ya no existen."""
+        if article_ids:
+            self._client.zrem(HOT_KEYS_KEY, *article_ids)
+
+    def claim_refresh(self, ttl_ms: int) -> bool:
+        """Reserva el siguiente ciclo de refresco para este worker (``SET NX PX``).
+
+        El lock no se libera: vence solo, así hay a lo sumo un refresco por intervalo
+        entre todos los workers.
+        """
+        return bool(self._client.set(REFRESH_LOCK_KEY, _PROCESS_ID, nx=True, px=ttl_ms))
+
+    @staticmethod
+    def _filter_key(prefix: str, filters: Dict[str, Any]) -> str:
+        digest = hashlib.sha1(
+            json.dumps(filters, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+        return f"articles:{prefix}:{digest}"
+
+    def _get_stamped(self, key: str, scopes: List[str]) -> Tuple[Optional[Any], str]:
+        """Lee ``key`` y las generaciones de ``scopes`` en un solo round trip.
+
+        Devuelve ``(valor, sello)``; el valor es ``None`` si falta o si se guardó
+        con un sello distinto al vigente (hubo escrituras relacionadas).
+        """
+        pipe = self._client.pipeline(transaction=False)
+        pipe.mget([f"{GENERATION_PREFIX}:{scope}" for scope in scopes])
+        pipe.get(key)
+        generations, raw = pipe.execute()
+        stamp = ":".join((value or b"0").decode("ascii") for value in generations)
+        cached = self._decode(raw)
+        if cached is None or cached.get("s") != stamp:
+            return None, stamp
+        return cached["v"], stamp
+
+    def _set_stamped(self, key: str, value: Any, stamp: str, ttl: int) -> None:
+        self._client.setex(key, ttl, self._codec.dumps({"v": value, "s": stamp}))
+
+    @staticmethod
+    def _count_filters(author: Optional[str], tags: Sequence[str], tag_mode: str) -> Dict[str, Any]:
+        # Con una sola etiqueta "any" y "all" son equivalentes y comparten clave.
+        mode = tag_mode if len(set(tags)) > 1 else "all"
+        return {"author": author, "tags": sorted(set(tags)), "mode": mode}
+
+    @timed_cache("get_count", hit=_first_found)
+    def get_count(
+        self,
+        *,
+        author: Optional[str],
+        tags: Sequence[str],
+        tag_mode: str = "all",
+    ) -> Tuple[Optional[int], str]:
+        """Devuelve ``(total, sello)``; el total es ``None`` si falta o quedó obsoleto.
+
+        El sello resume las generaciones vigentes y debe pasarse a :meth:`set_count`,
+        así un conteo calculado mientras ocurría una escritura nunca se da por válido.
+        """
+        key = self._filter_key("count", self._count_filters(author, tags, tag_mode))
+        total, stamp = self._get_stamped(key, filter_scopes(author, tags))
+        return (int(total) if total is not None else None), stamp
+
+    @timed_cache("set_count")
+    def set_count(
+        self,
+        *,
+        author: Optional[str],
+        tags: Sequence[str],
+        tag_mode: str = "all",
+        total: int,
+        stamp: str,
+    ) -> None:
+        """Guarda el conteo exacto de un filtro junto al sello leído antes de calcularlo."""
+        key = self._filter_key("count", self._count_filters(author, tags, tag_mode))
+        self._set_stamped(key, total, stamp, self._count_ttl)
+
+    @timed_cache("get_listing", hit=_first_found)
+    def get_listing(
+        self,
+        query: Dict[str, Any],
+        *,
+        author: Optional[str],
+        tags: Sequence[str],
+    ) -> Tuple[Optional[Dict[str, Any]], str]:
+        """Devuelve ``(página, sello)`` de un listado cacheado (``ids``, ``total``, ``next``)."""
+        return self._get_stamped(self._filter_key("list", query), filter_scopes(author, tags))
+
+    @timed_cache("set_listing")
+    def set_listing(
+        self,
+        query: Dict[str, Any],
+        page: Dict[str, Any],
+        *,
+        stamp: str,
+    ) -> None:
+        """Guarda los IDs de una página con el sello leído antes de consultarla."""
+        self._set_stamped(self._filter_key("list", query), page, stamp, self._list_ttl)
+
+    @timed_cache("bump_generations")
+    def bump_generations(self, *, authors: Iterable[str], tags: Iterable[str]) -> None:
+        """Invalida los resultados cacheados que dependen de esos autores/etiquetas."""
+        scopes = {"all"}
+        scopes.update(f"author:{author}" for author in authors if author)
+        scopes.update(f"tag:{tag}" for tag in tags if tag)
+        pipe = self._client.pipeline(transaction=False)
+        for scope in sorted(scopes):
+            pipe.incr(f"{GENERATION_PREFIX}:{scope}")
+        pipe.execute()
+
+
+def cache_stats() -> Dict[str, Dict[str, int]]:
+    """Contadores por nivel (``l1`` y ``redis``) acumulados por este proceso."""
+    return {tier: stats.as_dict() for tier, stats in CACHE_STATS.items()}
+
+
+_local_cache: Optional[LocalCache] = None
+_local_cache_lock = threading.Lock()
+
+
+def get_local_cache() -> Optional[LocalCache]:
+    """Devuelve la caché L1 del proceso, o ``None`` si ``L1_CACHE_ENABLED`` está apagado."""
+    global _local_cache
+    if not settings.l1_cache_enabled:
+        return None
+    if _local_cache is None:
+        with _local_cache_lock:
+            if _local_cache is None:
+                _local_cache = LocalCache(
+                    max_bytes=settings.l1_cache_max_bytes,
+                    ttl_seconds=settings.l1_cache_ttl_seconds,
+                    stats=CACHE_STATS["l1"],
+                )
+    return _local_cache
+
+
+_access_counter: Optional[AccessCounter] = None
+_access_counter_lock = threading.Lock()
+
+
+def get_access_counter() -> Optional[AccessCounter]:
+    """Contador de lecturas del proceso, o ``None`` si ``CACHE_REFRESH_ENABLED`` está apagado."""
+    global _access_counter
+    if not settings.cache_refresh_enabled:
+        return None
+    if _access_counter is None:
+        with _access_counter_lock:
+            if _access_counter is None:
+                _access_counter = AccessCounter(settings.cache_access_sample_rate)
+    return _access_counter
+
+
+class InvalidationListener:
+    """Hilo que escucha el canal de invalidación y descarta claves de la L1.
+
+    Si se pierde la conexión con Redis se vacía la L1 completa: mientras tanto
+    pudieron perderse avisos y no hay forma de saber qué quedó obsoleto.
+    """
+
+    def __init__(self, client: redis.Redis, local: LocalCache) -> None:
+        self._client = client
+        self._local = local
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="l1-invalidation", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        self._stop.set()
+        self._thread.join(timeout)
+
+    def handle(self, data: bytes) -> None:
+        """Aplica un mensaje ``{"o": origen, "k": [claves]}`` recibido por pub/sub."""
+        try:
+            message = json.loads(data)
+        except (TypeError, ValueError):
+            return
+        if message.get("o") == _PROCESS_ID:
+            return
+        self._local.delete(message.get("k", []))
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+            try:
+                pubsub.subscribe(INVALIDATION_CHANNEL)
+                # Lo que se haya escrito antes de suscribirse no llegó como aviso.
+                self._local.clear()
+                while not self._stop.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if message is not None:
+                        self.handle(message["data"])
+            except redis.RedisError:
+                logger.warning("Se perdió la suscripción de invalidación L1; se vacía la caché local")
+                self._local.clear()
+                self._stop.wait(1.0)
+            finally:
+                pubsub.close()
+
+
+_listener: Optional[InvalidationListener] = None
+
+
+def start_invalidation_listener() -> None:
+    """Arranca el hilo de invalidación si la L1 está habilitada."""
+    global _listener
+    local = get_local_cache()
+    if local is None or _listener is not None:
+        return
+    _listener = InvalidationListener(get_redis_client(), local)
+    _listener.start()
+
+
+def stop_invalidation_listener() -> None:
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+# Pools compartidos por todo el proceso; se crean en el lifespan de FastAPI.
+_redis_pool: Optional[redis.ConnectionPool] = None
+_async_redis_pool: Optional[aioredis.ConnectionPool] = None
+
+
+def _pool_options() -> Dict[str, Any]:
+    return {
+        "max_connections": settings.redis_max_connections,
+        "socket_timeout": settings.redis_socket_timeout,
+        "socket_connect_timeout": settings.redis_socket_connect_timeout,
+        "health_check_interval": settings.redis_health_check_interval,
+        "decode_responses": False,
+    }
+
+
+def init_redis_pool() -> redis.ConnectionPool:
+    """Crea (una sola vez) el pool de conexiones Redis del proceso."""
+    global _redis_pool
+    if _redis_pool is None:
+        _redis_pool = redis.ConnectionPool.from_url(settings.redis_url, **_pool_options())
+    return _redis_pool
+
+
+def close_redis_pool() -> None:
+    """Cierra las conexiones del pool compartido (se invoca al apagar la app)."""
+    global _redis_pool
+    if _redis_pool is not None:
+        _redis_pool.disconnect()
+        _redis_pool = None
 
 
 def get_redis_client() -> redis.Redis:
-    """Devuelve un cliente Redis conectado usando la configuración de la app."""
-    return redis.Redis.from_url(settings.redis_url, decode_responses=False)
+    """Devuelve un cliente Redis que reutiliza el pool compartido del proceso."""
+    # Construir el cliente es barato: sólo envuelve el pool, no abre conexiones.
+    return redis.Redis(connection_pool=init_redis_pool())
+
+
+def init_async_redis_pool() -> aioredis.ConnectionPool:
+    """Crea (una sola vez) el pool ``redis.asyncio`` usado en ``ASYNC_MODE``."""
+    global _async_redis_pool
+    if _async_redis_pool is None:
+        _async_redis_pool = aioredis.ConnectionPool.from_url(settings.redis_url, **_pool_options())
+    return _async_redis_pool
+
+
+async def close_async_redis_pool() -> None:
+    """Cierra las conexiones del pool asíncrono."""
+    global _async_redis_pool
+    if _async_redis_pool is not None:
+        await _async_redis_pool.disconnect()
+        _async_redis_pool = None
+
+
+def get_async_redis_client() -> AwaitingProxy:
+    """Cliente ``redis.asyncio`` adaptado para usarse dentro de :class:`ArticleCache`."""
+    return AwaitingProxy(aioredis.Redis(connection_pool=init_async_redis_pool()))
@@ -0,0 +1,57 @@
+"""Utilidades para ejecutar la lógica síncrona sobre drivers asíncronos.
+
+El modo ``ASYNC_MODE`` reutiliza el mismo repositorio y servicio que el modo
+síncrono: el código se ejecuta dentro de ``greenlet_spawn`` (el mecanismo que
+usa ``AsyncSession.run_sync``) y cada operación de E/S se espera en el event
+loop mediante ``await_only``. Así no se duplica la lógica de negocio.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import time
+from typing import Any, Callable, TypeVar
+
+from sqlalchemy.util import await_only, greenlet_spawn
+from sqlalchemy.util.concurrency import in_greenlet
+
+T = TypeVar("T")
+
+
+async def run_in_greenlet(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Ejecuta ``fn`` permitiendo que espere corutinas con :class:`AwaitingProxy`."""
+    return await greenlet_spawn(fn, *args, **kwargs)
+
+
+def sleep(seconds: float) -> None:
+    """Espera sin bloquear el event loop cuando se ejecuta en ``ASYNC_MODE``."""
+    if in_greenlet():
+        await_only(asyncio.sleep(seconds))
+    else:
+        time.sleep(seconds)
+
+
+class AwaitingProxy:
+    """Expone un cliente asíncrono (ej. ``redis.asyncio.Redis``) con interfaz síncrona.
+
+    Sólo puede usarse desde código lanzado con :func:`run_in_greenlet`.
+    """
+
+    def __init__(self, target: Any) -> None:
+        self._target = target
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._target, name)
+        if not callable(attr):
+            return attr
+
+        def call(*args: Any, **kwargs: Any) -> Any:
+            result = attr(*args, **kwargs)
+            return await_only(result) if inspect.isawaitable(result) else result
+
+        return call
+
+    def pipeline(self, *args: Any, **kwargs: Any) -> "AwaitingProxy":
+        # Los comandos del pipeline sólo se encolan; ``execute`` es la única corutina.
+        return AwaitingProxy(self._target.pipeline(*args, **kwargs))
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from functools import lru_cache
+from typing import Dict
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -24,10 +25,81 @@ class Settings(BaseSettings):
     postgres_user: str = Field(default="postgres", env="POSTGRES_USER")
     postgres_password: str = Field(default="postgres", env="POSTGRES_PASSWORD")
     postgres_db: str = Field(default="articles", env="POSTGRES_DB")
+    # Pool de conexiones del motor SQLAlchemy (por worker).
+    db_pool_size: int = Field(default=10, env="DB_POOL_SIZE")
+    db_max_overflow: int = Field(default=20, env="DB_MAX_OVERFLOW")
+    db_pool_timeout: float = Field(default=10.0, env="DB_POOL_TIMEOUT")
+    db_pool_recycle: int = Field(default=1800, env="DB_POOL_RECYCLE")
+    db_pool_pre_ping: bool = Field(default=True, env="DB_POOL_PRE_PING")
+    # ``statement_timeout`` de cada conexión en milisegundos (0 = sin límite).
+    db_statement_timeout_ms: int = Field(default=30000, env="DB_STATEMENT_TIMEOUT_MS")
+    # Detrás de PgBouncer (pool por transacción): sin sentencias preparadas y NullPool.
+    db_pgbouncer_mode: bool = Field(default=False, env="DB_PGBOUNCER_MODE")
 
     # URL que consume el cliente Redis (servicio `redis`).
     redis_url: str = Field(default="redis://redis:6379/0", env="REDIS_URL")
+    # Pool de conexiones Redis compartido por todo el proceso.
+    redis_max_connections: int = Field(default=50, env="REDIS_MAX_CONNECTIONS")
+    redis_socket_timeout: float = Field(default=1.0, env="REDIS_SOCKET_TIMEOUT")
+    redis_socket_connect_timeout: float = Field(default=1.0, env="REDIS_SOCKET_CONNECT_TIMEOUT")
+    redis_health_check_interval: int = Field(default=30, env="REDIS_HEALTH_CHECK_INTERVAL")
+    # Vigencia máxima de los conteos exactos cacheados (las escrituras los invalidan antes).
+    count_cache_ttl_seconds: int = Field(default=300, env="COUNT_CACHE_TTL_SECONDS")
+    # Vigencia máxima de las páginas de listados cacheadas (IDs + total).
+    list_cache_ttl_seconds: int = Field(default=60, env="LIST_CACHE_TTL_SECONDS")
+    # Protección contra estampidas: lock NX por artículo y refresco anticipado (XFetch).
+    cache_lock_ttl_ms: int = Field(default=2000, env="CACHE_LOCK_TTL_MS")
+    cache_lock_wait_attempts: int = Field(default=10, env="CACHE_LOCK_WAIT_ATTEMPTS")
+    cache_lock_poll_interval_ms: int = Field(default=20, env="CACHE_LOCK_POLL_INTERVAL_MS")
+    cache_xfetch_beta: float = Field(default=1.0, env="CACHE_XFETCH_BETA")
+    # Serialización de las entradas (json, orjson o msgpack) y cuerpo JSON pre-renderizado.
+    cache_codec: str = Field(default="json", env="CACHE_CODEC")
+    cache_response_bytes: bool = Field(default=True, env="CACHE_RESPONSE_BYTES")
+    # ``Cache-Control`` por ruta (JSON); ``no-cache`` obliga a revalidar con ETag.
+    http_cache_control: Dict[str, str] = Field(
+        default={"get_article": "no-cache", "list_articles": "no-cache"},
+        env="HTTP_CACHE_CONTROL",
+    )
     database_url: str | None = Field(default=None, env="DATABASE_URL")
+    # Réplicas de lectura (URLs separadas por comas); vacío = todo va al primario.
+    database_replica_urls: str | None = Field(default=None, env="DATABASE_REPLICA_URLS")
+    replica_health_check_interval_seconds: float = Field(default=5.0, env="REPLICA_HEALTH_CHECK_INTERVAL_SECONDS")
+    # Tras escribir, las lecturas del mismo cliente van al primario durante esta ventana.
+    read_your_writes_seconds: float = Field(default=5.0, env="READ_YOUR_WRITES_SECONDS")
+
+    # Carga masiva (POST /articles/bulk): tamaño máximo y desde cuántas filas usar COPY.
+    bulk_max_items: int = Field(default=10000, env="BULK_MAX_ITEMS")
+    bulk_copy_threshold: int = Field(default=1000, env="BULK_COPY_THRESHOLD")
+    # Filas por lote del cursor del servidor en GET /articles/export.
+    export_batch_size: int = Field(default=1000, env="EXPORT_BATCH_SIZE")
+
+    # Caché L1 en memoria de cada worker (delante de Redis).
+    l1_cache_enabled: bool = Field(default=False, env="L1_CACHE_ENABLED")
+    l1_cache_max_bytes: int = Field(default=32 * 1024 * 1024, env="L1_CACHE_MAX_BYTES")
+    l1_cache_ttl_seconds: float = Field(default=5.0, env="L1_CACHE_TTL_SECONDS")
+
+    # Precarga de la caché al arrancar (o con ``python -m app.warmup``): ``hot`` o ``recent``.
+    cache_warmup_on_startup: bool = Field(default=False, env="CACHE_WARMUP_ON_STARTUP")
+    cache_warmup_limit: int = Field(default=1000, env="CACHE_WARMUP_LIMIT")
+    cache_warmup_batch_size: int = Field(default=200, env="CACHE_WARMUP_BATCH_SIZE")
+    cache_warmup_source: str = Field(default="hot", env="CACHE_WARMUP_SOURCE")
+    # Refresco en segundo plano de las claves más leídas antes de que venzan.
+    cache_refresh_enabled: bool = Field(default=False, env="CACHE_REFRESH_ENABLED")
+    cache_refresh_interval_seconds: float = Field(default=15.0, env="CACHE_REFRESH_INTERVAL_SECONDS")
+    cache_refresh_top_n: int = Field(default=500, env="CACHE_REFRESH_TOP_N")
+    cache_refresh_ahead_seconds: float = Field(default=30.0, env="CACHE_REFRESH_AHEAD_SECONDS")
+    cache_access_sample_rate: float = Field(default=1.0, env="CACHE_ACCESS_SAMPLE_RATE")
+
+    # Métricas Prometheus en ``/metrics`` (requiere ``prometheus_client``).
+    metrics_enabled: bool = Field(default=True, env="METRICS_ENABLED")
+    # Perfilado por petición: ``X-Profile: <API_KEY>`` o una fracción aleatoria.
+    profiling_enabled: bool = Field(default=False, env="PROFILING_ENABLED")
+    profiling_sample_rate: float = Field(default=0.0, env="PROFILING_SAMPLE_RATE")
+    profiling_max_stored: int = Field(default=20, env="PROFILING_MAX_STORED")
+    profiling_dir: str | None = Field(default=None, env="PROFILING_DIR")
+
+    # Ruta de peticiones totalmente asíncrona (AsyncSession + redis.asyncio).
+    async_mode: bool = Field(default=False, env="ASYNC_MODE")
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", case_sensitive=False, extra="ignore",)
 
@@ -3,13 +3,73 @@
 
 from __future__ import annotations
 
-from typing import Iterable, Optional
+import json
+import uuid
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
-from sqlalchemy import Select, func, select
+import psycopg
+from sqlalchemy import (
+    DateTime,
+    Row,
+    Select,
+    any_,
+    bindparam,
+    cast,
+    delete,
+    column,
+    func,
+    insert,
+    literal,
+    literal_column,
+    select,
+    table,
+    text,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, DOUBLE_PRECISION, UUID
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from app.models.article import Article
+from app.models.article import (
+    PUBLISHED_SORT_SENTINEL,
+    SEARCH_CONFIG,
+    Article,
+    published_sort_key,
+)
+
+# Posición keyset: ``(published_at, id)`` del último artículo de la página anterior.
+KeysetPosition = Tuple[Optional[datetime], uuid.UUID]
+
+# Las lecturas seleccionan columnas (Core) en lugar de entidades: sin identity map
+# ni instrumentación, y pueden proyectar sólo los campos pedidos (sin ``body``).
+# ``search_vector`` sólo sirve para filtrar/ordenar búsquedas y nunca se devuelve.
+ARTICLE_COLUMNS = tuple(column for column in Article.__table__.c if column.key != "search_vector")
+# ``id`` y ``published_at`` siempre se leen (forman la posición del cursor), y
+# ``updated_at`` también: con ``id`` da el ETag de cualquier proyección.
+_REQUIRED_COLUMNS = frozenset({"id", "published_at", "updated_at"})
+
+
+def columns_for(fields: Optional[Iterable[str]]) -> tuple:
+    """Columnas a seleccionar para una proyección (``None`` = todas)."""
+    if fields is None:
+        return ARTICLE_COLUMNS
+    wanted = _REQUIRED_COLUMNS.union(fields)
+    return tuple(column for column in ARTICLE_COLUMNS if column.key in wanted)
+
+# Columnas de cada resultado de búsqueda: el cuerpo se sustituye por el fragmento.
+SEARCH_COLUMNS = columns_for(("title", "tags", "author"))
+# Posición keyset de una búsqueda: ``(rank, id)`` del último resultado entregado.
+SearchPosition = Tuple[float, uuid.UUID]
+# Opciones de ``ts_headline``: fragmentos cortos con los términos resaltados.
+HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxWords=35, MinWords=15, MaxFragments=2"
+
+# Columnas que aporta el cliente en una carga masiva (el resto son defaults del servidor).
+BULK_COLUMNS = ("id", "title", "body", "tags", "author", "published_at")
+# Filas por ``INSERT ... VALUES``: 6 parámetros por fila, lejos del límite de 65535.
+_INSERT_CHUNK_ROWS = 1000
 
 
 class ArticleRepository:
@@ -18,25 +78,96 @@ class ArticleRepository:
     def __init__(self, session: Session) -> None:
         self._session = session
 
-    def _base_query(self) -> Select[tuple[Article]]:
-        return select(Article)
+    def _base_query(self, columns: Sequence[Any] = ARTICLE_COLUMNS) -> Select:
+        return select(*columns)
 
     def _apply_filters(
         self,
-        stmt: Select[tuple[Article]],
+        stmt: Select,
         *,
         author: str | None = None,
         tag: str | None = None,
-    ) -> Select[tuple[Article]]:
+        tags: Sequence[str] = (),
+        tag_mode: str = "all",
+    ) -> Select:
         if author:
             stmt = stmt.where(Article.author == author)
-        if tag:
-            stmt = stmt.where(Article.tags.contains([tag]))
+        selected = [*tags, tag] if tag else list(tags)
+        if selected:
+            # ``@>`` (todas) y ``&&`` (alguna) sobre text[] usan el índice GIN ix_articles_tags.
+            if tag_mode == "any" and len(selected) > 1:
+                stmt = stmt.where(Article.tags.overlap(selected))
+            else:
+                stmt = stmt.where(Article.tags.contains(selected))
         return stmt
 
     def get(self, article_id: str) -> Optional[Article]:
         return self._session.get(Article, article_id)
 
+    def get_row(self, article_id: str, *, columns: Sequence[Any] = ARTICLE_COLUMNS) -> Optional[Row]:
+        """Lectura de sólo consulta: la fila como tupla Core, sin cargar la entidad."""
+        try:
+            key = uuid.UUID(str(article_id))
+        except ValueError:
+            return None
+        return self._session.execute(self._base_query(columns).where(Article.id == key)).first()
+
+    def get_many(self, article_ids: Sequence[str]) -> list[Row]:
+        """Carga varios artículos con un único ``WHERE id = ANY(:ids)`` (sin orden garantizado)."""
+        ids = []
+        for article_id in article_ids:
+            try:
+                ids.append(uuid.UUID(str(article_id)))
+            except ValueError:
+                continue
+        if not ids:
+            return []
+        param = bindparam("ids", value=ids, type_=ARRAY(UUID(as_uuid=True)))
+        stmt = self._base_query().where(Article.id == any_(param))
+        return list(self._session.execute(stmt).all())
+
+    def _apply_keyset(
+        self,
+        stmt: Select,
+        after: KeysetPosition,
+        *,
+        order_desc: bool,
+    ) -> Select:
+        published_at, last_id = after
+        boundary = tuple_(
+            literal(published_at, DateTime(timezone=True))
+            if published_at is not None
+            else PUBLISHED_SORT_SENTINEL,
+            literal(last_id, UUID(as_uuid=True)),
+        )
+        position = tuple_(published_sort_key, Article.id)
+        return stmt.where(position < boundary if order_desc else position > boundary)
+
+    def _list_query(
+        self,
+        *,
+        skip: int = 0,
+        limit: int = 50,
+        author: str | None = None,
+        tag: str | None = None,
+        tags: Sequence[str] = (),
+        tag_mode: str = "all",
+        order_desc: bool = True,
+        after: KeysetPosition | None = None,
+        columns: Sequence[Any] = ARTICLE_COLUMNS,
+    ) -> Select:
+        stmt = self._base_query(columns)
+        stmt = self._apply_filters(stmt, author=author, tag=tag, tags=tags, tag_mode=tag_mode)
+        if after is not None:
+            stmt = self._apply_keyset(stmt, after, order_desc=order_desc)
+            skip = 0
+        # ``id`` desempata artículos con la misma fecha para que el orden sea total.
+        if order_desc:
+            stmt = stmt.order_by(published_sort_key.desc(), Article.id.desc())
+        else:
+            stmt = stmt.order_by(published_sort_key.asc(), Article.id.asc())
+        return stmt.offset(skip).limit(limit)
+
     def list(
         self,
         *,
@@ -44,29 +175,321 @@ class ArticleRepository:
         limit: int = 50,
         author: str | None = None,
         tag: str | None = None,
+        tags: Sequence[str] = (),
+        tag_mode: str = "all",
         order_desc: bool = True,
-    ) -> list[Article]:
-        stmt = self._base_query()
-        stmt = self._apply_filters(stmt, author=author, tag=tag)
-        order_column = (
-            Article.published_at.desc().nullslast()
-            if order_desc
-            else Article.published_at.asc().nullsfirst()
+        after: KeysetPosition | None = None,
+        columns: Sequence[Any] = ARTICLE_COLUMNS,
+    ) -> list[Row]:
+        """Lista artículos por offset (``skip``) o por keyset (``after``).
+
+        Con ``after`` se ignora ``skip``: el índice ``(clave, id)`` se recorre desde
+        la posición indicada, así el costo no crece con la profundidad de la página.
+        Devuelve filas Core con las ``columns`` indicadas (ver :func:`columns_for`).
+        """
+        stmt = self._list_query(
+            skip=skip,
+            limit=limit,
+            author=author,
+            tag=tag,
+            tags=tags,
+            tag_mode=tag_mode,
+            order_desc=order_desc,
+            after=after,
+            columns=columns,
         )
-        stmt = stmt.order_by(order_column).offset(skip).limit(limit)
-        result = self._session.execute(stmt)
-        return list(result.scalars().all())
+        return list(self._session.execute(stmt).all())
+
+    def search(
+        self,
+        query: str,
+        *,
+        limit: int = 20,
+        author: str | None = None,
+        tags: Sequence[str] = (),
+        tag_mode: str = "all",
+        after: SearchPosition | None = None,
+    ) -> list[Row]:
+        """Búsqueda de texto completo ordenada por ``ts_rank`` (y ``id`` para desempatar).
+
+        ``@@`` sobre ``search_vector`` usa el índice GIN ix_articles_search_vector.
+        La página se limita en una subconsulta y ``ts_headline`` (que vuelve a
+        analizar el cuerpo) sólo se calcula para esas filas. Cada fila trae
+        :data:`SEARCH_COLUMNS` más ``rank`` y ``snippet``.
+        """
+        config = literal_column(f"'{SEARCH_CONFIG}'::regconfig")
+        tsquery = func.websearch_to_tsquery(config, query)
+        # ``ts_rank`` devuelve ``real``: en ``float8`` el valor que llega a Python (y al
+        # cursor) es exacto y la comparación keyset no repite la fila frontera.
+        rank = cast(func.ts_rank(Article.search_vector, tsquery), DOUBLE_PRECISION)
+
+        stmt = select(*SEARCH_COLUMNS, rank.label("rank")).where(
+            Article.search_vector.bool_op("@@")(tsquery)
+        )
+        stmt = self._apply_filters(stmt, author=author, tags=tags, tag_mode=tag_mode)
+        if after is not None:
+            last_rank, last_id = after
+            boundary = tuple_(
+                literal(last_rank, DOUBLE_PRECISION), literal(last_id, UUID(as_uuid=True))
+            )
+            stmt = stmt.where(tuple_(rank, Article.id) < boundary)
+        page = stmt.order_by(rank.desc(), Article.id.desc()).limit(limit).subquery("page")
+
+        snippet = func.ts_headline(config, Article.body, tsquery, HEADLINE_OPTIONS)
+        outer = (
+            select(*page.c, snippet.label("snippet"))
+            .join_from(page, Article.__table__, Article.id == page.c.id)
+            .order_by(page.c.rank.desc(), page.c.id.desc())
+        )
+        return list(self._session.execute(outer).all())
+
+    def export_query(
+        self,
+        *,
+        author: str | None = None,
+        tags: Sequence[str] = (),
+        tag_mode: str = "all",
+        order_desc: bool = True,
+    ) -> Select:
+        """Consulta Core (columnas, sin entidades ORM) para recorrer la tabla completa."""
+        stmt = self._apply_filters(self._base_query(), author=author, tags=tags, tag_mode=tag_mode)
+        if order_desc:
+            return stmt.order_by(published_sort_key.desc(), Article.id.desc())
+        return stmt.order_by(published_sort_key.asc(), Article.id.asc())
+
+    def stream(
+        self,
+        *,
+        author: str | None = None,
+        tags: Sequence[str] = (),
+        tag_mode: str = "all",
+        order_desc: bool = True,
+        batch_size: int = 1000,
+    ) -> Iterator[Sequence[Row]]:
+        """Recorre los artículos en lotes con un cursor del servidor (memoria constante)."""
+        stmt = self.export_query(author=author, tags=tags, tag_mode=tag_mode, order_desc=order_desc)
+        result = self._session.execute(stmt.execution_options(yield_per=batch_size))
+        yield from result.partitions()
 
     def count(
         self,
         *,
         author: str | None = None,
         tag: str | None = None,
+        tags: Sequence[str] = (),
+        tag_mode: str = "all",
     ) -> int:
         stmt = select(func.count(Article.id))
-        stmt = self._apply_filters(stmt, author=author, tag=tag)
+        stmt = self._apply_filters(stmt, author=author, tag=tag, tags=tags, tag_mode=tag_mode)
         return self._session.execute(stmt).scalar_one()
 
+    def _explain(self, stmt: Select) -> list[dict]:
+        """Devuelve el plan de PostgreSQL (``EXPLAIN (FORMAT JSON)``) de una consulta."""
+        # Con la sentencia como argumento la sesión la enruta como lectura (réplica).
+        bind_arguments = {"clause": stmt}
+        compiled = stmt.compile(dialect=self._session.get_bind(**bind_arguments).dialect)
+        plan = self._session.connection(bind_arguments=bind_arguments).exec_driver_sql(
+            f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params
+        ).scalar_one()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return plan
+
+    def estimate_count(
+        self,
+        *,
+        author: str | None = None,
+        tag: str | None = None,
+        tags: Sequence[str] = (),
+        tag_mode: str = "all",
+    ) -> int:
+        """Total aproximado según las estadísticas de PostgreSQL (sin recorrer la tabla)."""
+        if not author and not tag and not tags:
+            reltuples = self._session.execute(
+                text("SELECT reltuples FROM pg_class WHERE oid = CAST(:table AS regclass)"),
+                {"table": Article.__tablename__},
+            ).scalar_one()
+            # ``reltuples`` vale -1 mientras la tabla no haya sido analizada.
+            if reltuples >= 0:
+                return int(reltuples)
+
+        stmt = self._apply_filters(
+            select(Article.id), author=author, tag=tag, tags=tags, tag_mode=tag_mode
+        )
+        return int(self._explain(stmt)[0]["Plan"]["Plan Rows"])
+
+    def _upsert(self, stmt: Any, *, update_on_conflict: bool) -> Any:
+        """Agrega ``ON CONFLICT (title, author)`` y ``RETURNING`` a un ``INSERT``.
+
+        Cada fila devuelta incluye ``inserted``: ``xmax = 0`` sólo en las filas
+        recién insertadas, no en las que actualizó ``DO UPDATE``.
+        """
+        if update_on_conflict:
+            stmt = stmt.on_conflict_do_update(
+                constraint="uq_articles_title_author",
+                set_={
+                    "body": stmt.excluded.body,
+                    "tags": stmt.excluded.tags,
+                    "published_at": stmt.excluded.published_at,
+                    "updated_at": func.now(),
+                },
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(constraint="uq_articles_title_author")
+        return stmt.returning(
+            *ARTICLE_COLUMNS, literal_column("xmax = 0").label("inserted")
+        )
+
+    def insert_many(
+        self, rows: Sequence[Dict[str, Any]], *, update_on_conflict: bool = False
+    ) -> List[Row]:
+        """Inserta en lotes de ``INSERT ... VALUES`` multi-fila; devuelve las filas escritas.
+
+        Con ``DO NOTHING`` los conflictos no aparecen en el resultado.
+        """
+        written: List[Row] = []
+        for start in range(0, len(rows), _INSERT_CHUNK_ROWS):
+            stmt = pg_insert(Article.__table__).values(list(rows[start : start + _INSERT_CHUNK_ROWS]))
+            written.extend(
+                self._session.execute(self._upsert(stmt, update_on_conflict=update_on_conflict))
+            )
+        return written
+
+    def copy_many(
+        self, rows: Sequence[Dict[str, Any]], *, update_on_conflict: bool = False
+    ) -> List[Row]:
+        """Igual que :meth:`insert_many` pero carga las filas con ``COPY`` a una tabla temporal.
+
+        Conviene en lotes grandes: ``COPY`` evita parsear miles de ``VALUES``. Sólo
+        aplica con el driver síncrono; sobre ``AsyncSession`` se usa :meth:`insert_many`.
+        """
+        connection = self._session.connection()
+        driver = connection.connection.driver_connection
+        if not isinstance(driver, psycopg.Connection):
+            return self.insert_many(rows, update_on_conflict=update_on_conflict)
+
+        connection.exec_driver_sql(
+            "CREATE TEMP TABLE IF NOT EXISTS articles_import ("
+            "id uuid, title varchar(255), body text, tags varchar[], "
+            "author varchar(255), published_at timestamptz"
+            ") ON COMMIT DROP"
+        )
+        columns = ", ".join(BULK_COLUMNS)
+        with driver.cursor() as cursor:
+            with cursor.copy(f"COPY articles_import ({columns}) FROM STDIN") as copy:
+                for row in rows:
+                    copy.write_row([row[name] for name in BULK_COLUMNS])
+
+        staged = table("articles_import", *(column(name) for name in BULK_COLUMNS))
+        stmt = pg_insert(Article.__table__).from_select(
+            list(BULK_COLUMNS), select(*staged.c)
+        )
+        written = list(
+            self._session.execute(self._upsert(stmt, update_on_conflict=update_on_conflict))
+        )
+        connection.exec_driver_sql("TRUNCATE articles_import")
+        return written
+
+    def tags_by_title_author(self, keys: Sequence[Tuple[str, str]]) -> Dict[Tuple[str, str], List[str]]:
+        """Etiquetas actuales de los artículos existentes con esos ``(title, author)``."""
+        if not keys:
+            return {}
+        stmt = select(Article.title, Article.author, Article.tags).where(
+            tuple_(Article.title, Article.author).in_(list(keys))
+        )
+        return {(title, author): list(tags or []) for title, author, tags in self._session.execute(stmt)}
+
+    def insert_row(self, values: Dict[str, Any]) -> Row:
+        """``INSERT ... RETURNING``: la fila con los valores generados por el servidor.
+
+        Un único viaje a PostgreSQL (más el ``COMMIT`` de :meth:`save`) en lugar
+        de ``INSERT`` + ``SELECT`` de refresco.
+        """
+        stmt = insert(Article.__table__).values(**values).returning(*ARTICLE_COLUMNS)
+        try:
+            return self._session.execute(stmt).one()
+        except IntegrityError:
+            self._session.rollback()
+            raise
+
+    def update_row(self, article_id: str, values: Dict[str, Any]) -> Optional[Row]:
+        """``UPDATE ... RETURNING`` condicionado al ID; ``None`` si el artículo no existe.
+
+        Un CTE bloquea la fila y conserva ``author``/``tags`` previos, que vuelven
+        como ``previous_author``/``previous_tags`` junto a la fila actualizada:
+        un solo viaje sin ``SELECT`` previo ni refresco posterior.
+        """
+        try:
+            key = uuid.UUID(str(article_id))
+        except ValueError:
+            return None
+        old = (
+            select(Article.id, Article.author, Article.tags)
+            .where(Article.id == key)
+            .with_for_update()
+            .cte("old")
+        )
+        stmt = (
+            update(Article.__table__)
+            .where(Article.id == old.c.id)
+            .values(**values)
+            .returning(
+                *ARTICLE_COLUMNS,
+                old.c.author.label("previous_author"),
+                old.c.tags.label("previous_tags"),
+            )
+        )
+        try:
+            return self._session.execute(stmt).first()
+        except IntegrityError:
+            self._session.rollback()
+            raise
+
+    def delete_row(self, article_id: str) -> Optional[Row]:
+        """``DELETE ... RETURNING``: ``None`` si no existía (sin ``SELECT`` previo).
+
+        Devuelve ``id``, ``author`` y ``tags`` para invalidar los listados afectados.
+        """
+        try:
+            key = uuid.UUID(str(article_id))
+        except ValueError:
+            return None
+        stmt = (
+            delete(Article.__table__)
+            .where(Article.id == key)
+            .returning(Article.id, Article.author, Article.tags)
+        )
+        return self._session.execute(stmt).first()
+
+    def delete_many(
+        self,
+        *,
+        article_ids: Sequence[str] = (),
+        author: str | None = None,
+        tags: Sequence[str] = (),
+        tag_mode: str = "all",
+    ) -> list[Row]:
+        """Borra por IDs y/o filtros en una sola sentencia; devuelve las filas borradas.
+
+        Sin ningún criterio no se borra nada (nunca se vacía la tabla por omisión).
+        """
+        ids = []
+        for article_id in article_ids:
+            try:
+                ids.append(uuid.UUID(str(article_id)))
+            except ValueError:
+                continue
+        if (article_ids and not ids) or not (ids or author or tags):
+            # Sólo IDs inválidos, o ningún criterio.
+            return []
+        stmt = delete(Article.__table__)
+        if ids:
+            param = bindparam("ids", value=ids, type_=ARRAY(UUID(as_uuid=True)))
+            stmt = stmt.where(Article.id == any_(param))
+        stmt = self._apply_filters(stmt, author=author, tags=tags, tag_mode=tag_mode)
+        stmt = stmt.returning(Article.id, Article.author, Article.tags)
+        return list(self._session.execute(stmt).all())
+
     def create(self, article: Article) -> Article:
         self._session.add(article)
         return article
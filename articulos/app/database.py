@@ -1,21 +1,195 @@
 """Inicialización del motor y la sesión de SQLAlchemy."""
 
-from typing import Generator
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncGenerator, Dict, Generator, List
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
 
 from app.config import settings
+from app.metrics import instrument_engine
+from app.replicas import ReplicaSet, RoutingSession, current_routing, parse_replica_urls
 
-engine = create_engine(settings.postgres_dsn, future=True)
-SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+
+@dataclass
+class PoolStats:
+    """Contadores de un pool de conexiones (expuestos en ``/health/db``)."""
+
+    checkouts: int = 0
+    checkins: int = 0
+    connects: int = 0
+    invalidations: int = 0
+    timeouts: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+
+    def observe_wait(self, seconds: float) -> None:
+        self.wait_seconds_total += seconds
+        self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "checkouts": self.checkouts,
+            "checkins": self.checkins,
+            "connects": self.connects,
+            "invalidations": self.invalidations,
+            "timeouts": self.timeouts,
+            "wait_seconds_total": round(self.wait_seconds_total, 6),
+            "wait_seconds_max": round(self.wait_seconds_max, 6),
+        }
+
+
+POOL_STATS: Dict[str, PoolStats] = {"sync": PoolStats(), "async": PoolStats()}
+
+
+class _TimedPoolMixin:
+    """Mide cuánto espera cada checkout por una conexión libre del pool."""
+
+    _stats_name = "sync"
+
+    def _do_get(self) -> Any:
+        stats = POOL_STATS[self._stats_name]
+        started = time.perf_counter()
+        try:
+            return super()._do_get()  # type: ignore[misc]
+        except PoolTimeoutError:
+            stats.timeouts += 1
+            raise
+        finally:
+            stats.observe_wait(time.perf_counter() - started)
+
+
+class TimedQueuePool(_TimedPoolMixin, QueuePool):
+    _stats_name = "sync"
+
+
+class TimedAsyncAdaptedQueuePool(_TimedPoolMixin, AsyncAdaptedQueuePool):
+    _stats_name = "async"
+
+
+def _engine_options(pool_class: type) -> Dict[str, Any]:
+    """Opciones de ``create_engine`` según la configuración del pool.
+
+    En modo PgBouncer (pool por transacción) el pooling lo hace PgBouncer: se usa
+    ``NullPool`` y se desactivan las sentencias preparadas de psycopg, que no
+    sobreviven al cambio de conexión de servidor. ``statement_timeout`` tampoco
+    se envía como parámetro de arranque (PgBouncer lo rechaza); en ese caso se
+    configura en el rol o la base (``ALTER ROLE ... SET statement_timeout``).
+    """
+    if settings.db_pgbouncer_mode:
+        return {"poolclass": NullPool, "connect_args": {"prepare_threshold": None}}
+
+    connect_args: Dict[str, Any] = {}
+    if settings.db_statement_timeout_ms > 0:
+        connect_args["options"] = f"-c statement_timeout={settings.db_statement_timeout_ms}"
+    return {
+        "poolclass": pool_class,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "connect_args": connect_args,
+    }
+
+
+def _instrument(engine: Engine, stats: PoolStats) -> None:
+    """Registra los eventos del pool que alimentan :data:`POOL_STATS`."""
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection: Any, record: Any) -> None:  # noqa: ARG001
+        stats.connects += 1
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_connection: Any, record: Any, proxy: Any) -> None:  # noqa: ARG001
+        stats.checkouts += 1
+
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(dbapi_connection: Any, record: Any) -> None:  # noqa: ARG001
+        stats.checkins += 1
+
+    @event.listens_for(engine, "invalidate")
+    def _on_invalidate(dbapi_connection: Any, record: Any, exception: Any) -> None:  # noqa: ARG001
+        stats.invalidations += 1
+
+
+engine = create_engine(settings.postgres_dsn, future=True, **_engine_options(TimedQueuePool))
+_instrument(engine, POOL_STATS["sync"])
+instrument_engine(engine, "sync")
 Base = declarative_base()
 
+# Motor asíncrono (psycopg async) usado cuando ``ASYNC_MODE`` está activo.
+# Las conexiones se abren de forma perezosa, así que no tiene costo en modo síncrono.
+async_engine = create_async_engine(settings.postgres_dsn, **_engine_options(TimedAsyncAdaptedQueuePool))
+_instrument(async_engine.sync_engine, POOL_STATS["async"])
+instrument_engine(async_engine.sync_engine, "async")
+
+# Réplicas de lectura: un motor por URL y modo, también perezosos.
+_replica_urls = parse_replica_urls(settings.database_replica_urls)
+_replica_engines = [create_engine(url, future=True, **_engine_options(QueuePool)) for url in _replica_urls]
+_async_replica_engines = [
+    create_async_engine(url, **_engine_options(AsyncAdaptedQueuePool)).sync_engine for url in _replica_urls
+]
+for _replica in (*_replica_engines, *_async_replica_engines):
+    instrument_engine(_replica, "replica")
+replica_set = ReplicaSet(_replica_engines, _replica_urls)
+async_replica_set = ReplicaSet(_async_replica_engines, _replica_urls)
+
+# ``RoutingSession`` envía las lecturas a las réplicas (si hay) y el resto al primario.
+SessionLocal = sessionmaker(
+    bind=engine,
+    class_=RoutingSession,
+    replicas=replica_set,
+    autoflush=False,
+    autocommit=False,
+    future=True,
+)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    sync_session_class=RoutingSession,
+    replicas=async_replica_set,
+    autoflush=False,
+    autocommit=False,
+)
+
+
+def pool_status() -> Dict[str, Dict[str, Any]]:
+    """Ocupación actual y contadores acumulados de cada pool de este worker."""
+    status: Dict[str, Dict[str, Any]] = {}
+    for name, pool in (("sync", engine.pool), ("async", async_engine.sync_engine.pool)):
+        current: Dict[str, Any] = {"pool": type(pool).__name__}
+        if isinstance(pool, QueuePool):
+            current.update(
+                size=pool.size(),
+                checked_out=pool.checkedout(),
+                idle=pool.checkedin(),
+                overflow=max(pool.overflow(), 0),
+            )
+        current.update(POOL_STATS[name].as_dict())
+        status[name] = current
+    return status
+
+
+def replica_status() -> List[Dict[str, Any]]:
+    """Estado de salud de cada réplica de lectura configurada."""
+    return replica_set.status()
+
 
 def get_db() -> Generator[Session, None, None]:
     """Proporciona una sesión de base de datos por solicitud."""
-    db = SessionLocal()
+    db = SessionLocal(routing=current_routing())
     try:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """Proporciona una sesión asíncrona por solicitud."""
+    async with AsyncSessionLocal(routing=current_routing()) as db:
+        yield db
@@ -2,13 +2,73 @@
 
 from __future__ import annotations
 
-from fastapi import FastAPI
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
-from app.api import api_router
+from fastapi import FastAPI, Response
+from starlette.concurrency import run_in_threadpool
+
+from app import metrics
+from app.api import api_router, profiles
+from app.cache import (
+    cache_stats,
+    close_async_redis_pool,
+    close_redis_pool,
+    get_local_cache,
+    init_async_redis_pool,
+    init_cache_codec,
+    init_redis_pool,
+    start_invalidation_listener,
+    stop_invalidation_listener,
+)
 from app.config import settings
+from app.database import async_engine, async_replica_set, pool_status, replica_set, replica_status
+from app.profiling import ProfilingMiddleware
+from app.replicas import ReadYourWritesMiddleware, start_replica_health_checks, stop_replica_health_checks
+from app.warmup import start_cache_refresher, stop_cache_refresher, warm_cache_on_startup
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    """Abre los recursos compartidos del proceso y los libera al apagar."""
+
+    init_cache_codec()
+    init_redis_pool()
+    if settings.async_mode:
+        init_async_redis_pool()
+    start_invalidation_listener()
+    start_replica_health_checks(replica_set, async_replica_set)
+    if settings.cache_warmup_on_startup:
+        # Antes de aceptar tráfico; en un hilo para no bloquear el event loop.
+        await run_in_threadpool(warm_cache_on_startup)
+    start_cache_refresher()
+    try:
+        yield
+    finally:
+        stop_cache_refresher()
+        stop_replica_health_checks()
+        stop_invalidation_listener()
+        close_redis_pool()
+        if settings.async_mode:
+            await close_async_redis_pool()
+            await async_engine.dispose()
 
-app = FastAPI(title=settings.app_name, version=settings.app_version)
+
+app = FastAPI(title=settings.app_name, version=settings.app_version, lifespan=lifespan)
 app.include_router(api_router)
+if replica_set and settings.read_your_writes_seconds > 0:
+    app.add_middleware(ReadYourWritesMiddleware, window_seconds=settings.read_your_writes_seconds)
+if settings.profiling_enabled:
+    app.add_middleware(
+        ProfilingMiddleware, api_key=settings.api_key, sample_rate=settings.profiling_sample_rate
+    )
+    app.include_router(profiles.router)
+if metrics.ENABLED:
+    # El último middleware añadido es el más externo: mide la petición completa.
+    app.add_middleware(metrics.MetricsMiddleware)
+    metrics.register_state_collector(
+        pool_status=pool_status, replica_status=replica_status, cache_stats=cache_stats
+    )
 
 
 @app.get("/health", tags=["health"])  # pragma: no cover - endpoint trivial
@@ -16,3 +76,35 @@ async def health() -> dict[str, str]:
     """Verificación rápida del servicio."""
 
     return {"status": "ok"}
+
+
+@app.get("/health/cache", tags=["health"])
+async def cache_health() -> dict[str, object]:
+    """Aciertos, fallos, desalojos e invalidaciones por nivel de caché en este worker."""
+
+    local = get_local_cache()
+    return {
+        "l1_enabled": local is not None,
+        "l1_size_bytes": local.size_bytes if local is not None else 0,
+        "tiers": cache_stats(),
+    }
+
+
+@app.get("/health/db", tags=["health"])
+async def db_health() -> dict[str, object]:
+    """Ocupación de los pools de PostgreSQL (conexiones en uso, overflow, esperas) en este worker."""
+
+    return {
+        "pgbouncer_mode": settings.db_pgbouncer_mode,
+        "pools": pool_status(),
+        "replicas": replica_status(),
+    }
+
+
+if metrics.ENABLED:
+
+    @app.get("/metrics", tags=["health"], include_in_schema=False)
+    async def prometheus_metrics() -> Response:
+        """Métricas de este worker en formato de texto de Prometheus."""
+
+        return Response(metrics.render_latest(), media_type=metrics.CONTENT_TYPE)
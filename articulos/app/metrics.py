@@ -0,0 +1,321 @@
+"""Métricas Prometheus del servicio (``GET /metrics``).
+
+Se mide en tres puntos del camino caliente:
+
+* HTTP: :class:`MetricsMiddleware` observa la latencia de cada petición con la
+  *plantilla* de la ruta (``/articles/{article_id}``), nunca la ruta real, para
+  que el número de series no crezca con los IDs.
+* PostgreSQL: :func:`instrument_engine` cronometra cada sentencia con los eventos
+  ``before/after_cursor_execute``, etiquetada por motor y tipo de operación.
+* Redis: :func:`timed_cache` envuelve las operaciones de :class:`~app.cache.ArticleCache`
+  (latencia y, en las lecturas, acierto/fallo).
+
+Esos mismos eventos suman el tiempo de SQL y de caché de las peticiones
+perfiladas (``Server-Timing``, ver :mod:`app.profiling`).
+
+Los pools de conexiones, los contadores de caché por nivel y la ocupación del
+threadpool se leen al momento del *scrape* (:class:`StateCollector`), sin costo
+en las peticiones. ``prometheus_client`` es opcional: si no está instalado (o
+``METRICS_ENABLED=false``) todo esto queda desactivado y ``/metrics`` no existe.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, TypeVar
+
+from sqlalchemy import event
+
+from app.config import settings
+from app.profiling import current_timings
+
+try:  # Dependencia opcional: sin ella no se exportan métricas.
+    import prometheus_client
+    from prometheus_client.core import GaugeMetricFamily
+except ImportError:  # pragma: no cover - depende del entorno
+    prometheus_client = None
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+ENABLED = settings.metrics_enabled and prometheus_client is not None
+if settings.metrics_enabled and prometheus_client is None:  # pragma: no cover - depende del entorno
+    logger.warning("METRICS_ENABLED=true pero prometheus_client no está instalado; /metrics desactivado")
+
+# Valores permitidos en las etiquetas; cualquier otro se agrupa para acotar las series.
+_HTTP_METHODS = frozenset({"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"})
+_SQL_OPERATIONS = frozenset({"SELECT", "INSERT", "UPDATE", "DELETE", "WITH", "COPY", "BEGIN", "COMMIT", "ROLLBACK"})
+UNMATCHED_ROUTE = "<unmatched>"
+
+# Buckets en segundos: Redis y PostgreSQL responden en (sub)milisegundos.
+CACHE_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25)
+DB_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+if ENABLED:
+    REGISTRY = prometheus_client.CollectorRegistry(auto_describe=True)
+    HTTP_REQUEST_DURATION = prometheus_client.Histogram(
+        "articles_http_request_duration_seconds",
+        "Duración de las peticiones HTTP por ruta (plantilla), método y código.",
+        ("method", "route", "status"),
+        registry=REGISTRY,
+    )
+    HTTP_REQUESTS_IN_PROGRESS = prometheus_client.Gauge(
+        "articles_http_requests_in_progress",
+        "Peticiones HTTP en curso en este worker.",
+        registry=REGISTRY,
+    )
+    DB_QUERY_DURATION = prometheus_client.Histogram(
+        "articles_db_query_duration_seconds",
+        "Duración de cada sentencia SQL por motor y operación.",
+        ("engine", "operation"),
+        buckets=DB_BUCKETS,
+        registry=REGISTRY,
+    )
+    CACHE_OPERATION_DURATION = prometheus_client.Histogram(
+        "articles_cache_operation_duration_seconds",
+        "Duración de las operaciones de ArticleCache (incluye los aciertos L1).",
+        ("operation",),
+        buckets=CACHE_BUCKETS,
+        registry=REGISTRY,
+    )
+    CACHE_LOOKUPS = prometheus_client.Counter(
+        "articles_cache_lookups",
+        "Lecturas de ArticleCache por operación y resultado (hit/miss).",
+        ("operation", "result"),
+        registry=REGISTRY,
+    )
+else:
+    REGISTRY = None
+
+# Los eventos de SQL y caché también alimentan el ``Server-Timing`` de las peticiones perfiladas.
+INSTRUMENTED = ENABLED or settings.profiling_enabled
+
+
+def http_method_label(method: str) -> str:
+    return method if method in _HTTP_METHODS else "OTHER"
+
+
+def sql_operation_label(statement: str, context: Any = None) -> str:
+    """Tipo de sentencia (``SELECT``, ``INSERT``...) a partir del contexto o del SQL."""
+    if context is not None:
+        if getattr(context, "isinsert", False):
+            return "INSERT"
+        if getattr(context, "isupdate", False):
+            return "UPDATE"
+        if getattr(context, "isdelete", False):
+            return "DELETE"
+    keyword = statement.lstrip()[:10].split(None, 1)
+    operation = keyword[0].upper() if keyword else ""
+    return operation if operation in _SQL_OPERATIONS else "OTHER"
+
+
+def route_templates(routes: Iterable[Any]) -> Dict[Any, str]:
+    """Mapa ``endpoint -> plantilla de ruta`` (``/articles/{article_id}``)."""
+    templates: Dict[Any, str] = {}
+    for route in routes:
+        path = getattr(route, "path", None)
+        endpoint = getattr(route, "endpoint", None)
+        if path is not None and endpoint is not None:
+            templates.setdefault(endpoint, path)
+    return templates
+
+
+class MetricsMiddleware:
+    """Middleware ASGI que mide la latencia de cada petición hasta el último byte."""
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+        self._templates: Optional[Dict[Any, str]] = None
+
+    def route_label(self, scope: Dict[str, Any]) -> str:
+        """Plantilla de la ruta que atendió ``scope`` (``UNMATCHED_ROUTE`` si ninguna)."""
+        if self._templates is None and "app" in scope:
+            self._templates = route_templates(scope["app"].routes)
+        return (self._templates or {}).get(scope.get("endpoint"), UNMATCHED_ROUTE)
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        started = time.perf_counter()
+
+        async def send_with_status(message: Dict[str, Any]) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        HTTP_REQUESTS_IN_PROGRESS.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            HTTP_REQUESTS_IN_PROGRESS.dec()
+            HTTP_REQUEST_DURATION.labels(
+                http_method_label(scope["method"]), self.route_label(scope), str(status)
+            ).observe(time.perf_counter() - started)
+
+
+def instrument_engine(engine: Any, name: str) -> None:
+    """Cronometra las sentencias de ``engine`` (motor síncrono o ``sync_engine``)."""
+    if not INSTRUMENTED:
+        return
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:  # noqa: ARG001
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:  # noqa: ARG001
+        elapsed = time.perf_counter() - conn.info["query_started"].pop()
+        if ENABLED:
+            DB_QUERY_DURATION.labels(name, sql_operation_label(statement, context)).observe(elapsed)
+        timings = current_timings()
+        if timings is not None:
+            timings.db += elapsed
+
+    @event.listens_for(engine, "handle_error")
+    def _on_error(context: Any) -> None:
+        # La sentencia falló: ``after_cursor_execute`` no llega, se descarta su inicio.
+        connection = context.connection
+        if connection is not None and connection.info.get("query_started"):
+            connection.info["query_started"].pop()
+
+
+def timed_cache(operation: str, *, hit: Optional[Callable[[Any], bool]] = None) -> Callable[[F], F]:
+    """Decora un método de caché para medir su latencia (y acierto/fallo con ``hit``).
+
+    Sin métricas ni perfilado devuelve el método sin envolver.
+    """
+
+    def decorator(fn: F) -> F:
+        if not INSTRUMENTED:
+            return fn
+        if ENABLED:
+            duration = CACHE_OPERATION_DURATION.labels(operation)
+            hits = CACHE_LOOKUPS.labels(operation, "hit")
+            misses = CACHE_LOOKUPS.labels(operation, "miss")
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            started = time.perf_counter()
+            try:
+                result = fn(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - started
+                if ENABLED:
+                    duration.observe(elapsed)
+                timings = current_timings()
+                if timings is not None:
+                    timings.cache += elapsed
+            if ENABLED and hit is not None:
+                (hits if hit(result) else misses).inc()
+            return result
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+class StateCollector:
+    """Gauges leídos en cada *scrape*: pools, réplicas, caché por nivel y threadpool."""
+
+    def __init__(
+        self,
+        *,
+        pool_status: Callable[[], Dict[str, Dict[str, Any]]],
+        replica_status: Callable[[], List[Dict[str, Any]]],
+        cache_stats: Callable[[], Dict[str, Dict[str, int]]],
+    ) -> None:
+        self._pool_status = pool_status
+        self._replica_status = replica_status
+        self._cache_stats = cache_stats
+
+    def collect(self) -> Iterable[Any]:
+        yield from self._pools()
+        yield from self._replicas()
+        yield from self._cache()
+        yield from self._threadpool()
+
+    def _pools(self) -> Iterable[Any]:
+        connections = GaugeMetricFamily(
+            "articles_db_pool_connections",
+            "Conexiones del pool por estado (size, checked_out, idle, overflow).",
+            labels=("pool", "state"),
+        )
+        events = GaugeMetricFamily(
+            "articles_db_pool_events",
+            "Contadores acumulados del pool (checkouts, connects, invalidations, timeouts).",
+            labels=("pool", "event"),
+        )
+        wait = GaugeMetricFamily(
+            "articles_db_pool_wait_seconds",
+            "Espera por una conexión libre: total acumulado y máximo observado.",
+            labels=("pool", "stat"),
+        )
+        for pool, status in self._pool_status().items():
+            for state in ("size", "checked_out", "idle", "overflow"):
+                if state in status:
+                    connections.add_metric((pool, state), status[state])
+            for name in ("checkouts", "checkins", "connects", "invalidations", "timeouts"):
+                events.add_metric((pool, name), status[name])
+            wait.add_metric((pool, "total"), status["wait_seconds_total"])
+            wait.add_metric((pool, "max"), status["wait_seconds_max"])
+        yield from (connections, events, wait)
+
+    def _replicas(self) -> Iterable[Any]:
+        up = GaugeMetricFamily(
+            "articles_db_replica_up", "1 si la réplica de lectura está sana.", labels=("replica",)
+        )
+        for index, replica in enumerate(self._replica_status()):
+            up.add_metric((str(index),), 1.0 if replica["healthy"] else 0.0)
+        yield up
+
+    def _cache(self) -> Iterable[Any]:
+        tiers = GaugeMetricFamily(
+            "articles_cache_tier_events",
+            "Aciertos, fallos, desalojos e invalidaciones acumulados por nivel de caché.",
+            labels=("tier", "event"),
+        )
+        for tier, stats in self._cache_stats().items():
+            for name, value in stats.items():
+                tiers.add_metric((tier, name), value)
+        yield tiers
+
+    @staticmethod
+    def _threadpool() -> Iterable[Any]:
+        # El limitador de AnyIO sólo existe dentro del event loop (el scrape corre ahí).
+        try:
+            from anyio import to_thread
+
+            limiter = to_thread.current_default_thread_limiter()
+            statistics = limiter.statistics()
+        except Exception:  # noqa: BLE001 - fuera del event loop no hay threadpool que medir
+            return
+        threadpool = GaugeMetricFamily(
+            "articles_threadpool",
+            "Ocupación del threadpool de endpoints síncronos (tokens y tareas en espera).",
+            labels=("state",),
+        )
+        threadpool.add_metric(("total",), limiter.total_tokens)
+        threadpool.add_metric(("in_use",), statistics.borrowed_tokens)
+        threadpool.add_metric(("waiting",), statistics.tasks_waiting)
+        yield threadpool
+
+
+def register_state_collector(**sources: Callable[..., Any]) -> None:
+    """Registra :class:`StateCollector` con las funciones de estado de la app."""
+    if ENABLED:
+        REGISTRY.register(StateCollector(**sources))
+
+
+def render_latest() -> bytes:
+    """Serializa todas las métricas en el formato de texto de Prometheus."""
+    return prometheus_client.generate_latest(REGISTRY)
+
+
+CONTENT_TYPE = prometheus_client.CONTENT_TYPE_LATEST if prometheus_client is not None else "text/plain"
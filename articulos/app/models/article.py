@@ -2,12 +2,32 @@
 
 import uuid
 
-from sqlalchemy import Column, DateTime, Index, String, Text, UniqueConstraint, func
-from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy import (
+    Column,
+    Computed,
+    DateTime,
+    Index,
+    String,
+    Text,
+    UniqueConstraint,
+    func,
+    literal_column,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR, UUID
+from sqlalchemy.orm import deferred
 
 from app.database import Base
 
 
+# Configuración de búsqueda de texto completo (stemming en español).
+SEARCH_CONFIG = "spanish"
+# Documento de búsqueda: el título pesa más (A) que el cuerpo (B) en ``ts_rank``.
+SEARCH_VECTOR_SQL = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(body, '')), 'B')"
+)
+
+
 def _generate_uuid() -> uuid.UUID:
     """Genera un UUID4 como valor por defecto."""
     return uuid.uuid4()
@@ -34,9 +54,27 @@ class Article(Base):
     updated_at = Column(
         DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()
     )
+    # Columna generada por PostgreSQL; diferida para que la entidad no la cargue.
+    search_vector = deferred(Column(TSVECTOR, Computed(SEARCH_VECTOR_SQL, persisted=True)))
 
     __table_args__ = (
         UniqueConstraint("title", "author", name="uq_articles_title_author"),
         Index("ix_articles_author", "author"),
         Index("ix_articles_published_at", "published_at"),
+        # GIN sobre el arreglo de etiquetas para los operadores ``@>`` / ``&&``.
+        Index("ix_articles_tags", "tags", postgresql_using="gin"),
+        # GIN sobre el documento de búsqueda para ``@@`` (GET /articles/search).
+        Index("ix_articles_search_vector", "search_vector", postgresql_using="gin"),
     )
+    # Los flush del ORM leen created_at/updated_at con RETURNING en lugar de otro SELECT.
+    __mapper_args__ = {"eager_defaults": True}
+
+
+# Clave de orden de los listados: ``published_at`` con los NULL como ``-infinity``.
+# Equivale al orden previo (NULLS LAST en desc / NULLS FIRST en asc) pero sin
+# cláusulas NULLS, así el índice compuesto (clave, id) sirve en ambos sentidos y
+# la paginación keyset puede usar una comparación de filas ``(clave, id) < (...)``.
+PUBLISHED_SORT_SENTINEL = literal_column("'-infinity'::timestamptz", type_=DateTime(timezone=True))
+published_sort_key = func.coalesce(Article.published_at, PUBLISHED_SORT_SENTINEL)
+
+Index("ix_articles_published_sort_id", published_sort_key, Article.id)
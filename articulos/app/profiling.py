@@ -0,0 +1,269 @@
+"""Perfilado opcional de peticiones y desglose ``Server-Timing``.
+
+Con ``PROFILING_ENABLED=true`` :class:`ProfilingMiddleware` perfila con
+``cProfile`` las peticiones que traen ``X-Profile: <API_KEY>`` y una fracción
+aleatoria del resto (``PROFILING_SAMPLE_RATE``). Cada petición perfilada:
+
+* responde con ``Server-Timing`` (``db``, ``cache``, ``serialize`` y ``total`` en
+  ms) y con ``X-Profile-Id``;
+* deja su perfil en memoria (los últimos ``PROFILING_MAX_STORED``) y, si se
+  configura ``PROFILING_DIR``, en ``{PROFILING_DIR}/{id}.prof``; se descarga en
+  ``GET /debug/profiles/{id}`` como texto o en formato ``pstats`` (``snakeviz``
+  o ``flameprof`` lo convierten en un flamegraph).
+
+Los tiempos de ``db`` y ``cache`` los suman los eventos de :mod:`app.metrics`;
+``serialize`` se mide con :func:`measure` donde se construyen las respuestas.
+El perfilador sigue al hilo del event loop y, con :func:`in_thread`, a los
+hilos del threadpool que ejecutan el servicio; en el event loop también puede
+registrar trabajo de otras peticiones concurrentes.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import hmac
+import io
+import logging
+import marshal
+import pstats
+import random
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+PROFILE_HEADER = b"x-profile"
+PROFILE_ID_HEADER = "x-profile-id"
+
+
+@dataclass
+class RequestTimings:
+    """Tiempo (segundos) por componente de una petición perfilada."""
+
+    db: float = 0.0
+    cache: float = 0.0
+    serialize: float = 0.0
+    # Perfiles tomados en hilos del threadpool; se suman al del event loop.
+    thread_profiles: List[cProfile.Profile] = field(default_factory=list)
+
+    def server_timing(self, total: float) -> str:
+        parts = [("db", self.db), ("cache", self.cache), ("serialize", self.serialize), ("total", total)]
+        return ", ".join(f"{name};dur={seconds * 1000:.3f}" for name, seconds in parts)
+
+
+_request_timings: ContextVar[Optional[RequestTimings]] = ContextVar("request_timings", default=None)
+
+
+def current_timings() -> Optional[RequestTimings]:
+    """Desglose de la petición en curso si se está perfilando, o ``None``."""
+    return _request_timings.get()
+
+
+@contextmanager
+def measure(component: str) -> Iterator[None]:
+    """Suma la duración del bloque a ``component`` de la petición perfilada (si la hay)."""
+    timings = _request_timings.get()
+    if timings is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        setattr(timings, component, getattr(timings, component) + time.perf_counter() - started)
+
+
+_thread_state = threading.local()
+
+
+def _start_profiler() -> Optional[cProfile.Profile]:
+    """Activa ``cProfile`` en este hilo, salvo que ya haya un perfilado en curso en él."""
+    if getattr(_thread_state, "active", False):
+        return None
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:  # otra herramienta de perfilado ya está activa (Python 3.12+)
+        return None
+    _thread_state.active = True
+    return profiler
+
+
+def _stop_profiler(profiler: Optional[cProfile.Profile]) -> None:
+    if profiler is not None:
+        profiler.disable()
+        _thread_state.active = False
+
+
+def in_thread(fn: Callable[..., T]) -> Callable[..., T]:
+    """Envuelve ``fn`` para perfilarla en el hilo que la ejecute (sin perfilado, ``fn`` tal cual)."""
+    timings = _request_timings.get()
+    if timings is None:
+        return fn
+
+    def profiled(*args: Any, **kwargs: Any) -> T:
+        profiler = _start_profiler()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _stop_profiler(profiler)
+            if profiler is not None:
+                timings.thread_profiles.append(profiler)
+
+    return profiled
+
+
+@dataclass
+class StoredProfile:
+    id: str
+    method: str
+    path: str
+    status: int
+    total_ms: float
+    server_timing: str
+    created_at: float
+    stats: bytes  # ``marshal`` de ``pstats.Stats.stats``: el formato de ``dump_stats``
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "method": self.method,
+            "path": self.path,
+            "status": self.status,
+            "total_ms": self.total_ms,
+            "server_timing": self.server_timing,
+            "created_at": self.created_at,
+        }
+
+    def as_text(self, *, sort: str = "cumulative", limit: int = 60) -> str:
+        output = io.StringIO()
+        stats = pstats.Stats(_StatsSource(marshal.loads(self.stats)), stream=output)
+        stats.sort_stats(sort).print_stats(limit)
+        return output.getvalue()
+
+
+class _StatsSource:
+    """Adaptador para que ``pstats.Stats`` cargue estadísticas ya deserializadas."""
+
+    def __init__(self, stats: Dict[Any, Any]) -> None:
+        self.stats = stats
+
+    def create_stats(self) -> None:
+        pass
+
+
+class ProfileStore:
+    """Últimos perfiles en memoria (y opcionalmente en disco)."""
+
+    def __init__(self, max_items: int, directory: Optional[str] = None) -> None:
+        self._items: "OrderedDict[str, StoredProfile]" = OrderedDict()
+        self._max_items = max_items
+        self._directory = Path(directory) if directory else None
+        self._lock = threading.Lock()
+
+    def add(self, profile: StoredProfile) -> None:
+        with self._lock:
+            self._items[profile.id] = profile
+            while len(self._items) > self._max_items:
+                self._items.popitem(last=False)
+        if self._directory is not None:
+            try:
+                self._directory.mkdir(parents=True, exist_ok=True)
+                (self._directory / f"{profile.id}.prof").write_bytes(profile.stats)
+            except OSError:
+                logger.exception("No se pudo guardar el perfil %s", profile.id)
+
+    def get(self, profile_id: str) -> Optional[StoredProfile]:
+        with self._lock:
+            return self._items.get(profile_id)
+
+    def list(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [profile.summary() for profile in reversed(self._items.values())]
+
+
+profile_store = ProfileStore(settings.profiling_max_stored, settings.profiling_dir)
+
+
+class ProfilingMiddleware:
+    """Middleware ASGI que perfila las peticiones pedidas por cabecera o por muestreo."""
+
+    def __init__(
+        self,
+        app: Any,
+        *,
+        api_key: str,
+        sample_rate: float = 0.0,
+        store: Optional[ProfileStore] = None,
+    ) -> None:
+        self.app = app
+        self._api_key = api_key.encode("latin-1")
+        self.sample_rate = sample_rate
+        self.store = store or profile_store
+
+    def _requested(self, scope: Dict[str, Any]) -> bool:
+        for name, value in scope.get("headers", []):
+            if name == PROFILE_HEADER:
+                return bool(self._api_key) and hmac.compare_digest(value, self._api_key)
+        return False
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http" or not (
+            self._requested(scope) or (self.sample_rate > 0 and random.random() < self.sample_rate)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = uuid.uuid4().hex
+        timings = RequestTimings()
+        token = _request_timings.set(timings)
+        state = {"status": 500, "server_timing": ""}
+        started = time.perf_counter()
+
+        async def send_with_timing(message: Dict[str, Any]) -> None:
+            if message["type"] == "http.response.start":
+                state["status"] = message["status"]
+                state["server_timing"] = timings.server_timing(time.perf_counter() - started)
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"server-timing", state["server_timing"].encode("latin-1")),
+                    (PROFILE_ID_HEADER.encode("latin-1"), profile_id.encode("latin-1")),
+                ]
+            await send(message)
+
+        # Con dos peticiones perfiladas a la vez, la segunda sólo perfila sus hilos.
+        profiler = _start_profiler()
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _stop_profiler(profiler)
+            total = time.perf_counter() - started
+            _request_timings.reset(token)
+            profiles = [*([profiler] if profiler is not None else []), *timings.thread_profiles]
+            stats = pstats.Stats(*profiles) if profiles else None
+            self.store.add(
+                StoredProfile(
+                    id=profile_id,
+                    method=scope["method"],
+                    path=scope["path"],
+                    status=state["status"],
+                    total_ms=round(total * 1000, 3),
+                    server_timing=state["server_timing"] or timings.server_timing(total),
+                    created_at=time.time(),
+                    stats=marshal.dumps(stats.stats if stats is not None else {}),
+                )
+            )
+            logger.info(
+                "Perfil %s de %s %s: %s", profile_id, scope["method"], scope["path"], state["server_timing"]
+            )
@@ -0,0 +1,301 @@
+"""Enrutamiento de lecturas a réplicas de PostgreSQL.
+
+Las sesiones son :class:`RoutingSession`: los ``SELECT`` se envían a una réplica
+sana (round-robin entre sesiones; la misma durante toda la sesión, para que la
+página y su conteo vean el mismo instante) y cualquier escritura,
+``SELECT ... FOR UPDATE`` o acceso directo a la conexión va al primario. Desde la
+primera escritura el resto de la sesión también usa el primario, para leer lo
+que acaba de escribir.
+
+Lo que se lee para publicarlo en Redis va al primario (:func:`primary_reads`):
+una réplica atrasada dejaría filas viejas en caché, con el sello de generación
+ya renovado, durante todo el TTL.
+
+Para que un cliente lea sus propias escrituras en peticiones posteriores (las
+réplicas van con algo de retraso), :class:`ReadYourWritesMiddleware` le deja una
+cookie tras cada escritura y, mientras dure, sus sesiones usan sólo el primario.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from http.cookies import SimpleCookie
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import psycopg
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Cookie con el instante (epoch) hasta el que el cliente lee del primario.
+STICKY_COOKIE = "articles_primary_until"
+
+
+def parse_replica_urls(value: Optional[str]) -> List[str]:
+    """``DATABASE_REPLICA_URLS`` separado por comas (vacío = sin réplicas)."""
+    return [url.strip() for url in (value or "").split(",") if url.strip()]
+
+
+class ReplicaSet:
+    """Réplicas de lectura con selección round-robin entre las sanas.
+
+    Una réplica se marca caída cuando se pierde o no se puede abrir una conexión
+    (evento ``handle_error``)
+    o el chequeo periódico de :class:`ReplicaHealthChecker`; vuelve a usarse
+    cuando el chequeo la encuentra disponible.
+    """
+
+    def __init__(self, engines: Sequence[Engine], urls: Sequence[str]) -> None:
+        self._engines = list(engines)
+        self.urls = list(urls)
+        self._healthy = [True] * len(self._engines)
+        self._counter = itertools.count()
+        for index, engine in enumerate(self._engines):
+            event.listen(engine, "handle_error", self._on_error(index))
+
+    def __len__(self) -> int:
+        return len(self._engines)
+
+    def _on_error(self, index: int):
+        def handle_error(context: Any) -> None:
+            # Sólo los fallos de conexión (caída o al conectar, sin ``connection``) la
+            # sacan de rotación; ``statement_timeout``, lock timeouts o errores de
+            # serialización también son ``OperationalError`` pero la réplica sigue sana.
+            failed_to_connect = context.connection is None and isinstance(
+                context.sqlalchemy_exception, OperationalError
+            )
+            if context.is_disconnect or failed_to_connect:
+                self.mark(index, healthy=False)
+
+        return handle_error
+
+    def mark(self, index: int, *, healthy: bool) -> None:
+        if self._healthy[index] != healthy:
+            logger.warning("Réplica %s %s", index, "disponible" if healthy else "marcada como caída")
+        self._healthy[index] = healthy
+
+    def choose(self) -> Optional[Engine]:
+        """Siguiente réplica sana, o ``None`` si no queda ninguna (se usa el primario)."""
+        total = len(self._engines)
+        start = next(self._counter)
+        for offset in range(total):
+            index = (start + offset) % total
+            if self._healthy[index]:
+                return self._engines[index]
+        return None
+
+    def is_healthy(self, engine: Engine) -> bool:
+        return any(
+            candidate is engine and healthy for candidate, healthy in zip(self._engines, self._healthy)
+        )
+
+    def status(self) -> List[Dict[str, Any]]:
+        return [
+            {"host": make_url(url).host, "healthy": healthy}
+            for url, healthy in zip(self.urls, self._healthy)
+        ]
+
+
+@dataclass
+class RequestRouting:
+    """Estado de enrutamiento de una petición HTTP.
+
+    ``force_primary`` viene de la cookie de lectura de las propias escrituras;
+    las sesiones activan ``wrote`` al escribir para que el middleware la renueve.
+    """
+
+    force_primary: bool = False
+    wrote: bool = False
+
+
+_request_routing: ContextVar[Optional[RequestRouting]] = ContextVar("request_routing", default=None)
+
+
+def current_routing() -> Optional[RequestRouting]:
+    return _request_routing.get()
+
+
+class RoutingSession(Session):
+    """``Session`` que elige el motor de cada sentencia (réplica o primario).
+
+    La réplica se elige en la primera lectura y se mantiene hasta ``close()``
+    (salvo que se marque caída): una sola conexión de réplica por sesión.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        replicas: Optional[ReplicaSet] = None,
+        routing: Optional[RequestRouting] = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self._replicas = replicas
+        self._routing = routing
+        self._use_primary = routing is not None and routing.force_primary
+        self._replica: Optional[Engine] = None
+        self._primary_reads = 0
+
+    @contextmanager
+    def reading_from_primary(self) -> Iterator[None]:
+        """Envía al primario las lecturas del bloque (sin fijar el resto de la sesión)."""
+        self._primary_reads += 1
+        try:
+            yield
+        finally:
+            self._primary_reads -= 1
+
+    def close(self) -> None:
+        super().close()
+        self._replica = None
+
+    def _current_replica(self) -> Optional[Engine]:
+        if self._replica is None or not self._replicas.is_healthy(self._replica):
+            self._replica = self._replicas.choose()
+        return self._replica
+
+    def get_bind(self, mapper: Any = None, clause: Any = None, **kwargs: Any) -> Any:
+        primary = super().get_bind(mapper=mapper, clause=clause, **kwargs)
+        if not self._replicas or self._use_primary:
+            return primary
+        is_read = (
+            clause is not None
+            and not getattr(clause, "is_dml", False)
+            and getattr(clause, "_for_update_arg", None) is None
+            and not self._flushing
+        )
+        if is_read:
+            if self._primary_reads:
+                return primary
+            return self._current_replica() or primary
+
+        # Escritura (o ``connection()`` sin sentencia): desde aquí todo va al primario.
+        self._use_primary = True
+        if self._routing is not None:
+            self._routing.wrote = True
+        return primary
+
+
+@contextmanager
+def primary_reads(session: Session) -> Iterator[None]:
+    """Lecturas que se van a cachear: al primario si ``session`` enruta a réplicas."""
+    if isinstance(session, RoutingSession):
+        with session.reading_from_primary():
+            yield
+    else:
+        yield
+
+
+class ReadYourWritesMiddleware:
+    """Middleware ASGI que fija al primario las lecturas de quien acaba de escribir."""
+
+    def __init__(self, app: Any, *, window_seconds: float) -> None:
+        self.app = app
+        self.window_seconds = window_seconds
+
+    @staticmethod
+    def _sticky_until(scope: Dict[str, Any]) -> float:
+        for name, value in scope.get("headers", []):
+            if name == b"cookie":
+                morsel = SimpleCookie(value.decode("latin-1")).get(STICKY_COOKIE)
+                if morsel is not None:
+                    try:
+                        return float(morsel.value)
+                    except ValueError:
+                        return 0.0
+        return 0.0
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        routing = RequestRouting(force_primary=self._sticky_until(scope) > time.time())
+        token = _request_routing.set(routing)
+
+        async def send_with_cookie(message: Dict[str, Any]) -> None:
+            if message["type"] == "http.response.start" and routing.wrote:
+                until = time.time() + self.window_seconds
+                cookie = (
+                    f"{STICKY_COOKIE}={until:.3f}; Max-Age={int(self.window_seconds) or 1}; "
+                    "Path=/; HttpOnly; SameSite=Lax"
+                )
+                message.setdefault("headers", [])
+                message["headers"] = [*message["headers"], (b"set-cookie", cookie.encode("latin-1"))]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_cookie)
+        finally:
+            _request_routing.reset(token)
+
+
+class ReplicaHealthChecker:
+    """Hilo que comprueba cada réplica con ``SELECT 1`` y actualiza su estado.
+
+    Usa conexiones psycopg propias (fuera de los pools) para servir igual a los
+    motores síncronos y asíncronos.
+    """
+
+    def __init__(self, replica_sets: Sequence[ReplicaSet], interval_seconds: float) -> None:
+        self._replica_sets = list(replica_sets)
+        self._interval = interval_seconds
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="replica-health", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        self._stop.set()
+        self._thread.join(timeout)
+
+    @staticmethod
+    def probe(url: str, timeout_seconds: int = 2) -> bool:
+        conninfo = make_url(url).set(drivername="postgresql").render_as_string(hide_password=False)
+        try:
+            with psycopg.connect(conninfo, connect_timeout=timeout_seconds) as connection:
+                connection.execute("SELECT 1")
+            return True
+        except psycopg.Error:
+            return False
+
+    def check(self) -> None:
+        for replica_set in self._replica_sets:
+            for index, url in enumerate(replica_set.urls):
+                replica_set.mark(index, healthy=self.probe(url))
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            self.check()
+
+
+_checker: Optional[ReplicaHealthChecker] = None
+
+
+def start_replica_health_checks(*replica_sets: Optional[ReplicaSet]) -> None:
+    """Arranca el chequeo periódico si hay réplicas configuradas."""
+    global _checker
+    active = [replica_set for replica_set in replica_sets if replica_set]
+    if not active or _checker is not None:
+        return
+    _checker = ReplicaHealthChecker(active, settings.replica_health_check_interval_seconds)
+    _checker.start()
+
+
+def stop_replica_health_checks() -> None:
+    global _checker
+    if _checker is not None:
+        _checker.stop()
+        _checker = None
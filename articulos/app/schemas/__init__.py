@@ -1,10 +1,33 @@
 """Exportaciones de esquemas Pydantic."""
 
-from .article import ArticleCreate, ArticleListResponse, ArticleResponse, ArticleUpdate
+from .article import (
+    ArticleBatchRequest,
+    ArticleBatchResponse,
+    ArticleBulkDeleteResponse,
+    ArticleBulkItem,
+    ArticleBulkResponse,
+    ArticleCreate,
+    ArticleListItem,
+    ArticleListResponse,
+    ArticleResponse,
+    ArticleSearchItem,
+    ArticleSearchResponse,
+    ArticleSummary,
+    ArticleUpdate,
+)
 
 __all__ = (
+    "ArticleBatchRequest",
+    "ArticleBatchResponse",
+    "ArticleBulkDeleteResponse",
+    "ArticleBulkItem",
+    "ArticleBulkResponse",
     "ArticleCreate",
     "ArticleUpdate",
     "ArticleResponse",
+    "ArticleSummary",
+    "ArticleListItem",
     "ArticleListResponse",
+    "ArticleSearchItem",
+    "ArticleSearchResponse",
 )
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
@@ -66,10 +66,91 @@ class ArticleResponse(ArticleBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class ArticleSummary(BaseModel):
+    """Vista compacta sin ``body`` (``fields=summary``)."""
+
+    id: str
+    title: str
+    tags: List[str] = Field(default_factory=list)
+    author: str
+    published_at: Optional[datetime] = None
+
+
+class ArticleListItem(BaseModel):
+    """Artículo proyectado: con ``fields`` sólo se incluyen los campos pedidos."""
+
+    id: str
+    title: Optional[str] = None
+    body: Optional[str] = None
+    tags: Optional[List[str]] = None
+    author: Optional[str] = None
+    published_at: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
 class ArticleListResponse(BaseModel):
     """Respuesta para listados paginados."""
 
-    items: List[ArticleResponse]
-    total: int
+    items: List[ArticleListItem]
+    # ``None`` cuando se pide ``total=none``; aproximado con ``total=estimate``.
+    total: Optional[int]
     limit: int
     skip: int
+    # Cursor opaco para pedir la siguiente página (``None`` si no hay más).
+    next_cursor: Optional[str] = None
+
+
+class ArticleBulkItem(BaseModel):
+    """Resultado de un elemento de ``POST /articles/bulk`` (``index`` = posición en el lote)."""
+
+    index: int
+    status: Literal["created", "updated", "conflict", "invalid"]
+    id: Optional[str] = None
+    error: Optional[str] = None
+
+
+class ArticleBulkResponse(BaseModel):
+    """Resumen de una carga masiva con el detalle por elemento."""
+
+    created: int
+    updated: int
+    conflicts: int
+    invalid: int
+    items: List[ArticleBulkItem]
+
+
+class ArticleBatchRequest(BaseModel):
+    """Cuerpo de ``POST /articles/batch``."""
+
+    ids: List[str] = Field(min_length=1, max_length=100)
+
+
+class ArticleBatchResponse(BaseModel):
+    """Artículos en el orden pedido y los IDs que no se encontraron."""
+
+    items: List[ArticleResponse]
+    missing: List[str]
+
+
+class ArticleSearchItem(ArticleSummary):
+    """Resultado de ``GET /articles/search``: resumen, relevancia y fragmento del cuerpo."""
+
+    rank: float
+    # Fragmento de ``ts_headline`` con los términos encontrados entre ``<mark>``.
+    snippet: str
+
+
+class ArticleSearchResponse(BaseModel):
+    """Resultados ordenados por relevancia."""
+
+    items: List[ArticleSearchItem]
+    limit: int
+    next_cursor: Optional[str] = None
+
+
+class ArticleBulkDeleteResponse(BaseModel):
+    """Resultado de un borrado masivo: cuántos y cuáles artículos se eliminaron."""
+
+    deleted: int
+    ids: List[str]
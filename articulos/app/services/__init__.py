@@ -1,10 +1,12 @@
 """Paquete de servicios de dominio."""
 
-from .article_service import ArticleService
-from .exceptions import ArticleAlreadyExistsError, ArticleNotFoundError
+from .article_service import ArticleService, AsyncArticleService
+from .exceptions import ArticleAlreadyExistsError, ArticleNotFoundError, InvalidCursorError
 
 __all__ = (
     "ArticleService",
+    "AsyncArticleService",
     "ArticleAlreadyExistsError",
     "ArticleNotFoundError",
+    "InvalidCursorError",
 )
@@ -3,26 +3,51 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+import time
+import uuid
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from enum import Enum
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
+from pydantic import TypeAdapter
+from sqlalchemy import Row
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from typing_extensions import TypedDict
 
-from app.cache import ArticleCache
+from app.cache import ArticleCache, should_refresh_early
+from app.crud.article import columns_for
+from app.concurrency import run_in_greenlet
+from app.config import settings
 from app.models.article import Article
+from app.profiling import measure
+from app.replicas import primary_reads
 
-from .exceptions import ArticleAlreadyExistsError, ArticleNotFoundError
+from .exceptions import ArticleAlreadyExistsError, ArticleNotFoundError, InvalidCursorError
+from .pagination import (
+    Cursor,
+    SearchCursor,
+    decode_cursor,
+    decode_search_cursor,
+    encode_cursor,
+    encode_search_cursor,
+    search_fingerprint,
+)
 
 
 @dataclass(slots=True)
 class ArticleDTO:
-    """Representación serializable de un artículo."""
+    """Representación serializable de un artículo.
+
+    En lecturas proyectadas (``fields``) los campos no seleccionados quedan en ``None``.
+    """
 
     id: str
     title: str
-    body: str
+    body: Optional[str]
     tags: List[str]
     author: str
     published_at: Optional[datetime]
@@ -42,29 +67,193 @@ class ArticleDTO:
             updated_at=article.updated_at,
         )
 
+    @classmethod
+    def from_row(cls, row: Row) -> "ArticleDTO":
+        """Construye el DTO desde una fila Core (``select`` de columnas)."""
+        data = row._mapping
+        return cls(
+            id=str(data["id"]),
+            title=data.get("title"),
+            body=data.get("body"),
+            tags=list(data.get("tags") or []),
+            author=data.get("author"),
+            published_at=data.get("published_at"),
+            created_at=data.get("created_at"),
+            updated_at=data.get("updated_at"),
+        )
+
     @classmethod
     def from_dict(cls, payload: Dict[str, Any]) -> "ArticleDTO":
         return cls(
             id=payload["id"],
-            title=payload["title"],
-            body=payload["body"],
-            tags=list(payload.get("tags", [])),
-            author=payload["author"],
-            published_at=(
-                datetime.fromisoformat(payload["published_at"])
-                if payload.get("published_at")
-                else None
-            ),
-            created_at=datetime.fromisoformat(payload["created_at"]),
-            updated_at=datetime.fromisoformat(payload["updated_at"]),
+            title=payload.get("title"),
+            body=payload.get("body"),
+            tags=list(payload.get("tags") or []),
+            author=payload.get("author"),
+            published_at=_parse_datetime(payload.get("published_at")),
+            created_at=_parse_datetime(payload.get("created_at")),
+            updated_at=_parse_datetime(payload.get("updated_at")),
         )
 
     def to_dict(self) -> Dict[str, Any]:
-        data = asdict(self)
-        data["published_at"] = self.published_at.isoformat() if self.published_at else None
-        data["created_at"] = self.created_at.isoformat()
-        data["updated_at"] = self.updated_at.isoformat()
-        return data
+        # Sin ``dataclasses.asdict``: evita su copia profunda recursiva.
+        return {
+            "id": self.id,
+            "title": self.title,
+            "body": self.body,
+            "tags": list(self.tags),
+            "author": self.author,
+            "published_at": self.published_at.isoformat() if self.published_at else None,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+        }
+
+    def project(self, fields: Optional[Iterable[str]]) -> Dict[str, Any]:
+        """``to_dict`` limitado a ``fields`` (``id`` siempre incluido)."""
+        data = self.to_dict()
+        if fields is None:
+            return data
+        wanted = set(fields) | {"id"}
+        return {name: value for name, value in data.items() if name in wanted}
+
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+ARTICLE_FIELDS = frozenset(ArticleDTO.__dataclass_fields__)
+
+
+def normalize_fields(fields: Optional[Iterable[str]]) -> Optional[Tuple[str, ...]]:
+    """Proyección canónica (ordenada, con ``id``); ``None`` si se piden todos los campos."""
+    if fields is None:
+        return None
+    selected = frozenset(fields) | {"id"}
+    if selected >= ARTICLE_FIELDS:
+        return None
+    return tuple(sorted(selected))
+
+
+def render_article(dto: ArticleDTO, fields: Optional[Iterable[str]] = None) -> bytes:
+    """Cuerpo JSON exacto que devolvería ``GET /articles/{id}`` para ``dto``.
+
+    Con ``fields`` sólo se incluyen esos campos (ver :func:`normalize_fields`).
+    """
+    with measure("serialize"):
+        return _ARTICLE_ADAPTER.dump_json(dto, include=_included(fields))
+
+
+class _LatencyEstimate:
+    """Promedio móvil exponencial de una latencia (segundos)."""
+
+    def __init__(self, initial: float, alpha: float = 0.2) -> None:
+        self.value = initial
+        self._alpha = alpha
+
+    def observe(self, seconds: float) -> None:
+        self.value += self._alpha * (seconds - self.value)
+
+
+# Costo estimado de recalcular un artículo; alimenta el refresco anticipado (XFetch).
+_db_read_seconds = _LatencyEstimate(initial=0.005)
+
+
+class TotalMode(str, Enum):
+    """Cómo calcular el ``total`` de un listado."""
+
+    EXACT = "exact"  # COUNT(*) exacto, cacheado en Redis por combinación de filtros.
+    ESTIMATE = "estimate"  # Estimación del planner / pg_class.reltuples.
+    NONE = "none"  # No se calcula.
+
+
+@dataclass(slots=True)
+class ArticlePage:
+    """Página de un listado: elementos, total y cursor de la siguiente página."""
+
+    items: List[ArticleDTO]
+    total: Optional[int]
+    next_cursor: Optional[str] = None
+
+
+@dataclass(slots=True)
+class RenderedArticle:
+    """Cuerpo JSON cacheado y su ``updated_at`` (para ETag/Last-Modified)."""
+
+    body: bytes
+    updated_at: Optional[datetime] = None
+
+
+@dataclass(slots=True)
+class ArticleBatch:
+    """Artículos pedidos por ID en el orden solicitado y los IDs que no existen."""
+
+    items: List[ArticleDTO]
+    missing: List[str]
+
+
+class _PageBody(TypedDict):
+    """Cuerpo de un listado; ``TypedDict`` de ``typing_extensions``, como exige pydantic."""
+
+    items: List[ArticleDTO]
+    total: Optional[int]
+    limit: int
+    skip: int
+    next_cursor: Optional[str]
+
+
+# Los DTO salen del servicio ya validados: se serializan directamente a JSON con
+# adaptadores construidos una sola vez, sin ``to_dict`` ni modelos intermedios.
+# El JSON coincide con el de los esquemas de ``app.schemas`` (``response_model``).
+_ARTICLE_ADAPTER = TypeAdapter(ArticleDTO)
+_PAGE_ADAPTER = TypeAdapter(_PageBody)
+_BATCH_ADAPTER = TypeAdapter(ArticleBatch)
+_PAGE_KEYS = {"total": True, "limit": True, "skip": True, "next_cursor": True}
+
+
+def _included(fields: Optional[Iterable[str]]) -> Optional[set]:
+    """``include`` de pydantic para una proyección (``id`` siempre incluido)."""
+    return None if fields is None else set(fields) | {"id"}
+
+
+def render_page(
+    page: ArticlePage,
+    *,
+    limit: int,
+    skip: int,
+    fields: Optional[Iterable[str]] = None,
+) -> bytes:
+    """Cuerpo JSON de ``GET /articles/`` (esquema ``ArticleListResponse``)."""
+    body = {
+        "items": page.items,
+        "total": page.total,
+        "limit": limit,
+        "skip": skip,
+        "next_cursor": page.next_cursor,
+    }
+    include = None if fields is None else {**_PAGE_KEYS, "items": {"__all__": _included(fields)}}
+    with measure("serialize"):
+        return _PAGE_ADAPTER.dump_json(body, include=include)
+
+
+def render_batch(batch: ArticleBatch) -> bytes:
+    """Cuerpo JSON de ``/articles/batch`` (esquema ``ArticleBatchResponse``)."""
+    with measure("serialize"):
+        return _BATCH_ADAPTER.dump_json(batch)
+
+
+@dataclass(slots=True)
+class SearchHit:
+    """Resultado de una búsqueda: artículo sin cuerpo, relevancia y fragmento resaltado."""
+
+    article: ArticleDTO
+    rank: float
+    snippet: str
+
+
+@dataclass(slots=True)
+class SearchPage:
+    items: List[SearchHit]
+    next_cursor: Optional[str] = None
 
 
 @dataclass(slots=True)
@@ -76,6 +265,22 @@ class ArticleCreateData:
     published_at: Optional[datetime] = None
 
 
+class BulkStatus(str, Enum):
+    """Resultado de cada elemento de una carga masiva."""
+
+    CREATED = "created"
+    UPDATED = "updated"
+    CONFLICT = "conflict"
+    INVALID = "invalid"
+
+
+@dataclass(slots=True)
+class BulkItemResult:
+    status: BulkStatus
+    article: Optional[ArticleDTO] = None
+    error: Optional[str] = None
+
+
 @dataclass(slots=True)
 class ArticleUpdateData:
     title: Optional[str] = None
@@ -96,75 +301,436 @@ class ArticleService:
     ) -> None:
         from app.crud.article import ArticleRepository
 
+        self._session = session
         self._repository = ArticleRepository(session)
         self._cache = cache
 
+    def _filling_cache(self) -> AbstractContextManager[None]:
+        """Lo que se va a publicar en caché se lee del primario, nunca de una réplica."""
+        if self._cache is None:
+            return nullcontext()
+        return primary_reads(self._session)
+
     def _store_in_cache(self, dto: ArticleDTO) -> None:
         if self._cache is not None:
-            self._cache.set(dto.id, dto.to_dict())
+            rendered = render_article(dto) if settings.cache_response_bytes else None
+            self._cache.set(dto.id, dto.to_dict(), rendered=rendered)
+
+    def _store_many_in_cache(self, dtos: Sequence[ArticleDTO]) -> None:
+        if self._cache is not None and dtos:
+            rendered = (
+                {dto.id: render_article(dto) for dto in dtos}
+                if settings.cache_response_bytes
+                else None
+            )
+            self._cache.set_many({dto.id: dto.to_dict() for dto in dtos}, rendered=rendered)
 
     def _evict_cache(self, article_id: str) -> None:
         if self._cache is not None:
             self._cache.invalidate(article_id)
 
-    def create(self, data: ArticleCreateData) -> ArticleDTO:
-        article = Article(
-            title=data.title,
-            body=data.body,
-            tags=data.tags,
-            author=data.author,
-            published_at=data.published_at,
-        )
+    def _invalidate_listings(self, authors: Iterable[str], tags: Iterable[str]) -> None:
+        """Invalida conteos cacheados de los autores/etiquetas afectados por una escritura."""
+        if self._cache is not None:
+            self._cache.bump_generations(authors=authors, tags=tags)
+
+    def _count(
+        self,
+        *,
+        author: Optional[str],
+        tags: Sequence[str],
+        tag_mode: str,
+        mode: TotalMode,
+    ) -> Optional[int]:
+        if mode is TotalMode.NONE:
+            return None
+        if mode is TotalMode.ESTIMATE:
+            return self._repository.estimate_count(author=author, tags=tags, tag_mode=tag_mode)
+
+        stamp = None
+        if self._cache is not None:
+            cached, stamp = self._cache.get_count(author=author, tags=tags, tag_mode=tag_mode)
+            if cached is not None:
+                return cached
+        with self._filling_cache():
+            total = self._repository.count(author=author, tags=tags, tag_mode=tag_mode)
+        if self._cache is not None:
+            self._cache.set_count(
+                author=author, tags=tags, tag_mode=tag_mode, total=total, stamp=stamp
+            )
+        return total
 
-        self._repository.create(article)
+    def create(self, data: ArticleCreateData) -> ArticleDTO:
         try:
+            row = self._repository.insert_row(
+                {
+                    "title": data.title,
+                    "body": data.body,
+                    "tags": data.tags,
+                    "author": data.author,
+                    "published_at": data.published_at,
+                }
+            )
             self._repository.save()
         except IntegrityError as exc:
             raise ArticleAlreadyExistsError("Ya existe un artículo con el mismo título y autor") from exc
 
-        self._repository.refresh(article)
-        dto = ArticleDTO.from_model(article)
+        dto = ArticleDTO.from_row(row)
         self._store_in_cache(dto)
+        self._invalidate_listings([dto.author], dto.tags)
         return dto
 
-    def get(self, article_id: str) -> ArticleDTO:
+    def bulk_create(
+        self,
+        items: Sequence[ArticleCreateData],
+        *,
+        update_existing: bool = False,
+    ) -> List[BulkItemResult]:
+        """Crea varios artículos en una transacción; devuelve un resultado por elemento.
+
+        Usa ``INSERT ... ON CONFLICT (title, author)`` multi-fila (o ``COPY`` desde
+        ``BULK_COPY_THRESHOLD`` filas). Con ``update_existing`` los conflictos
+        actualizan el artículo existente; si no, se reportan como ``conflict``.
+        """
+        results: List[Optional[BulkItemResult]] = [None] * len(items)
+        positions: Dict[Tuple[str, str], int] = {}
+        rows: List[Dict[str, Any]] = []
+        for index, data in enumerate(items):
+            key = (data.title, data.author)
+            if key in positions:
+                results[index] = BulkItemResult(
+                    BulkStatus.CONFLICT, error="Título y autor repetidos dentro del lote"
+                )
+                continue
+            positions[key] = index
+            rows.append(
+                {
+                    "id": uuid.uuid4(),
+                    "title": data.title,
+                    "body": data.body,
+                    "tags": data.tags,
+                    "author": data.author,
+                    "published_at": data.published_at,
+                }
+            )
+
+        # Las etiquetas previas de los artículos que se van a sobrescribir también se invalidan.
+        previous_tags = (
+            self._repository.tags_by_title_author(list(positions)) if update_existing else {}
+        )
+        insert = (
+            self._repository.copy_many
+            if len(rows) >= settings.bulk_copy_threshold
+            else self._repository.insert_many
+        )
+        written = insert(rows, update_on_conflict=update_existing) if rows else []
+        self._repository.save()
+
+        dtos = []
+        for row in written:
+            dto = ArticleDTO.from_row(row)
+            status = BulkStatus.CREATED if row.inserted else BulkStatus.UPDATED
+            results[positions[(dto.title, dto.author)]] = BulkItemResult(status, article=dto)
+            dtos.append(dto)
+        self._store_many_in_cache(dtos)
+        if dtos:
+            stale_tags = {tag for dto in dtos for tag in dto.tags}
+            for tags in previous_tags.values():
+                stale_tags.update(tags)
+            self._invalidate_listings({dto.author for dto in dtos}, stale_tags)
+
+        return [
+            result
+            or BulkItemResult(
+                BulkStatus.CONFLICT, error="Ya existe un artículo con el mismo título y autor"
+            )
+            for result in results
+        ]
+
+    def _load(self, article_id: str) -> ArticleDTO:
+        """Lee el artículo de PostgreSQL y lo publica en caché."""
+        started = time.perf_counter()
+        with self._filling_cache():
+            row = self._repository.get_row(article_id)
+        _db_read_seconds.observe(time.perf_counter() - started)
+        if row is None:
+            raise ArticleNotFoundError("Artículo no encontrado")
+
+        dto = ArticleDTO.from_row(row)
+        self._store_in_cache(dto)
+        return dto
+
+    def _get_projection(self, article_id: str, fields: Tuple[str, ...]) -> ArticleDTO:
+        """Lectura de sólo algunos campos: sólo esas columnas llegan desde PostgreSQL.
+
+        Si el artículo completo ya está en caché se proyecta desde ahí; si no, la
+        proyección se cachea aparte (``article:{id}:fields``).
+        """
         if self._cache is not None:
             cached = self._cache.get(article_id)
-            if cached:
+            if cached is None:
+                cached = self._cache.get_projection(article_id, fields)
+            if cached is not None:
                 return ArticleDTO.from_dict(cached)
 
-        article = self._repository.get(article_id)
-        if article is None:
+        with self._filling_cache():
+            row = self._repository.get_row(article_id, columns=columns_for(fields))
+        if row is None:
             raise ArticleNotFoundError("Artículo no encontrado")
-
-        dto = ArticleDTO.from_model(article)
-        self._store_in_cache(dto)
+        dto = ArticleDTO.from_row(row)
+        if self._cache is not None:
+            # ``updated_at`` viaja con la proyección para poder calcular su ETag.
+            self._cache.set_projection(article_id, fields, dto.project([*fields, "updated_at"]))
         return dto
 
+    def get(self, article_id: str, *, fields: Optional[Iterable[str]] = None) -> ArticleDTO:
+        projection = normalize_fields(fields)
+        if projection is not None:
+            return self._get_projection(article_id, projection)
+        if self._cache is None:
+            return self._load(article_id)
+
+        cached, remaining = self._cache.get_entry(article_id)
+        if cached and not should_refresh_early(
+            remaining, _db_read_seconds.value, settings.cache_xfetch_beta
+        ):
+            return ArticleDTO.from_dict(cached)
+
+        # Single-flight: sólo quien obtiene el lock consulta PostgreSQL.
+        token = self._cache.acquire_lock(article_id)
+        if token is None:
+            if cached:
+                # Otro proceso ya está refrescando; el valor actual sigue vigente.
+                return ArticleDTO.from_dict(cached)
+            cached = self._cache.wait_for(article_id)
+            if cached:
+                return ArticleDTO.from_dict(cached)
+            return self._load(article_id)
+
+        try:
+            # Quien tenía el lock antes pudo haber publicado (o renovado) la clave.
+            current, current_remaining = self._cache.get_entry(article_id)
+            if current and (not cached or current_remaining > remaining):
+                return ArticleDTO.from_dict(current)
+            return self._load(article_id)
+        finally:
+            self._cache.release_lock(article_id, token)
+
+    def get_rendered(self, article_id: str) -> Optional[RenderedArticle]:
+        """Camino rápido de lectura: el cuerpo JSON cacheado, o ``None`` si hay que ir a :meth:`get`.
+
+        También devuelve ``None`` cuando XFetch decide refrescar, para que la
+        recarga pase por el lock de :meth:`get`.
+        """
+        if self._cache is None or not settings.cache_response_bytes:
+            return None
+        rendered, remaining, updated_at = self._cache.get_rendered(article_id)
+        if rendered is None or should_refresh_early(
+            remaining, _db_read_seconds.value, settings.cache_xfetch_beta
+        ):
+            return None
+        return RenderedArticle(body=rendered, updated_at=_parse_datetime(updated_at))
+
+    def get_last_modified(self, article_id: str) -> Optional[datetime]:
+        """``updated_at`` según la caché, sin tocar PostgreSQL (``None`` si no está)."""
+        if self._cache is None:
+            return None
+        return _parse_datetime(self._cache.get_last_modified(article_id))
+
     def list(
         self,
         *,
         skip: int = 0,
         limit: int = 50,
         author: Optional[str] = None,
-        tag: Optional[str] = None,
+        tags: Sequence[str] = (),
+        tag_mode: str = "all",
         order_desc: bool = True,
-    ) -> Tuple[List[ArticleDTO], int]:
-        articles = self._repository.list(
-            skip=skip,
-            limit=limit,
+        cursor: Optional[str] = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+        fields: Optional[Iterable[str]] = None,
+    ) -> ArticlePage:
+        """Página de artículos; con ``fields`` PostgreSQL sólo lee esas columnas.
+
+        Las páginas completas se cachean como IDs que se hidratan desde
+        ``article:{id}``. Las proyectadas guardan sus elementos en la propia
+        entrada del listado (su clave incluye ``fields``) y nunca se publican como
+        artículos.
+        """
+        projection = normalize_fields(fields)
+        after = None
+        if cursor is not None:
+            position = decode_cursor(cursor)
+            if position.order_desc != order_desc:
+                raise InvalidCursorError("El cursor no corresponde al orden solicitado")
+            after = (position.published_at, position.article_id)
+
+        query = {
+            "author": author,
+            "tags": sorted(set(tags)),
+            "tag_mode": tag_mode,
+            "order_desc": order_desc,
+            "skip": 0 if after is not None else skip,
+            "limit": limit,
+            "cursor": cursor,
+            "total": total_mode.value,
+            "fields": list(projection) if projection else None,
+        }
+        stamp = None
+        if self._cache is not None:
+            cached, stamp = self._cache.get_listing(query, author=author, tags=tags)
+            if cached is not None and projection is not None:
+                return ArticlePage(
+                    items=[ArticleDTO.from_dict(item) for item in cached["items"]],
+                    total=cached["total"],
+                    next_cursor=cached["next"],
+                )
+            if cached is not None:
+                found = self.get_many(cached["ids"])
+                if len(found) == len(set(cached["ids"])):
+                    return ArticlePage(
+                        items=[found[article_id] for article_id in cached["ids"]],
+                        total=cached["total"],
+                        next_cursor=cached["next"],
+                    )
+
+        # Se pide un elemento extra para saber si existe una página siguiente.
+        with self._filling_cache():
+            articles = self._repository.list(
+                skip=skip,
+                limit=limit + 1,
+                author=author,
+                tags=tags,
+                tag_mode=tag_mode,
+                order_desc=order_desc,
+                after=after,
+                columns=columns_for(projection),
+            )
+        has_more = len(articles) > limit
+        articles = articles[:limit]
+        next_cursor = None
+        if has_more:
+            last = articles[-1]
+            next_cursor = encode_cursor(
+                Cursor(published_at=last.published_at, article_id=last.id, order_desc=order_desc)
+            )
+
+        if total_mode is TotalMode.EXACT and after is None and skip == 0 and not has_more:
+            # La primera página ya contiene todos los resultados: no hace falta COUNT.
+            total: Optional[int] = len(articles)
+        else:
+            total = self._count(author=author, tags=tags, tag_mode=tag_mode, mode=total_mode)
+
+        items = [ArticleDTO.from_row(row) for row in articles]
+        if self._cache is not None:
+            page: Dict[str, Any] = {"ids": [dto.id for dto in items], "total": total, "next": next_cursor}
+            if projection is None:
+                self._store_many_in_cache(items)
+            else:
+                page["items"] = [dto.project(projection) for dto in items]
+            self._cache.set_listing(query, page, stamp=stamp)
+        return ArticlePage(items=items, total=total, next_cursor=next_cursor)
+
+    def search(
+        self,
+        query: str,
+        *,
+        limit: int = 20,
+        author: Optional[str] = None,
+        tags: Sequence[str] = (),
+        tag_mode: str = "all",
+        cursor: Optional[str] = None,
+    ) -> SearchPage:
+        """Búsqueda de texto completo por relevancia; no pasa por la caché."""
+        fingerprint = search_fingerprint(query, author=author, tags=tags, tag_mode=tag_mode)
+        after = None
+        if cursor is not None:
+            position = decode_search_cursor(cursor)
+            if position.query != fingerprint:
+                raise InvalidCursorError("El cursor no corresponde a esta búsqueda")
+            after = (position.rank, position.article_id)
+
+        rows = self._repository.search(
+            query,
+            limit=limit + 1,
             author=author,
-            tag=tag,
-            order_desc=order_desc,
+            tags=tags,
+            tag_mode=tag_mode,
+            after=after,
+        )
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        next_cursor = None
+        if has_more:
+            last = rows[-1]
+            next_cursor = encode_search_cursor(
+                SearchCursor(rank=last.rank, article_id=last.id, query=fingerprint)
+            )
+        return SearchPage(
+            items=[
+                SearchHit(article=ArticleDTO.from_row(row), rank=row.rank, snippet=row.snippet)
+                for row in rows
+            ],
+            next_cursor=next_cursor,
         )
-        total = self._repository.count(author=author, tag=tag)
-        return [ArticleDTO.from_model(article) for article in articles], total
 
-    def update(self, article_id: str, data: ArticleUpdateData) -> ArticleDTO:
-        article = self._repository.get(article_id)
-        if article is None:
-            raise ArticleNotFoundError("Artículo no encontrado")
+    def get_many(self, article_ids: Sequence[str]) -> Dict[str, ArticleDTO]:
+        """Obtiene varios artículos: un ``MGET`` en caché y un solo ``IN`` para los faltantes.
+
+        Devuelve un diccionario por ID; los que no existen simplemente no aparecen.
+        """
+        found: Dict[str, ArticleDTO] = {}
+        if self._cache is not None:
+            for article_id, payload in self._cache.get_many(article_ids).items():
+                found[article_id] = ArticleDTO.from_dict(payload)
+
+        missing = [article_id for article_id in dict.fromkeys(article_ids) if article_id not in found]
+        if missing:
+            with self._filling_cache():
+                rows = self._repository.get_many(missing)
+            loaded = [ArticleDTO.from_row(row) for row in rows]
+            self._store_many_in_cache(loaded)
+            found.update((dto.id, dto) for dto in loaded)
+        return found
+
+    def reload(self, article_ids: Sequence[str]) -> List[str]:
+        """Relee los artículos de PostgreSQL y los publica en caché (precarga y refresco).
+
+        A diferencia de :meth:`get_many` no consulta la caché antes. Devuelve los
+        IDs que existen.
+        """
+        with self._filling_cache():
+            rows = self._repository.get_many(article_ids)
+        loaded = [ArticleDTO.from_row(row) for row in rows]
+        self._store_many_in_cache(loaded)
+        return [dto.id for dto in loaded]
+
+    def get_batch(self, article_ids: Sequence[str]) -> ArticleBatch:
+        """Lee varios artículos respetando el orden pedido (sin repetidos).
+
+        Los IDs inválidos o inexistentes se reportan en ``missing`` tal como llegaron.
+        """
+        requested: Dict[str, str] = {}
+        missing: List[str] = []
+        for article_id in article_ids:
+            try:
+                canonical = str(uuid.UUID(str(article_id)))
+            except ValueError:
+                missing.append(article_id)
+                continue
+            requested.setdefault(canonical, article_id)
+
+        found = self.get_many(list(requested))
+        items = []
+        for canonical, original in requested.items():
+            if canonical in found:
+                items.append(found[canonical])
+            else:
+                missing.append(original)
+        return ArticleBatch(items=items, missing=missing)
 
+    def update(self, article_id: str, data: ArticleUpdateData) -> ArticleDTO:
+        """Un único ``UPDATE ... RETURNING``; la ausencia de fila significa 404."""
         fields: Dict[str, Any] = {}
         if data.title is not None:
             fields["title"] = data.title
@@ -176,23 +742,170 @@ class ArticleService:
             fields["author"] = data.author
         if data.published_at is not None:
             fields["published_at"] = data.published_at
+        if not fields:
+            # Nada que escribir: se responde con el artículo actual (caché primero).
+            return self.get(article_id)
 
-        self._repository.update(article, **fields)
         try:
+            row = self._repository.update_row(article_id, fields)
+            if row is None:
+                raise ArticleNotFoundError("Artículo no encontrado")
             self._repository.save()
         except IntegrityError as exc:
             raise ArticleAlreadyExistsError("Ya existe un artículo con el mismo título y autor") from exc
 
-        self._repository.refresh(article)
-        dto = ArticleDTO.from_model(article)
+        dto = ArticleDTO.from_row(row)
         self._store_in_cache(dto)
+        # Autor/etiquetas previos: los listados que los incluían también cambian.
+        self._invalidate_listings(
+            [row.previous_author, dto.author], [*(row.previous_tags or []), *dto.tags]
+        )
         return dto
 
     def delete(self, article_id: str) -> None:
-        article = self._repository.get(article_id)
-        if article is None:
+        """Un único ``DELETE ... RETURNING``; sin fila devuelta el artículo no existía."""
+        row = self._repository.delete_row(article_id)
+        if row is None:
             raise ArticleNotFoundError("Artículo no encontrado")
+        self._repository.save()
+        self._evict_cache(str(row.id))
+        self._invalidate_listings([row.author], row.tags or [])
 
-        self._repository.delete(article)
+    def delete_many(
+        self,
+        *,
+        article_ids: Sequence[str] = (),
+        author: Optional[str] = None,
+        tags: Sequence[str] = (),
+        tag_mode: str = "all",
+    ) -> List[str]:
+        """Borra por IDs y/o filtros y desaloja todas las claves en un solo pipeline.
+
+        Devuelve los IDs efectivamente borrados.
+        """
+        rows = self._repository.delete_many(
+            article_ids=article_ids, author=author, tags=tags, tag_mode=tag_mode
+        )
         self._repository.save()
-        self._evict_cache(article_id)
+        deleted = [str(row.id) for row in rows]
+        if self._cache is not None and deleted:
+            self._cache.invalidate_many(deleted)
+            self._invalidate_listings(
+                {row.author for row in rows}, {tag for row in rows for tag in row.tags or []}
+            )
+        return deleted
+
+
+class AsyncArticleService:
+    """Versión asíncrona del servicio usada cuando ``ASYNC_MODE`` está activo.
+
+    Reutiliza :class:`ArticleService` sobre ``AsyncSession.sync_session``: cada
+    método corre dentro de un greenlet, por lo que la E/S de PostgreSQL y Redis
+    se espera en el event loop sin ocupar hilos del threadpool. El trabajo de
+    CPU (mapear filas, codecs, renderizar JSON) sigue corriendo en el event loop.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        *,
+        cache: Optional[ArticleCache] = None,
+    ) -> None:
+        self._service = ArticleService(session.sync_session, cache=cache)
+        self._repository = self._service._repository
+
+    async def create(self, data: ArticleCreateData) -> ArticleDTO:
+        return await run_in_greenlet(self._service.create, data)
+
+    async def bulk_create(
+        self, items: Sequence[ArticleCreateData], *, update_existing: bool = False
+    ) -> List[BulkItemResult]:
+        return await run_in_greenlet(
+            self._service.bulk_create, items, update_existing=update_existing
+        )
+
+    async def get(self, article_id: str, *, fields: Optional[Iterable[str]] = None) -> ArticleDTO:
+        return await run_in_greenlet(self._service.get, article_id, fields=fields)
+
+    async def get_rendered(self, article_id: str) -> Optional[RenderedArticle]:
+        return await run_in_greenlet(self._service.get_rendered, article_id)
+
+    async def get_last_modified(self, article_id: str) -> Optional[datetime]:
+        return await run_in_greenlet(self._service.get_last_modified, article_id)
+
+    async def list(
+        self,
+        *,
+        skip: int = 0,
+        limit: int = 50,
+        author: Optional[str] = None,
+        tags: Sequence[str] = (),
+        tag_mode: str = "all",
+        order_desc: bool = True,
+        cursor: Optional[str] = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+        fields: Optional[Iterable[str]] = None,
+    ) -> ArticlePage:
+        return await run_in_greenlet(
+            self._service.list,
+            skip=skip,
+            limit=limit,
+            author=author,
+            tags=tags,
+            tag_mode=tag_mode,
+            order_desc=order_desc,
+            cursor=cursor,
+            total_mode=total_mode,
+            fields=fields,
+        )
+
+    async def search(
+        self,
+        query: str,
+        *,
+        limit: int = 20,
+        author: Optional[str] = None,
+        tags: Sequence[str] = (),
+        tag_mode: str = "all",
+        cursor: Optional[str] = None,
+    ) -> SearchPage:
+        return await run_in_greenlet(
+            self._service.search,
+            query,
+            limit=limit,
+            author=author,
+            tags=tags,
+            tag_mode=tag_mode,
+            cursor=cursor,
+        )
+
+    async def get_many(self, article_ids: Sequence[str]) -> Dict[str, ArticleDTO]:
+        return await run_in_greenlet(self._service.get_many, article_ids)
+
+    async def reload(self, article_ids: Sequence[str]) -> List[str]:
+        return await run_in_greenlet(self._service.reload, article_ids)
+
+    async def get_batch(self, article_ids: Sequence[str]) -> ArticleBatch:
+        return await run_in_greenlet(self._service.get_batch, article_ids)
+
+    async def update(self, article_id: str, data: ArticleUpdateData) -> ArticleDTO:
+        return await run_in_greenlet(self._service.update, article_id, data)
+
+    async def delete(self, article_id: str) -> None:
+        await run_in_greenlet(self._service.delete, article_id)
+
+    async def delete_many(
+        self,
+        *,
+        article_ids: Sequence[str] = (),
+        author: Optional[str] = None,
+        tags: Sequence[str] = (),
+        tag_mode: str = "all",
+    ) -> List[str]:
+        return await run_in_greenlet(
+            self._service.delete_many,
+            article_ids=article_ids,
+            author=author,
+            tags=tags,
+            tag_mode=tag_mode,
+        )
@@ -6,3 +6,7 @@ class ArticleNotFoundError(Exception):
 
 class ArticleAlreadyExistsError(Exception):
     """Se levanta cuando la combinación (title, author) ya está registrada."""
+
+
+class InvalidCursorError(Exception):
+    """Se levanta cuando el cursor de paginación recibido no es válido."""
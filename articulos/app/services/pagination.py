@@ -0,0 +1,97 @@
+"""Cursores opacos para la paginación keyset de artículos."""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import hashlib
+import json
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, Sequence
+
+from .exceptions import InvalidCursorError
+
+
+@dataclass(frozen=True, slots=True)
+class Cursor:
+    """Posición del último elemento entregado: ``(published_at, id)`` y el orden."""
+
+    published_at: Optional[datetime]
+    article_id: uuid.UUID
+    order_desc: bool = True
+
+
+def _encode(payload: dict) -> str:
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def _decode(token: str) -> dict:
+    padded = token + "=" * (-len(token) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+
+
+def encode_cursor(cursor: Cursor) -> str:
+    """Serializa el cursor como base64 URL-safe (el cliente lo trata como opaco)."""
+    payload = {
+        "p": cursor.published_at.isoformat() if cursor.published_at else None,
+        "i": str(cursor.article_id),
+        "d": cursor.order_desc,
+    }
+    return _encode(payload)
+
+
+def decode_cursor(token: str) -> Cursor:
+    """Reconstruye el cursor; levanta :class:`InvalidCursorError` si está corrupto."""
+    try:
+        payload = _decode(token)
+        return Cursor(
+            published_at=datetime.fromisoformat(payload["p"]) if payload["p"] else None,
+            article_id=uuid.UUID(payload["i"]),
+            order_desc=bool(payload["d"]),
+        )
+    except (binascii.Error, ValueError, KeyError, TypeError, UnicodeError) as exc:
+        raise InvalidCursorError("Cursor de paginación inválido") from exc
+
+
+@dataclass(frozen=True, slots=True)
+class SearchCursor:
+    """Posición del último resultado de una búsqueda: ``(rank, id)``.
+
+    ``query`` es la huella (:func:`search_fingerprint`) de la búsqueda que lo
+    generó: el rango sólo tiene sentido para ese texto y esos filtros.
+    """
+
+    rank: float
+    article_id: uuid.UUID
+    query: str
+
+
+def search_fingerprint(
+    query: str, *, author: Optional[str], tags: Sequence[str], tag_mode: str
+) -> str:
+    """Huella corta del texto y los filtros de una búsqueda."""
+    canonical = json.dumps([query, author, sorted(set(tags)), tag_mode], ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+def encode_search_cursor(cursor: SearchCursor) -> str:
+    """Serializa la posición de una búsqueda.
+
+    ``rank`` es un ``float8`` (ver :meth:`ArticleRepository.search`): el ``repr``
+    de JSON lo reconstruye exacto y el cursor vuelve a la misma fila frontera.
+    """
+    return _encode({"r": cursor.rank, "i": str(cursor.article_id), "q": cursor.query})
+
+
+def decode_search_cursor(token: str) -> SearchCursor:
+    """Reconstruye el cursor de búsqueda; levanta :class:`InvalidCursorError` si está corrupto."""
+    try:
+        payload = _decode(token)
+        return SearchCursor(
+            rank=float(payload["r"]), article_id=uuid.UUID(payload["i"]), query=str(payload["q"])
+        )
+    except (binascii.Error, ValueError, KeyError, TypeError, UnicodeError) as exc:
+        raise InvalidCursorError("Cursor de búsqueda inválido") from exc
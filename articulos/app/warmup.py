@@ -0,0 +1,216 @@
+"""Precarga de la caché y refresco en segundo plano de las claves calientes.
+
+Tras un despliegue o un ``FLUSHALL`` todas las claves ``article:{id}`` están
+frías y los primeros minutos de tráfico caen sobre PostgreSQL. Dos piezas lo
+evitan:
+
+* :func:`warm_cache` carga los ``CACHE_WARMUP_LIMIT`` artículos más leídos
+  (ranking ``articles:hot``; ``CACHE_WARMUP_SOURCE=hot``) o más recientes
+  (``recent``, también para completar el ranking) en lotes de
+  ``CACHE_WARMUP_BATCH_SIZE``: un ``WHERE id = ANY(...)`` por lote y sus
+  ``SETEX`` en un pipeline. Sólo recarga los que faltan en Redis. Se ejecuta en
+  el lifespan con ``CACHE_WARMUP_ON_STARTUP=true`` o a mano::
+
+      python -m app.warmup --limit 5000 --source recent
+
+* :class:`CacheRefresher` (``CACHE_REFRESH_ENABLED=true``) es un hilo que cada
+  ``CACHE_REFRESH_INTERVAL_SECONDS`` vuelca al ranking las lecturas contadas por
+  :class:`~app.cache.AccessCounter` y, en un solo worker por intervalo, relee
+  los ``CACHE_REFRESH_TOP_N`` artículos más leídos cuya clave vence en menos de
+  ``CACHE_REFRESH_AHEAD_SECONDS`` (o ya venció).
+
+Las lecturas van siempre al primario: una réplica atrasada dejaría en caché una
+versión vieja durante todo el TTL. Y ambas escriben con la L1 del proceso
+(:func:`shared_cache`): así ``set_many`` publica la invalidación y los demás
+workers descartan las copias L1 que el refresco acaba de reemplazar.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import threading
+from typing import List, Optional, Sequence
+
+import redis
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.cache import (
+    AccessCounter,
+    ArticleCache,
+    get_access_counter,
+    get_cache_codec,
+    get_local_cache,
+    get_redis_client,
+)
+from app.config import settings
+from app.crud.article import ArticleRepository
+from app.database import SessionLocal
+from app.models.article import Article
+from app.replicas import RequestRouting
+from app.services.article_service import ArticleService
+
+logger = logging.getLogger(__name__)
+
+WARMUP_SOURCES = ("hot", "recent")
+# Cada ciclo multiplica las puntuaciones de ``articles:hot`` por este factor.
+HOT_DECAY = 0.9
+HOT_MAX_KEYS = 10_000
+
+
+def _primary_session() -> Session:
+    return SessionLocal(routing=RequestRouting(force_primary=True))
+
+
+def shared_cache() -> ArticleCache:
+    """Caché con la L1 del proceso, como la de las peticiones (ver ``get_article_cache``)."""
+    return ArticleCache(get_redis_client(), local=get_local_cache(), codec=get_cache_codec())
+
+
+def _reload_in_batches(
+    service: ArticleService, cache: ArticleCache, article_ids: Sequence[str], batch_size: int
+) -> int:
+    """Relee ``article_ids`` por lotes; quita del ranking los que ya no existen."""
+    loaded = 0
+    for start in range(0, len(article_ids), batch_size):
+        batch = article_ids[start : start + batch_size]
+        found = service.reload(batch)
+        loaded += len(found)
+        cache.forget_hot(sorted(set(batch) - set(found)))
+    return loaded
+
+
+def _recent_article_ids(session: Session, limit: int, exclude: Sequence[str] = ()) -> List[str]:
+    """IDs de los artículos publicados más recientemente (sólo la columna ``id``)."""
+    rows = ArticleRepository(session).list(limit=limit + len(exclude), columns=(Article.id,))
+    skip = set(exclude)
+    return [article_id for article_id in (str(row.id) for row in rows) if article_id not in skip][:limit]
+
+
+def warm_cache(
+    *,
+    limit: Optional[int] = None,
+    batch_size: Optional[int] = None,
+    source: Optional[str] = None,
+    cache: Optional[ArticleCache] = None,
+) -> int:
+    """Carga en caché los artículos más leídos o más recientes que falten; devuelve cuántos."""
+    limit = settings.cache_warmup_limit if limit is None else limit
+    batch_size = batch_size or settings.cache_warmup_batch_size
+    source = source or settings.cache_warmup_source
+    if source not in WARMUP_SOURCES:
+        raise ValueError(f"Origen de precarga desconocido: {source}")
+    cache = cache or shared_cache()
+
+    with _primary_session() as session:
+        service = ArticleService(session, cache=cache)
+        candidates = cache.hot_articles(limit) if source == "hot" else []
+        if len(candidates) < limit:
+            candidates += _recent_article_ids(session, limit - len(candidates), exclude=candidates)
+        # Otros workers pueden haber precargado ya parte (despliegues escalonados).
+        cold = cache.expiring(candidates, 0)
+        loaded = _reload_in_batches(service, cache, cold, batch_size)
+    logger.info("Precarga de caché: %s de %s artículos (%s)", loaded, len(candidates), source)
+    return loaded
+
+
+def warm_cache_on_startup() -> None:
+    """Precarga del lifespan: si Redis o PostgreSQL fallan se sigue arrancando en frío."""
+    try:
+        warm_cache()
+    except (redis.RedisError, SQLAlchemyError):
+        logger.exception("No se pudo precargar la caché")
+
+
+class CacheRefresher:
+    """Hilo que vuelca los conteos de lecturas y refresca las claves calientes."""
+
+    def __init__(
+        self,
+        cache: ArticleCache,
+        counter: AccessCounter,
+        *,
+        interval_seconds: float,
+        top_n: int,
+        ahead_seconds: float,
+        batch_size: int,
+    ) -> None:
+        self._cache = cache
+        self._counter = counter
+        self._interval = interval_seconds
+        self._top_n = top_n
+        self._ahead = ahead_seconds
+        self._batch_size = batch_size
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="cache-refresh", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        self._stop.set()
+        self._thread.join(timeout)
+
+    def refresh(self) -> int:
+        """Un ciclo: vuelca conteos y, si este worker gana el turno, relee las claves por vencer."""
+        self._cache.record_accesses(self._counter.drain())
+        if not self._cache.claim_refresh(int(self._interval * 1000)):
+            return 0
+        self._cache.decay_hot(HOT_DECAY, HOT_MAX_KEYS)
+        due = self._cache.expiring(self._cache.hot_articles(self._top_n), self._ahead)
+        if not due:
+            return 0
+        with _primary_session() as session:
+            service = ArticleService(session, cache=self._cache)
+            refreshed = _reload_in_batches(service, self._cache, due, self._batch_size)
+        logger.debug("Refresco de caché: %s claves calientes", refreshed)
+        return refreshed
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            try:
+                self.refresh()
+            except (redis.RedisError, SQLAlchemyError):
+                logger.warning("Falló el refresco de claves calientes", exc_info=True)
+
+
+_refresher: Optional[CacheRefresher] = None
+
+
+def start_cache_refresher() -> None:
+    """Arranca el refresco en segundo plano si ``CACHE_REFRESH_ENABLED`` está activo."""
+    global _refresher
+    counter = get_access_counter()
+    if counter is None or _refresher is not None:
+        return
+    _refresher = CacheRefresher(
+        shared_cache(),
+        counter,
+        interval_seconds=settings.cache_refresh_interval_seconds,
+        top_n=settings.cache_refresh_top_n,
+        ahead_seconds=settings.cache_refresh_ahead_seconds,
+        batch_size=settings.cache_warmup_batch_size,
+    )
+    _refresher.start()
+
+
+def stop_cache_refresher() -> None:
+    global _refresher
+    if _refresher is not None:
+        _refresher.stop()
+        _refresher = None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Precarga la caché de artículos.")
+    parser.add_argument("--limit", type=int, default=settings.cache_warmup_limit)
+    parser.add_argument("--batch-size", type=int, default=settings.cache_warmup_batch_size)
+    parser.add_argument("--source", choices=WARMUP_SOURCES, default=settings.cache_warmup_source)
+    args = parser.parse_args()
+    loaded = warm_cache(limit=args.limit, batch_size=args.batch_size, source=args.source)
+    print(f"{loaded} artículos cargados en caché")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Benchmarks de rendimiento del API de artículos."""
@@ -0,0 +1,281 @@
+"""Latencia y rendimiento de los endpoints de artículos, en proceso (ASGI).
+
+Las peticiones van directo a la app con ``httpx.ASGITransport`` (sin red ni
+servidor), con ``--concurrency`` clientes simultáneos por escenario:
+
+* ``create``: ``POST /articles/``.
+* ``get_hit`` / ``get_miss``: ``GET /articles/{id}`` con el artículo en caché o
+  recién invalidado (cada petición del escenario ``miss`` usa un ID distinto).
+* ``list_shallow``: las primeras páginas de ``GET /articles/`` (aciertan en la
+  caché de listados tras la primera vuelta).
+* ``list_deep_offset`` / ``list_deep_cursor``: páginas a ``--depth`` filas de
+  profundidad con ``skip`` y con ``cursor``; cada petición pide una página distinta.
+* ``list_tag`` / ``list_author``: filtros por etiqueta y autor, de los más
+  frecuentes a los más raros.
+* ``update`` / ``delete``: ``PUT`` y ``DELETE`` sobre los artículos de ``create``.
+
+Requiere PostgreSQL y Redis configurados y una tabla sembrada con
+``python -m benchmarks.seed`` (la profundidad se acota al tamaño real). Los
+resultados se escriben en JSON (ver :mod:`benchmarks.common`).
+
+Uso (dentro de ``articulos/``)::
+
+    python -m benchmarks.seed --rows 100000
+    python -m benchmarks.api_throughput --requests 2000 --concurrency 16
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List, Sequence
+
+import httpx
+from sqlalchemy import func, select
+
+from app.cache import ArticleCache, get_redis_client
+from app.config import settings
+from app.database import SessionLocal
+from app.main import app
+from app.models.article import Article
+from app.services.pagination import Cursor, encode_cursor
+from benchmarks.common import add_output_argument, summarize, write_results
+from benchmarks.seed import AUTHOR_PREFIX, DEFAULT_AUTHORS, DEFAULT_TAGS
+
+SCENARIOS = (
+    "create",
+    "get_hit",
+    "get_miss",
+    "list_shallow",
+    "list_deep_offset",
+    "list_deep_cursor",
+    "list_tag",
+    "list_author",
+    "update",
+    "delete",
+)
+PAGE_SIZE = 20
+
+Request = Callable[[httpx.AsyncClient, int], Awaitable[httpx.Response]]
+
+
+async def _measure(
+    client: httpx.AsyncClient,
+    request: Request,
+    *,
+    total: int,
+    concurrency: int,
+    expected: int = 200,
+) -> Dict[str, Any]:
+    """Ejecuta ``request(client, i)`` para ``i`` en ``range(total)`` con ``concurrency`` tareas."""
+    samples: List[float] = []
+    errors = 0
+    indexes = iter(range(total))
+
+    async def worker() -> None:
+        nonlocal errors
+        for index in indexes:
+            started = time.perf_counter()
+            response = await request(client, index)
+            elapsed = time.perf_counter() - started
+            if response.status_code == expected:
+                samples.append(elapsed)
+            else:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(samples, time.perf_counter() - started, errors=errors)
+
+
+def _table_rows() -> int:
+    with SessionLocal() as session:
+        return session.scalar(select(func.count()).select_from(Article)) or 0
+
+
+def _sample_ids(count: int, rng: random.Random) -> List[str]:
+    with SessionLocal() as session:
+        ids = session.scalars(
+            select(Article.id).where(Article.author.like(f"{AUTHOR_PREFIX}%")).limit(count * 4)
+        ).all()
+    rng.shuffle(ids)
+    return [str(article_id) for article_id in ids[:count]]
+
+
+def _deep_cursors(depth: int, count: int) -> List[str]:
+    """Cursores que apuntan a ``count`` páginas consecutivas a partir de ``depth``."""
+    with SessionLocal() as session:
+        rows = session.execute(
+            select(Article.published_at, Article.id)
+            .where(Article.published_at.is_not(None))
+            .order_by(Article.published_at.desc(), Article.id.desc())
+            .offset(depth)
+            .limit(count * PAGE_SIZE)
+        ).all()
+    return [
+        encode_cursor(Cursor(published_at=published_at, article_id=article_id))
+        for published_at, article_id in rows[::PAGE_SIZE]
+    ]
+
+
+def _article_payload(run_id: str, index: int, rng: random.Random) -> Dict[str, Any]:
+    # Mismo sesgo que la siembra: autores y etiquetas bajos son los más frecuentes.
+    tags = {f"tag{int(rng.random() ** 3 * DEFAULT_TAGS)}" for _ in range(1 + index % 5)}
+    return {
+        "title": f"Benchmark {run_id} {index}",
+        "body": "Contenido del artículo de prueba. " * rng.randint(10, 100),
+        "tags": sorted(tags),
+        "author": f"{AUTHOR_PREFIX}{int(rng.random() ** 2 * DEFAULT_AUTHORS)}",
+    }
+
+
+async def _run(args: argparse.Namespace, depth: int) -> Dict[str, Any]:
+    rng = random.Random(args.seed)
+    run_id = uuid.uuid4().hex[:8]
+    sample = _sample_ids(args.requests, rng)
+    if not sample:
+        raise SystemExit("No hay artículos sembrados: ejecuta antes python -m benchmarks.seed")
+    cursors = _deep_cursors(depth, args.requests) if "list_deep_cursor" in args.scenarios else []
+    filters_tags = [f"tag{index}" for index in (0, 1, 2, 5, 10, 25, 50, 100, 150, 199)]
+    filters_authors = [f"{AUTHOR_PREFIX}{index}" for index in (0, 1, 2, 5, 10, 50, 100, 500, 900, 999)]
+    created: List[str] = []
+    results: Dict[str, Any] = {}
+
+    async def create(client: httpx.AsyncClient, index: int) -> httpx.Response:
+        response = await client.post("/articles/", json=_article_payload(run_id, index, rng))
+        if response.status_code == 201:
+            created.append(response.json()["id"])
+        return response
+
+    async def get_article(client: httpx.AsyncClient, index: int) -> httpx.Response:
+        return await client.get(f"/articles/{sample[index % len(sample)]}")
+
+    async def list_shallow(client: httpx.AsyncClient, index: int) -> httpx.Response:
+        return await client.get("/articles/", params={"limit": PAGE_SIZE, "skip": (index % 5) * PAGE_SIZE})
+
+    async def list_deep_offset(client: httpx.AsyncClient, index: int) -> httpx.Response:
+        return await client.get("/articles/", params={"limit": PAGE_SIZE, "skip": depth + index * PAGE_SIZE})
+
+    async def list_deep_cursor(client: httpx.AsyncClient, index: int) -> httpx.Response:
+        return await client.get(
+            "/articles/", params={"limit": PAGE_SIZE, "cursor": cursors[index % len(cursors)]}
+        )
+
+    async def list_tag(client: httpx.AsyncClient, index: int) -> httpx.Response:
+        tag = filters_tags[index % len(filters_tags)]
+        page = index // len(filters_tags)
+        return await client.get("/articles/", params={"limit": PAGE_SIZE, "tag": tag, "skip": page * PAGE_SIZE})
+
+    async def list_author(client: httpx.AsyncClient, index: int) -> httpx.Response:
+        author = filters_authors[index % len(filters_authors)]
+        page = index // len(filters_authors)
+        return await client.get(
+            "/articles/", params={"limit": PAGE_SIZE, "author": author, "skip": page * PAGE_SIZE}
+        )
+
+    async def update(client: httpx.AsyncClient, index: int) -> httpx.Response:
+        article_id = created[index % len(created)]
+        return await client.put(f"/articles/{article_id}", json={"title": f"Benchmark {run_id} {index} v2"})
+
+    async def delete(client: httpx.AsyncClient, index: int) -> httpx.Response:
+        return await client.delete(f"/articles/{created[index]}")
+
+    async def warm_cache(client: httpx.AsyncClient) -> None:
+        for index in range(len(sample)):
+            await get_article(client, index)
+
+    async def evict_cache(_: httpx.AsyncClient) -> None:
+        ArticleCache(get_redis_client()).invalidate_many(sample)
+
+    # escenario -> (petición, total, estado esperado, preparación)
+    plan: Dict[str, Any] = {
+        "create": (create, args.requests, 201, None),
+        "get_hit": (get_article, args.requests, 200, warm_cache),
+        "get_miss": (get_article, len(sample), 200, evict_cache),
+        "list_shallow": (list_shallow, args.requests, 200, None),
+        "list_deep_offset": (list_deep_offset, args.requests, 200, None),
+        "list_deep_cursor": (list_deep_cursor, args.requests, 200, None),
+        "list_tag": (list_tag, args.requests, 200, None),
+        "list_author": (list_author, args.requests, 200, None),
+        "update": (update, args.requests, 200, None),
+        "delete": (delete, None, 204, None),
+    }
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench", headers={"x-api-key": settings.api_key}
+        ) as client:
+            for scenario in args.scenarios:
+                request, total, expected, prepare = plan[scenario]
+                if scenario in ("update", "delete") and not created:
+                    print(f"  {scenario}: omitido (requiere el escenario create)")
+                    continue
+                if scenario == "list_deep_cursor" and not cursors:
+                    print(f"  {scenario}: omitido (la tabla no llega a esa profundidad)")
+                    continue
+                print(f"  {scenario}...")
+                if prepare is not None:
+                    await prepare(client)
+                results[scenario] = await _measure(
+                    client,
+                    request,
+                    total=len(created) if total is None else total,
+                    concurrency=args.concurrency,
+                    expected=expected,
+                )
+    return results
+
+
+def _print_results(results: Dict[str, Any], scenarios: Sequence[str]) -> None:
+    print(f"{'escenario':<18}{'ops/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errores':>9}")
+    for scenario in scenarios:
+        stats = results.get(scenario)
+        if not stats or not stats.get("count"):
+            continue
+        print(
+            f"{scenario:<18}{stats['ops_per_sec']:>10,.0f}{stats['p50_ms']:>10.2f}"
+            f"{stats['p95_ms']:>10.2f}{stats['p99_ms']:>10.2f}{stats['errors']:>9}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=1000, help="Peticiones por escenario")
+    parser.add_argument("--concurrency", type=int, default=16, help="Clientes simultáneos")
+    parser.add_argument("--depth", type=int, default=50_000, help="Filas a saltar en los listados profundos")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--scenarios",
+        type=lambda value: [name.strip() for name in value.split(",") if name.strip()],
+        default=list(SCENARIOS),
+        help=f"Escenarios separados por comas (por defecto todos: {','.join(SCENARIOS)})",
+    )
+    add_output_argument(parser)
+    args = parser.parse_args()
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"Escenarios desconocidos: {', '.join(sorted(unknown))}")
+
+    rows = _table_rows()
+    depth = max(0, min(args.depth, rows - args.requests * PAGE_SIZE))
+    print(f"Tabla con {rows:,} artículos; listados profundos desde la fila {depth:,}")
+    results = asyncio.run(_run(args, depth))
+    _print_results(results, args.scenarios)
+    params = {
+        "rows": rows,
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "depth": depth,
+        "seed": args.seed,
+        "scenarios": args.scenarios,
+    }
+    path = write_results("api", params, results, args.output)
+    print(f"Resultados en {path}")
+
+
+if __name__ == "__main__":
+    main()
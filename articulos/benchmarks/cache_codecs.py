@@ -0,0 +1,82 @@
+"""Microbenchmarks de los codecs de caché y del camino de un acierto.
+
+No necesita Redis ni PostgreSQL: mide sólo el trabajo de CPU que se hace con
+los bytes leídos de la caché.
+
+* ``codecs``: ``dumps``/``loads`` de un artículo y tamaño de la entrada por codec.
+* ``hit path``: decodificar + ``ArticleDTO.from_dict`` + ``render_article``
+  (camino sin bytes renderizados en caché) frente a devolver los bytes ya
+  renderizados en un ``Response`` (camino rápido).
+
+Uso (dentro de ``articulos/``)::
+
+    python -m benchmarks.cache_codecs --number 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+import uuid
+from datetime import datetime, timezone
+from typing import Callable
+
+from fastapi import Response
+
+from app.cache import get_codec
+from app.services.article_service import ArticleDTO, render_article
+
+
+def _sample_dto() -> ArticleDTO:
+    now = datetime.now(timezone.utc)
+    return ArticleDTO(
+        id=str(uuid.uuid4()),
+        title="Benchmark de códecs",
+        body="Contenido del artículo con acentos y eñes. " * 40,
+        tags=["bench", "redis", "cache"],
+        author="Bench",
+        published_at=now,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def _per_op_us(fn: Callable[[], object], number: int) -> float:
+    best = min(timeit.repeat(fn, number=number, repeat=3))
+    return best / number * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000, help="Iteraciones por medición")
+    args = parser.parse_args()
+
+    dto = _sample_dto()
+    payload = dto.to_dict()
+    rendered = render_article(dto)
+
+    print(f"{'codec':<10}{'bytes':>8}{'dumps µs':>12}{'loads µs':>12}{'hit µs':>12}")
+    for name in ("json", "orjson", "msgpack"):
+        try:
+            codec = get_codec(name)
+        except RuntimeError:
+            print(f"{name:<10}{'(no instalado)':>44}")
+            continue
+        raw = codec.dumps(payload)
+
+        def hit(codec=codec, raw=raw) -> bytes:
+            return render_article(ArticleDTO.from_dict(codec.loads(raw)))
+
+        print(
+            f"{name:<10}{len(raw):>8}"
+            f"{_per_op_us(lambda: codec.dumps(payload), args.number):>12.2f}"
+            f"{_per_op_us(lambda: codec.loads(raw), args.number):>12.2f}"
+            f"{_per_op_us(hit, args.number):>12.2f}"
+        )
+
+    fast = _per_op_us(lambda: Response(content=rendered, media_type="application/json"), args.number)
+    print(f"{'rendered':<10}{len(rendered):>8}{'-':>12}{'-':>12}{fast:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
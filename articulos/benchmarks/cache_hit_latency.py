@@ -0,0 +1,111 @@
+"""Latencia p50/p99 de ``GET /articles/{id}`` con acierto de caché.
+
+Compara el comportamiento anterior (un cliente ``redis.Redis.from_url`` por
+petición) contra el pool compartido del proceso. Requiere un Redis accesible en
+``REDIS_URL``; PostgreSQL no se consulta porque todas las lecturas aciertan en
+la caché.
+
+Uso (dentro de ``articulos/``)::
+
+    python -m benchmarks.cache_hit_latency --requests 2000
+
+Los resultados se guardan con el formato de :mod:`benchmarks.common` en el grupo
+``get_hit`` (escenarios ``per_request`` y ``shared_pool``), comparables con
+``python -m benchmarks.compare``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+
+import redis
+from fastapi.testclient import TestClient
+
+from app.api.deps import get_article_cache
+from app.cache import ArticleCache, get_redis_client
+from app.config import settings
+from app.main import app
+from benchmarks.common import add_output_argument, summarize, write_results
+
+
+def _per_request_cache() -> ArticleCache:
+    # Reproduce el comportamiento previo: un pool nuevo (y un handshake TCP) por petición.
+    return ArticleCache(client=redis.Redis.from_url(settings.redis_url, decode_responses=False))
+
+
+def _seed_article() -> str:
+    article_id = str(uuid.uuid4())
+    now = datetime.now(timezone.utc).isoformat()
+    ArticleCache(get_redis_client(), ttl_seconds=3600).set(
+        article_id,
+        {
+            "id": article_id,
+            "title": "Benchmark",
+            "body": "Contenido " * 50,
+            "tags": ["bench", "redis"],
+            "author": "Bench",
+            "published_at": now,
+            "created_at": now,
+            "updated_at": now,
+        },
+    )
+    return article_id
+
+
+def _measure(client: TestClient, article_id: str, total: int, warmup: int) -> Dict[str, Any]:
+    headers = {"x-api-key": settings.api_key}
+    url = f"/articles/{article_id}"
+    for _ in range(warmup):
+        client.get(url, headers=headers)
+
+    samples: List[float] = []
+    errors = 0
+    started = time.perf_counter()
+    for _ in range(total):
+        start = time.perf_counter()
+        response = client.get(url, headers=headers)
+        if response.status_code == 200:
+            samples.append(time.perf_counter() - start)
+        else:
+            errors += 1
+    return summarize(samples, time.perf_counter() - started, errors=errors)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--warmup", type=int, default=100)
+    add_output_argument(parser)
+    args = parser.parse_args()
+
+    with TestClient(app) as client:
+        article_id = _seed_article()
+
+        app.dependency_overrides[get_article_cache] = _per_request_cache
+        try:
+            before = _measure(client, article_id, args.requests, args.warmup)
+        finally:
+            app.dependency_overrides.clear()
+        after = _measure(client, article_id, args.requests, args.warmup)
+
+    for label, result in (("cliente por petición", before), ("pool compartido", after)):
+        if not result["count"]:
+            print(f"{label:>22}: sin respuestas 200 ({result['errors']} errores)")
+            continue
+        print(
+            f"{label:>22}: p50={result['p50_ms']:.3f} ms  "
+            f"p99={result['p99_ms']:.3f} ms  media={result['mean_ms']:.3f} ms"
+        )
+
+    params = {"requests": args.requests, "warmup": args.warmup}
+    results = {"get_hit": {"per_request": before, "shared_pool": after}}
+    path = write_results("cache_hit_latency", params, results, args.output)
+    print(f"Resultados en {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Utilidades compartidas por los benchmarks: estadísticas y resultados en JSON.
+
+Cada benchmark escribe un archivo con la forma::
+
+    {"benchmark": "api", "run": {...}, "params": {...}, "results": {escenario: {...}}}
+
+``run`` describe el entorno (commit, Python, modo async, codec...) para que
+``python -m benchmarks.compare`` sólo compare corridas equivalentes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence
+
+from app.config import settings
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+
+def percentile(samples: Sequence[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summarize(samples: Sequence[float], elapsed: float, *, errors: int = 0) -> Dict[str, Any]:
+    """Latencias (``samples`` en segundos) y rendimiento de un escenario."""
+    if not samples:
+        return {"count": 0, "errors": errors}
+    to_ms = 1000
+    return {
+        "count": len(samples),
+        "errors": errors,
+        "ops_per_sec": round(len(samples) / elapsed, 1) if elapsed > 0 else None,
+        "mean_ms": round(statistics.fmean(samples) * to_ms, 4),
+        "p50_ms": round(percentile(samples, 50) * to_ms, 4),
+        "p95_ms": round(percentile(samples, 95) * to_ms, 4),
+        "p99_ms": round(percentile(samples, 99) * to_ms, 4),
+        "max_ms": round(max(samples) * to_ms, 4),
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        output = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).resolve().parent,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.stdout.strip() or None
+
+
+def run_info() -> Dict[str, Any]:
+    """Entorno de la corrida: lo que cambia los números además del código."""
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "async_mode": settings.async_mode,
+        "cache_codec": settings.cache_codec,
+        "cache_response_bytes": settings.cache_response_bytes,
+        "l1_cache_enabled": settings.l1_cache_enabled,
+        "db_pgbouncer_mode": settings.db_pgbouncer_mode,
+    }
+
+
+def add_output_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help="Archivo JSON de resultados (por defecto benchmarks/results/<nombre>-<fecha>.json)",
+    )
+
+
+def write_results(
+    name: str,
+    params: Dict[str, Any],
+    results: Dict[str, Any],
+    output: Optional[Path] = None,
+) -> Path:
+    """Guarda los resultados con los metadatos de la corrida y devuelve la ruta."""
+    if output is None:
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        output = RESULTS_DIR / f"{name}-{stamp}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    document = {"benchmark": name, "run": run_info(), "params": params, "results": results}
+    output.write_text(json.dumps(document, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    return output
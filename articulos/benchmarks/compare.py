@@ -0,0 +1,85 @@
+"""Compara dos archivos de resultados de benchmarks y marca las regresiones.
+
+Para ``api`` y ``cache_hit_latency`` compara ``p50_ms``, ``p99_ms`` y
+``ops_per_sec`` de cada escenario; para ``micro``, los µs por operación. Una
+métrica empeora cuando la latencia sube (o el rendimiento baja) más de
+``--threshold`` por ciento. Con ``--fail`` el comando termina con código 1 si hay
+regresiones, para usarlo en CI. Avisa si las corridas no son equivalentes (modo
+async, codec, L1...).
+
+Uso (dentro de ``articulos/``)::
+
+    python -m benchmarks.compare benchmarks/results/api-A.json benchmarks/results/api-B.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterator, Tuple
+
+# Métrica -> True si un valor mayor es mejor.
+_API_METRICS = {"p50_ms": False, "p99_ms": False, "ops_per_sec": True}
+_IGNORED_RUN_KEYS = {"timestamp", "commit"}
+
+
+def _metrics(document: Dict[str, Any]) -> Iterator[Tuple[str, float, bool]]:
+    """``(nombre, valor, mayor_es_mejor)`` de cada métrica comparable."""
+    for group, values in document["results"].items():
+        for name, value in values.items():
+            if isinstance(value, dict):
+                for metric, higher_is_better in _API_METRICS.items():
+                    if value.get(metric) is not None:
+                        yield f"{group}.{name}.{metric}", value[metric], higher_is_better
+            elif isinstance(value, (int, float)):
+                yield f"{group}.{name}", value, False
+
+
+def _load(path: Path) -> Dict[str, Any]:
+    document = json.loads(path.read_text(encoding="utf-8"))
+    if document.get("benchmark") == "api":
+        # Los escenarios de ``api`` cuelgan directamente de ``results``.
+        document = {**document, "results": {"api": document["results"]}}
+    return document
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("candidate", type=Path)
+    parser.add_argument("--threshold", type=float, default=10.0, help="Porcentaje tolerado")
+    parser.add_argument("--fail", action="store_true", help="Salir con código 1 si hay regresiones")
+    args = parser.parse_args()
+
+    baseline, candidate = _load(args.baseline), _load(args.candidate)
+    if baseline["benchmark"] != candidate["benchmark"]:
+        raise SystemExit("Los archivos son de benchmarks distintos")
+    for key, value in baseline["run"].items():
+        if key not in _IGNORED_RUN_KEYS and candidate["run"].get(key) != value:
+            print(f"aviso: {key} difiere ({value!r} -> {candidate['run'].get(key)!r})")
+    if baseline.get("params") != candidate.get("params"):
+        print("aviso: los parámetros de las corridas difieren")
+
+    before = {name: value for name, value, _ in _metrics(baseline)}
+    regressions = 0
+    print(f"{'métrica':<42}{'antes':>12}{'después':>12}{'cambio':>10}")
+    for name, value, higher_is_better in _metrics(candidate):
+        previous = before.get(name)
+        if not previous:
+            continue
+        change = (value - previous) / previous * 100
+        worse = -change if higher_is_better else change
+        flag = ""
+        if worse > args.threshold:
+            flag = "  REGRESIÓN"
+            regressions += 1
+        print(f"{name:<42}{previous:>12.3f}{value:>12.3f}{change:>+9.1f}%{flag}")
+
+    print(f"{regressions} regresiones por encima de {args.threshold:.0f}%")
+    if args.fail and regressions:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
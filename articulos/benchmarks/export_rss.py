@@ -0,0 +1,118 @@
+"""Memoria pico de ``GET /articles/export`` sobre una tabla grande.
+
+Inserta ``--rows`` artículos sintéticos (autor ``export-bench``) con
+``generate_series``, ejecuta la exportación directamente contra la app ASGI
+descartando los bytes a medida que llegan, y reporta el RSS pico del proceso.
+Con el cursor del servidor el pico no debería crecer con ``--rows``.
+
+Requiere el PostgreSQL configurado (``DATABASE_URL``/``POSTGRES_*``); Redis no
+se usa.
+
+Uso (dentro de ``articulos/``)::
+
+    python -m benchmarks.export_rss --rows 1000000 --format ndjson
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import resource
+import time
+
+from sqlalchemy import text
+
+from app.config import settings
+from app.database import engine
+from app.main import app
+
+BENCH_AUTHOR = "export-bench"
+
+
+def _rss_mb() -> float:
+    # En Linux ``ru_maxrss`` está en KiB.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _seed(rows: int) -> None:
+    with engine.begin() as connection:
+        connection.execute(text("DELETE FROM articles WHERE author = :author"), {"author": BENCH_AUTHOR})
+        connection.execute(
+            text(
+                "INSERT INTO articles (id, title, body, tags, author, published_at) "
+                "SELECT gen_random_uuid(), 'Export ' || g, repeat('contenido ', 60), "
+                "ARRAY['bench', 'tag' || (g % 50)], :author, now() - g * interval '1 minute' "
+                "FROM generate_series(1, :rows) AS g"
+            ),
+            {"author": BENCH_AUTHOR, "rows": rows},
+        )
+        connection.execute(text("ANALYZE articles"))
+
+
+def _cleanup() -> None:
+    with engine.begin() as connection:
+        connection.execute(text("DELETE FROM articles WHERE author = :author"), {"author": BENCH_AUTHOR})
+
+
+async def _export(export_format: str) -> tuple[int, int]:
+    """Llama a la app ASGI y cuenta bytes/bloques sin acumular el cuerpo."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/articles/export",
+        "raw_path": b"/articles/export",
+        "query_string": f"format={export_format}&author={BENCH_AUTHOR}".encode(),
+        "headers": [(b"x-api-key", settings.api_key.encode())],
+        "client": ("127.0.0.1", 0),
+        "server": ("bench", 80),
+    }
+    received = {"bytes": 0, "chunks": 0, "status": 0}
+
+    async def receive() -> dict:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict) -> None:
+        if message["type"] == "http.response.start":
+            received["status"] = message["status"]
+        elif message["type"] == "http.response.body":
+            received["bytes"] += len(message.get("body", b""))
+            received["chunks"] += 1
+
+    await app(scope, receive, send)
+    if received["status"] != 200:
+        raise SystemExit(f"La exportación respondió {received['status']}")
+    return received["bytes"], received["chunks"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--format", choices=("ndjson", "csv"), default="ndjson")
+    parser.add_argument("--keep", action="store_true", help="No borrar las filas sembradas al terminar")
+    args = parser.parse_args()
+
+    print(f"Sembrando {args.rows} artículos...")
+    _seed(args.rows)
+    try:
+        baseline = _rss_mb()
+        started = time.perf_counter()
+        total_bytes, chunks = asyncio.run(_export(args.format))
+        elapsed = time.perf_counter() - started
+        peak = _rss_mb()
+    finally:
+        if not args.keep:
+            _cleanup()
+
+    print(f"formato:        {args.format}")
+    print(f"filas:          {args.rows}")
+    print(f"bytes:          {total_bytes / 1024 / 1024:.1f} MiB en {chunks} bloques")
+    print(f"duración:       {elapsed:.1f} s ({args.rows / elapsed:,.0f} filas/s)")
+    print(f"RSS antes:      {baseline:.1f} MiB")
+    print(f"RSS pico:       {peak:.1f} MiB (+{peak - baseline:.1f} MiB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""Microbenchmarks de ``ArticleDTO`` y ``ArticleCache``.
+
+* ``dto``: ``from_model``, ``from_row``, ``from_dict``, ``to_dict``, ``project`` y
+  ``render_article`` sobre un artículo típico.
+* ``response``: costo por elemento de renderizar una página de 100 artículos con
+  la ruta anterior (``to_dict`` -> ``ArticleListItem`` -> ``ArticleListResponse``)
+  y con la actual (:func:`~app.services.article_service.render_page`), completa y
+  con ``fields=summary``.
+* ``cache``: ``get`` (acierto y fallo), ``get_rendered``, ``set`` y ``get_many`` de
+  :class:`~app.cache.ArticleCache`, con y sin L1. Por defecto contra un cliente en
+  memoria, que aísla el costo de CPU de la caché (claves, codec, L1); con
+  ``--redis`` usa el Redis de ``REDIS_URL`` e incluye los round trips.
+
+No necesita PostgreSQL. Los resultados (µs por operación) se escriben en JSON.
+
+Uso (dentro de ``articulos/``)::
+
+    python -m benchmarks.micro --number 20000
+    python -m benchmarks.micro --redis --number 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import timeit
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy.engine.result import result_tuple
+
+from app.cache import ArticleCache, LocalCache, get_redis_client
+from app.models.article import Article
+from app.schemas import ArticleListItem, ArticleListResponse, ArticleSummary
+from app.services.article_service import ArticleDTO, ArticlePage, render_article, render_page
+from benchmarks.common import add_output_argument, write_results
+
+
+class _MemoryRedis:
+    """Cliente mínimo en memoria con los comandos que usa ``ArticleCache``."""
+
+    def __init__(self) -> None:
+        self.store: Dict[str, Any] = {}
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.store.get(key)
+
+    def mget(self, keys: List[str]) -> List[Optional[bytes]]:
+        return [self.store.get(key) for key in keys]
+
+    def setex(self, key: str, ttl: int, value: Any) -> None:  # noqa: ARG002
+        self.store[key] = value.encode("utf-8") if isinstance(value, str) else value
+
+    def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.store.pop(key, None)
+
+    def pttl(self, key: str) -> int:
+        return 60_000 if key in self.store else -2
+
+    def publish(self, channel: str, message: str) -> int:  # noqa: ARG002
+        return 0
+
+    def pipeline(self, transaction: bool = True) -> "_MemoryPipeline":  # noqa: ARG002
+        return _MemoryPipeline(self)
+
+
+class _MemoryPipeline:
+    def __init__(self, client: _MemoryRedis) -> None:
+        self._client = client
+        self._calls: List[Any] = []
+
+    def __getattr__(self, name: str) -> Callable[..., "_MemoryPipeline"]:
+        def queue(*args: Any) -> "_MemoryPipeline":
+            self._calls.append((name, args))
+            return self
+
+        return queue
+
+    def execute(self) -> List[Any]:
+        calls, self._calls = self._calls, []
+        return [getattr(self._client, name)(*args) for name, args in calls]
+
+
+def _sample_dto() -> ArticleDTO:
+    now = datetime.now(timezone.utc)
+    return ArticleDTO(
+        id=str(uuid.uuid4()),
+        title="Microbenchmark de artículos",
+        body="Contenido del artículo de prueba. " * 40,
+        tags=["bench", "tag1", "tag7"],
+        author="bench-author-1",
+        published_at=now,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def _per_op_us(fn: Callable[[], object], number: int) -> float:
+    best = min(timeit.repeat(fn, number=number, repeat=3))
+    return round(best / number * 1_000_000, 3)
+
+
+def _dto_benchmarks(number: int) -> Dict[str, float]:
+    dto = _sample_dto()
+    model = Article(
+        id=uuid.UUID(dto.id),
+        title=dto.title,
+        body=dto.body,
+        tags=dto.tags,
+        author=dto.author,
+        published_at=dto.published_at,
+        created_at=dto.created_at,
+        updated_at=dto.updated_at,
+    )
+    payload = dto.to_dict()
+    # Fila Core (como las del repositorio) construida sin base de datos.
+    fields = list(payload)
+    row = result_tuple(fields)([uuid.UUID(dto.id), *(getattr(dto, name) for name in fields[1:])])
+    return {
+        "from_model": _per_op_us(lambda: ArticleDTO.from_model(model), number),
+        "from_row": _per_op_us(lambda: ArticleDTO.from_row(row), number),
+        "from_dict": _per_op_us(lambda: ArticleDTO.from_dict(payload), number),
+        "to_dict": _per_op_us(dto.to_dict, number),
+        "project_summary": _per_op_us(
+            lambda: dto.project(["title", "tags", "author", "published_at"]), number
+        ),
+        "render_article": _per_op_us(lambda: render_article(dto), number),
+    }
+
+
+PAGE_SIZE = 100
+
+
+def _response_benchmarks(number: int) -> Dict[str, float]:
+    items = [_sample_dto() for _ in range(PAGE_SIZE)]
+    page = ArticlePage(items=items, total=PAGE_SIZE)
+    summary = frozenset(ArticleSummary.model_fields)
+
+    def previous(fields: Optional[frozenset]) -> bytes:
+        # Ruta previa: DTO -> dict -> modelo por elemento -> modelo de página -> JSON.
+        return (
+            ArticleListResponse(
+                items=[ArticleListItem.model_validate(dto.project(fields)) for dto in items],
+                total=PAGE_SIZE,
+                limit=PAGE_SIZE,
+                skip=0,
+                next_cursor=None,
+            )
+            .model_dump_json(exclude_unset=True)
+            .encode("utf-8")
+        )
+
+    pages = max(1, number // PAGE_SIZE)
+
+    def per_item(fn: Callable[[], object]) -> float:
+        return round(_per_op_us(fn, pages) / PAGE_SIZE, 3)
+
+    return {
+        "page_item_previous": per_item(lambda: previous(None)),
+        "page_item": per_item(lambda: render_page(page, limit=PAGE_SIZE, skip=0)),
+        "page_item_summary_previous": per_item(lambda: previous(summary)),
+        "page_item_summary": per_item(lambda: render_page(page, limit=PAGE_SIZE, skip=0, fields=summary)),
+    }
+
+
+def _cache_benchmarks(client: Any, number: int, *, local: bool) -> Dict[str, float]:
+    cache = ArticleCache(
+        client,
+        ttl_seconds=3600,
+        local=LocalCache(max_bytes=8 * 1024 * 1024, ttl_seconds=math.inf) if local else None,
+    )
+    dto = _sample_dto()
+    payload = dto.to_dict()
+    rendered = render_article(dto)
+    ids = [str(uuid.uuid4()) for _ in range(50)]
+    for article_id in ids:
+        cache.set(article_id, {**payload, "id": article_id}, rendered=rendered)
+    missing = str(uuid.uuid4())
+    try:
+        return {
+            "get_hit": _per_op_us(lambda: cache.get(ids[0]), number),
+            "get_miss": _per_op_us(lambda: cache.get(missing), number),
+            "get_rendered_hit": _per_op_us(lambda: cache.get_rendered(ids[0]), number),
+            "set": _per_op_us(lambda: cache.set(dto.id, payload, rendered=rendered), number),
+            "get_many_50": _per_op_us(lambda: cache.get_many(ids), max(1, number // 50)),
+        }
+    finally:
+        cache.invalidate_many([*ids, dto.id])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000, help="Iteraciones por medición")
+    parser.add_argument("--redis", action="store_true", help="Usar el Redis de REDIS_URL")
+    add_output_argument(parser)
+    args = parser.parse_args()
+
+    client = get_redis_client() if args.redis else _MemoryRedis()
+    results: Dict[str, Dict[str, float]] = {
+        "dto": _dto_benchmarks(args.number),
+        "response": _response_benchmarks(args.number),
+        "cache": _cache_benchmarks(client, args.number, local=False),
+        "cache_l1": _cache_benchmarks(client, args.number, local=True),
+    }
+
+    for group, timings in results.items():
+        for name, micros in timings.items():
+            print(f"{group + '.' + name:<36}{micros:>10.2f} µs")
+    params = {"number": args.number, "redis": args.redis}
+    path = write_results("micro", params, results, args.output)
+    print(f"Resultados en {path}")
+
+
+if __name__ == "__main__":
+    main()
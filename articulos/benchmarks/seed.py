@@ -0,0 +1,116 @@
+"""Siembra artículos sintéticos con distribuciones realistas para los benchmarks.
+
+Los autores (``bench-author-N``) y las etiquetas (``tagN``) siguen distribuciones
+sesgadas: unos pocos autores firman gran parte de los artículos y unas pocas
+etiquetas aparecen en casi todos, como en un catálogo real. Cada artículo lleva
+de 1 a 5 etiquetas, un cuerpo de longitud variable y una fecha repartida en los
+últimos tres años. ``--seed`` hace que dos siembras del mismo tamaño sean iguales.
+
+Las filas se insertan con ``generate_series`` en lotes (sin pasar por la API) y
+después se invalidan en Redis los listados y conteos que dependen de ellas.
+
+Uso (dentro de ``articulos/``)::
+
+    python -m benchmarks.seed --rows 100000
+    python -m benchmarks.seed --cleanup
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from sqlalchemy import text
+
+from app.cache import ArticleCache, get_redis_client
+from app.database import engine
+
+AUTHOR_PREFIX = "bench-author-"
+DEFAULT_AUTHORS = 1000
+DEFAULT_TAGS = 200
+BATCH_ROWS = 100_000
+
+# ``pow(random(), k)`` concentra los valores cerca de 0: autor/etiqueta 0 es el más frecuente.
+_INSERT_BATCH = text(
+    """
+    INSERT INTO articles (id, title, body, tags, author, published_at)
+    SELECT
+        gen_random_uuid(),
+        'Artículo de prueba ' || g,
+        repeat('Contenido del artículo de prueba. ', 10 + floor(random() * 90)::int),
+        ARRAY(
+            SELECT DISTINCT 'tag' || floor(pow(random(), 3) * :tags)::int
+            FROM generate_series(1, 1 + g % 5)
+        ),
+        CAST(:prefix AS text) || floor(pow(random(), 2) * :authors)::int,
+        now() - random() * interval '3 years'
+    FROM generate_series(:start, :stop) AS g
+    """
+)
+
+
+def cleanup() -> int:
+    """Borra todos los artículos sembrados; devuelve cuántos había."""
+    with engine.begin() as connection:
+        result = connection.execute(
+            text("DELETE FROM articles WHERE author LIKE :pattern"), {"pattern": f"{AUTHOR_PREFIX}%"}
+        )
+    _bump_generations(DEFAULT_AUTHORS, DEFAULT_TAGS)
+    return result.rowcount
+
+
+def seed(
+    rows: int,
+    *,
+    authors: int = DEFAULT_AUTHORS,
+    tags: int = DEFAULT_TAGS,
+    seed_value: float = 0.42,
+    verbose: bool = False,
+) -> None:
+    """Inserta ``rows`` artículos en lotes de :data:`BATCH_ROWS` y ejecuta ``ANALYZE``."""
+    params = {"prefix": AUTHOR_PREFIX, "authors": authors, "tags": tags}
+    with engine.connect() as connection:
+        connection.execute(text("SELECT setseed(:seed)"), {"seed": seed_value})
+        connection.commit()
+        for start in range(1, rows + 1, BATCH_ROWS):
+            stop = min(start + BATCH_ROWS - 1, rows)
+            with connection.begin():
+                connection.execute(_INSERT_BATCH, {**params, "start": start, "stop": stop})
+            if verbose:
+                print(f"  {stop:>9,} / {rows:,}")
+        connection.execute(text("ANALYZE articles"))
+        connection.commit()
+    _bump_generations(authors, tags)
+
+
+def _bump_generations(authors: int, tags: int) -> None:
+    # Las filas no pasaron por el servicio: se invalidan a mano los listados/conteos cacheados.
+    ArticleCache(get_redis_client()).bump_generations(
+        authors=[f"{AUTHOR_PREFIX}{index}" for index in range(authors)],
+        tags=[f"tag{index}" for index in range(tags)],
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000, help="Artículos a insertar (1k a 1M)")
+    parser.add_argument("--authors", type=int, default=DEFAULT_AUTHORS)
+    parser.add_argument("--tags", type=int, default=DEFAULT_TAGS)
+    parser.add_argument("--seed", type=float, default=0.42, help="Semilla de random() (entre -1 y 1)")
+    parser.add_argument("--cleanup", action="store_true", help="Sólo borrar los artículos sembrados")
+    args = parser.parse_args()
+
+    removed = cleanup()
+    print(f"Borrados {removed:,} artículos sembrados previamente")
+    if args.cleanup:
+        return
+
+    print(f"Sembrando {args.rows:,} artículos ({args.authors} autores, {args.tags} etiquetas)...")
+    started = time.perf_counter()
+    seed(args.rows, authors=args.authors, tags=args.tags, seed_value=args.seed, verbose=True)
+    elapsed = time.perf_counter() - started
+    print(f"Listo en {elapsed:.1f} s ({args.rows / elapsed:,.0f} filas/s)")
+
+
+if __name__ == "__main__":
+    main()
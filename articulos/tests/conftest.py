@@ -2,21 +2,36 @@
 
 from __future__ import annotations
 
+import functools
+import inspect
 import os
 import uuid
-from collections.abc import Generator
-from typing import Any, Dict, Optional
+from collections.abc import Generator, Iterator
+from contextlib import contextmanager, nullcontext
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
 
 import pytest
+from anyio.from_thread import BlockingPortal, start_blocking_portal
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
-
-from app.api.deps import enforce_api_key, get_article_service, get_db_session
+from sqlalchemy.pool import NullPool
+
+from app.api.deps import (
+    enforce_api_key,
+    get_article_service,
+    get_async_article_service,
+    get_async_export_sessions,
+    get_db_session,
+    get_export_sessions,
+)
+from app.cache import filter_scopes
+from app.concurrency import run_in_greenlet
 from app.config import settings
 from app.database import Base
 from app.main import app
-from app.services import ArticleService
+from app.services import ArticleService, AsyncArticleService
 
 TEST_DATABASE_URL = os.getenv(
     "TEST_DATABASE_URL",
@@ -33,6 +48,11 @@ class DummyCache:
 
     def __init__(self) -> None:
         self._store: Dict[str, Dict[str, Any]] = {}
+        self._rendered: Dict[str, bytes] = {}
+        self._projections: Dict[str, Dict[Tuple[str, ...], Dict[str, Any]]] = {}
+        self._counts: Dict[Any, Any] = {}
+        self._listings: Dict[str, Any] = {}
+        self._generations: Dict[str, int] = {}
 
     @staticmethod
     def _key(article_id: str) -> str:
@@ -41,11 +61,116 @@ class DummyCache:
     def get(self, article_id: str) -> Optional[Dict[str, Any]]:
         return self._store.get(self._key(article_id))
 
-    def set(self, article_id: str, payload: Dict[str, Any]) -> None:
+    def set(self, article_id: str, payload: Dict[str, Any], *, rendered: Optional[bytes] = None) -> None:
         self._store[self._key(article_id)] = payload
+        self._projections.pop(article_id, None)
+        if rendered is not None:
+            self._rendered[self._key(article_id)] = rendered
 
     def invalidate(self, article_id: str) -> None:
         self._store.pop(self._key(article_id), None)
+        self._rendered.pop(self._key(article_id), None)
+        self._projections.pop(article_id, None)
+
+    def invalidate_many(self, article_ids: Sequence[str]) -> None:
+        for article_id in article_ids:
+            self.invalidate(article_id)
+
+    def get_projection(self, article_id: str, fields: Iterable[str]) -> Optional[Dict[str, Any]]:
+        return self._projections.get(article_id, {}).get(tuple(sorted(fields)))
+
+    def set_projection(self, article_id: str, fields: Iterable[str], payload: Dict[str, Any]) -> None:
+        self._projections.setdefault(article_id, {})[tuple(sorted(fields))] = payload
+
+    def get_rendered(self, article_id: str) -> Tuple[Optional[bytes], float, Optional[str]]:
+        rendered = self._rendered.get(self._key(article_id))
+        if rendered is None:
+            return None, 0.0, None
+        return rendered, float("inf"), self.get_last_modified(article_id)
+
+    def get_last_modified(self, article_id: str) -> Optional[str]:
+        return (self.get(article_id) or {}).get("updated_at")
+
+    def get_entry(self, article_id: str) -> Tuple[Optional[Dict[str, Any]], float]:
+        return self.get(article_id), float("inf")
+
+    def acquire_lock(self, article_id: str, *, ttl_ms: Optional[int] = None) -> Optional[str]:  # noqa: ARG002
+        return "token"
+
+    def release_lock(self, article_id: str, token: str) -> None:  # noqa: ARG002
+        return None
+
+    def wait_for(self, article_id: str) -> Optional[Dict[str, Any]]:
+        return self.get(article_id)
+
+    def get_many(self, article_ids: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+        return {
+            article_id: self._store[self._key(article_id)]
+            for article_id in article_ids
+            if self._key(article_id) in self._store
+        }
+
+    def set_many(
+        self, payloads: Dict[str, Dict[str, Any]], *, rendered: Optional[Dict[str, bytes]] = None
+    ) -> None:
+        for article_id, payload in payloads.items():
+            self.set(article_id, payload, rendered=(rendered or {}).get(article_id))
+
+    def get_listing(
+        self, query: Dict[str, Any], *, author: Optional[str], tags: Sequence[str]
+    ) -> Tuple[Optional[Dict[str, Any]], str]:
+        stamp = self._stamp(author, tags)
+        cached = self._listings.get(repr(sorted(query.items())))
+        if cached is None or cached[1] != stamp:
+            return None, stamp
+        return cached[0], stamp
+
+    def set_listing(self, query: Dict[str, Any], page: Dict[str, Any], *, stamp: str) -> None:
+        self._listings[repr(sorted(query.items()))] = (page, stamp)
+
+    def _stamp(self, author: Optional[str], tags: Sequence[str]) -> str:
+        return ":".join(str(self._generations.get(scope, 0)) for scope in filter_scopes(author, tags))
+
+    def get_count(
+        self, *, author: Optional[str], tags: Sequence[str], tag_mode: str = "all"
+    ) -> Tuple[Optional[int], str]:
+        stamp = self._stamp(author, tags)
+        cached = self._counts.get((author, tuple(sorted(tags)), tag_mode))
+        if cached is None or cached[1] != stamp:
+            return None, stamp
+        return cached[0], stamp
+
+    def set_count(
+        self, *, author: Optional[str], tags: Sequence[str], tag_mode: str = "all", total: int, stamp: str
+    ) -> None:
+        self._counts[(author, tuple(sorted(tags)), tag_mode)] = (total, stamp)
+
+    def bump_generations(self, *, authors: Iterable[str], tags: Iterable[str]) -> None:
+        scopes = {"all"} | {f"author:{a}" for a in authors if a} | {f"tag:{t}" for t in tags if t}
+        for scope in scopes:
+            self._generations[scope] = self._generations.get(scope, 0) + 1
+
+
+class BlockingProxy:
+    """Permite usar el servicio asíncrono desde pruebas síncronas.
+
+    Las corutinas se ejecutan en el portal; los métodos síncronos (por ejemplo
+    del repositorio) se ejecutan en un greenlet, igual que en ``ASYNC_MODE``.
+    """
+
+    def __init__(self, target: Any, portal: BlockingPortal) -> None:
+        self._target = target
+        self._portal = portal
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._target, name)
+        if inspect.iscoroutinefunction(attr):
+            return lambda *args, **kwargs: self._portal.call(functools.partial(attr, *args, **kwargs))
+        if callable(attr):
+            return lambda *args, **kwargs: self._portal.call(
+                functools.partial(run_in_greenlet, attr, *args, **kwargs)
+            )
+        return BlockingProxy(attr, self._portal)
 
 
 @pytest.fixture(scope="session")
@@ -87,33 +212,88 @@ def db_session(engine, session_factory) -> Generator[Session, None, None]:
         connection.close()
 
 
+@pytest.fixture(scope="session")
+def async_engine() -> AsyncEngine:
+    # NullPool: cada prueba usa su propio event loop y no deben compartirse conexiones.
+    return create_async_engine(TEST_DATABASE_URL, poolclass=NullPool)
+
+
+@contextmanager
+def _async_db_session(portal: BlockingPortal, async_engine: AsyncEngine) -> Iterator[AsyncSession]:
+    connection = async_engine.connect()
+    portal.call(connection.start)
+    transaction = portal.call(connection.begin)
+    session = AsyncSession(bind=connection, autoflush=False)
+    try:
+        yield session
+        portal.call(session.commit)
+    finally:
+        portal.call(session.close)
+        portal.call(transaction.rollback)
+        portal.call(connection.close)
+
+
+@pytest.fixture(params=["sync", "async"])
+def service_mode(request) -> str:
+    """Ejecuta las pruebas de servicio y API en ambos modos (``ASYNC_MODE``)."""
+    return request.param
+
+
 @pytest.fixture()
 def cache() -> DummyCache:
     return DummyCache()
 
 
 @pytest.fixture()
-def service(db_session: Session, cache: DummyCache) -> Generator[ArticleService, None, None]:
-    service = ArticleService(session=db_session, cache=cache)
-    yield service
+def service(request, service_mode: str, cache: DummyCache) -> Generator[Any, None, None]:
+    if service_mode == "sync":
+        yield ArticleService(session=request.getfixturevalue("db_session"), cache=cache)
+        return
+
+    async_engine = request.getfixturevalue("async_engine")
+    with start_blocking_portal() as portal, _async_db_session(portal, async_engine) as session:
+        yield BlockingProxy(AsyncArticleService(session=session, cache=cache), portal)
 
 
 @pytest.fixture()
-def client(db_session: Session, cache: DummyCache) -> Generator[TestClient, None, None]:
-    original_api_key = settings.api_key
+def client(request, service_mode: str, cache: DummyCache) -> Generator[TestClient, None, None]:
+    original_api_key, original_async_mode = settings.api_key, settings.async_mode
     settings.api_key = "test-key"
 
-    def override_db() -> Generator[Session, None, None]:
-        yield db_session
-
-    def override_service() -> ArticleService:
-        return ArticleService(session=db_session, cache=cache)
-
-    app.dependency_overrides[get_db_session] = override_db
-    app.dependency_overrides[get_article_service] = override_service
-
     with TestClient(app) as test_client:
-        yield test_client
+        if service_mode == "sync":
+            db_session = request.getfixturevalue("db_session")
+
+            def override_db() -> Generator[Session, None, None]:
+                yield db_session
+
+            def override_service() -> ArticleService:
+                return ArticleService(session=db_session, cache=cache)
+
+            app.dependency_overrides[get_db_session] = override_db
+            app.dependency_overrides[get_export_sessions] = lambda: lambda: nullcontext(db_session)
+            app.dependency_overrides[get_article_service] = override_service
+            app.dependency_overrides[get_async_article_service] = override_service
+            yield test_client
+        else:
+            async_engine = request.getfixturevalue("async_engine")
+            with _async_db_session(test_client.portal, async_engine) as async_session:
+
+                def override_async_service() -> AsyncArticleService:
+                    return AsyncArticleService(session=async_session, cache=cache)
+
+                app.dependency_overrides[get_article_service] = override_async_service
+                app.dependency_overrides[get_async_article_service] = override_async_service
+                # Con ``ASYNC_MODE`` el export va por ``aiter_export`` sobre la sesión de la
+                # prueba; ``nullcontext`` admite ``async with`` y no la cierra al terminar.
+                # (La dependencia del endpoint se eligió al importar: se cubren las dos.)
+                for dependency in (get_export_sessions, get_async_export_sessions):
+                    app.dependency_overrides[dependency] = lambda: lambda: nullcontext(async_session)
+                settings.async_mode = True
+                try:
+                    yield test_client
+                finally:
+                    settings.async_mode = original_async_mode
 
     app.dependency_overrides.clear()
     settings.api_key = original_api_key
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import csv
+import io
+import json
 from datetime import datetime
 
 from fastapi import status
@@ -26,6 +29,73 @@ def test_create_and_get_article_via_api(client, api_headers):
     assert fetched["title"] == payload["title"]
 
 
+def test_cached_response_bytes_match_rendered_response(client, api_headers):
+    payload = {"title": "Bytes", "body": "Contenido ñ", "tags": ["cache"], "author": "Laura"}
+    created = client.post("/articles/", json=payload, headers=api_headers)
+
+    # La creación dejó el cuerpo renderizado en caché: la lectura lo devuelve tal cual.
+    response = client.get(f"/articles/{created.json()['id']}", headers=api_headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/json"
+    assert response.content == created.content
+
+
+def test_conditional_get_answers_304_from_cache_metadata(client, api_headers, cache):
+    payload = {"title": "ETag", "body": "Contenido", "tags": ["http"], "author": "Laura"}
+    article_id = client.post("/articles/", json=payload, headers=api_headers).json()["id"]
+
+    response = client.get(f"/articles/{article_id}", headers=api_headers)
+    etag, last_modified = response.headers["etag"], response.headers["last-modified"]
+    assert etag.startswith('"') and response.headers["cache-control"] == "no-cache"
+
+    # Sin el cuerpo renderizado en caché, la metadata basta para el 304.
+    cache._rendered.clear()
+    cache._store[f"article:{article_id}"] = {"updated_at": cache.get(article_id)["updated_at"]}
+    response = client.get(f"/articles/{article_id}", headers={**api_headers, "If-None-Match": etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+    response = client.get(
+        f"/articles/{article_id}", headers={**api_headers, "If-Modified-Since": last_modified}
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    cache.invalidate(article_id)
+    response = client.get(f"/articles/{article_id}", headers={**api_headers, "If-None-Match": '"otro"'})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["etag"] == etag
+
+    summary = client.get(f"/articles/{article_id}?fields=summary", headers=api_headers)
+    assert summary.headers["etag"] != etag
+
+
+def test_if_none_match_uses_weak_comparison(client, api_headers):
+    payload = {"title": "Débil", "body": "x", "tags": ["etag"], "author": "Laura"}
+    article_id = client.post("/articles/", json=payload, headers=api_headers).json()["id"]
+    etag = client.get(f"/articles/{article_id}", headers=api_headers).headers["etag"]
+
+    # Un proxy que comprime el cuerpo reenvía el ETag debilitado: sigue siendo 304.
+    for candidate in (f"W/{etag}", f'"otro", W/{etag}'):
+        response = client.get(f"/articles/{article_id}", headers={**api_headers, "If-None-Match": candidate})
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+def test_list_etag_changes_with_the_page(client, api_headers):
+    payload = {"title": "Página 1", "body": "x", "tags": ["etag"], "author": "Etag"}
+    client.post("/articles/", json=payload, headers=api_headers)
+
+    response = client.get("/articles/?author=Etag", headers=api_headers)
+    etag = response.headers["etag"]
+    response = client.get("/articles/?author=Etag", headers={**api_headers, "If-None-Match": etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    client.post("/articles/", json={**payload, "title": "Página 2"}, headers=api_headers)
+    response = client.get("/articles/?author=Etag", headers={**api_headers, "If-None-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["etag"] != etag
+
+
 def test_list_filters_and_pagination(client, api_headers):
     for idx in range(3):
         payload = {
@@ -70,3 +140,207 @@ def test_update_and_delete_via_api(client, api_headers):
 def test_requires_api_key(client):
     response = client.get("/articles/")
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_cursor_pagination_walks_all_pages(client, api_headers):
+    for idx in range(5):
+        client.post(
+            "/articles/",
+            json={
+                "title": f"Cursor {idx}",
+                "body": "Contenido",
+                "tags": ["cursor"],
+                "author": "Cursor",
+            },
+            headers=api_headers,
+        )
+
+    titles = []
+    cursor = None
+    while True:
+        params = {"author": "Cursor", "limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/articles/", params=params, headers=api_headers)
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        titles.extend(item["title"] for item in data["items"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+
+    assert sorted(titles) == [f"Cursor {idx}" for idx in range(5)]
+
+
+def test_invalid_cursor_returns_400(client, api_headers):
+    response = client.get("/articles/?cursor=no-es-un-cursor", headers=api_headers)
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_search_returns_ranked_snippets_with_cursor(client, api_headers):
+    for title, body in (
+        ("Búsqueda en PostgreSQL", "Índices GIN"),
+        ("Otro artículo", "Explica la búsqueda de texto completo en PostgreSQL"),
+        ("Sin coincidencias", "Nada que ver"),
+    ):
+        client.post(
+            "/articles/",
+            json={"title": title, "body": body, "tags": ["fts"], "author": "Buscador"},
+            headers=api_headers,
+        )
+
+    params = {"q": "postgresql", "limit": 1, "author": "Buscador"}
+    response = client.get("/articles/search", params=params, headers=api_headers)
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert [item["title"] for item in data["items"]] == ["Búsqueda en PostgreSQL"]
+    assert "body" not in data["items"][0]
+
+    cursor = data["next_cursor"]
+    # El cursor queda atado al texto y los filtros de la búsqueda que lo generó.
+    for changed in ({"q": "índices"}, {"author": "Otro"}, {"tag": "fts"}):
+        response = client.get(
+            "/articles/search", params={**params, **changed, "cursor": cursor}, headers=api_headers
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST, changed
+
+    response = client.get("/articles/search", params={**params, "cursor": cursor}, headers=api_headers)
+    data = response.json()
+    assert [item["title"] for item in data["items"]] == ["Otro artículo"]
+    assert "<mark>" in data["items"][0]["snippet"]
+    assert data["next_cursor"] is None
+
+    response = client.get("/articles/search?q=postgresql&cursor=roto", headers=api_headers)
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_bulk_delete_by_ids_and_by_filter(client, api_headers):
+    ids = []
+    for idx, author in enumerate(("Purga", "Purga", "Otro")):
+        response = client.post(
+            "/articles/",
+            json={"title": f"Purga {idx}", "body": "x", "tags": ["purga"], "author": author},
+            headers=api_headers,
+        )
+        ids.append(response.json()["id"])
+
+    response = client.delete(f"/articles/batch?ids={ids[0]},{ids[0]}", headers=api_headers)
+    assert response.json() == {"deleted": 1, "ids": [ids[0]]}
+
+    response = client.delete("/articles/", headers=api_headers)
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    response = client.delete("/articles/?author=Purga&tag=purga", headers=api_headers)
+    assert response.json() == {"deleted": 1, "ids": [ids[1]]}
+    assert client.get(f"/articles/{ids[1]}", headers=api_headers).status_code == status.HTTP_404_NOT_FOUND
+    assert client.get(f"/articles/{ids[2]}", headers=api_headers).status_code == status.HTTP_200_OK
+
+
+def test_list_total_modes(client, api_headers):
+    for idx in range(3):
+        client.post(
+            "/articles/",
+            json={"title": f"Total {idx}", "body": "Contenido", "tags": ["total"], "author": "Total"},
+            headers=api_headers,
+        )
+
+    response = client.get("/articles/?author=Total&limit=1&total=exact", headers=api_headers)
+    assert response.json()["total"] == 3
+
+    response = client.get("/articles/?author=Total&limit=1&total=none", headers=api_headers)
+    assert response.json()["total"] is None
+
+    response = client.get("/articles/?author=Total&limit=1&total=estimate", headers=api_headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert isinstance(response.json()["total"], int)
+
+
+def test_list_with_repeated_tags(client, api_headers):
+    for title, tags in (("Multi A", ["x", "y"]), ("Multi B", ["x"]), ("Multi C", ["z"])):
+        client.post(
+            "/articles/",
+            json={"title": title, "body": "Contenido", "tags": tags, "author": "Multi"},
+            headers=api_headers,
+        )
+
+    response = client.get("/articles/?author=Multi&tag=x&tag=y", headers=api_headers)
+    assert [item["title"] for item in response.json()["items"]] == ["Multi A"]
+
+    response = client.get("/articles/?author=Multi&tag=y&tag=z&tag_mode=any", headers=api_headers)
+    assert {item["title"] for item in response.json()["items"]} == {"Multi A", "Multi C"}
+
+
+def test_bulk_create_reports_invalid_items(client, api_headers):
+    payload = [
+        {"title": "Bulk API 1", "body": "Contenido", "tags": ["bulk"], "author": "Laura"},
+        {"title": "", "body": "Contenido", "author": "Laura"},
+        {"title": "Bulk API 1", "body": "Otra vez", "author": "Laura"},
+    ]
+
+    response = client.post("/articles/bulk", json=payload, headers=api_headers)
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert (data["created"], data["invalid"], data["conflicts"]) == (1, 1, 1)
+    assert [item["status"] for item in data["items"]] == ["created", "invalid", "conflict"]
+
+    fetched = client.get(f"/articles/{data['items'][0]['id']}", headers=api_headers)
+    assert fetched.json()["title"] == "Bulk API 1"
+
+
+def test_batch_get_by_ids(client, api_headers):
+    ids = []
+    for idx in range(3):
+        payload = {"title": f"Batch {idx}", "body": "Contenido", "author": "Laura"}
+        ids.append(client.post("/articles/", json=payload, headers=api_headers).json()["id"])
+    unknown = "00000000-0000-0000-0000-000000000000"
+
+    response = client.get(
+        f"/articles/batch?ids={ids[2]},{ids[0]}&ids={unknown}", headers=api_headers
+    )
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert [item["id"] for item in data["items"]] == [ids[2], ids[0]]
+    assert data["missing"] == [unknown]
+
+    response = client.post("/articles/batch", json={"ids": [ids[1]]}, headers=api_headers)
+    assert [item["id"] for item in response.json()["items"]] == [ids[1]]
+
+
+def test_export_streams_ndjson_and_csv(client, api_headers):
+    for idx in range(3):
+        payload = {"title": f"Export {idx}", "body": "Contenido", "tags": ["a", "b"], "author": "Exporta"}
+        client.post("/articles/", json=payload, headers=api_headers)
+
+    response = client.get("/articles/export?author=Exporta&order=asc", headers=api_headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert sorted(row["title"] for row in rows) == ["Export 0", "Export 1", "Export 2"]
+    assert rows[0]["tags"] == ["a", "b"]
+
+    response = client.get("/articles/export?author=Exporta&format=csv", headers=api_headers)
+    assert response.headers["content-type"].startswith("text/csv")
+    records = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(records) == 3
+    assert records[0]["tags"] == "a;b"
+
+
+def test_list_sparse_fields(client, api_headers):
+    payload = {"title": "Sparse", "body": "Contenido largo", "tags": ["x"], "author": "Sparse"}
+    client.post("/articles/", json=payload, headers=api_headers)
+
+    response = client.get("/articles/?author=Sparse&fields=title,tags", headers=api_headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert set(response.json()["items"][0]) == {"id", "title", "tags"}
+
+    response = client.get("/articles/?fields=title,desconocido", headers=api_headers)
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_get_with_summary_fields(client, api_headers):
+    payload = {"title": "Resumen", "body": "Contenido largo", "tags": ["x"], "author": "Sparse"}
+    article_id = client.post("/articles/", json=payload, headers=api_headers).json()["id"]
+
+    response = client.get(f"/articles/{article_id}?fields=summary", headers=api_headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert set(response.json()) == {"id", "title", "tags", "author", "published_at"}
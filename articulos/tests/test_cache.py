@@ -4,21 +4,102 @@ from __future__ import annotations
 
 import json
 
-from app.cache import ArticleCache
+import pytest
+
+from app import cache as cache_module
+from app import warmup
+from app.cache import (
+    HOT_KEYS_KEY,
+    INVALIDATION_CHANNEL,
+    AccessCounter,
+    ArticleCache,
+    InvalidationListener,
+    LocalCache,
+    get_codec,
+    init_cache_codec,
+)
+from app.config import settings
 
 
 class FakeRedis:
     def __init__(self) -> None:
         self.store: dict[str, bytes] = {}
+        self.sorted_sets: dict[str, dict[str, float]] = {}
+        self.published: list = []
+        self.pipelines = 0
 
     def get(self, key: str):
         return self.store.get(key)
 
-    def setex(self, key: str, ttl: int, value: str) -> None:  # noqa: ARG002
-        self.store[key] = value.encode("utf-8")
+    def setex(self, key: str, ttl: int, value) -> None:  # noqa: ARG002
+        self.store[key] = value.encode("utf-8") if isinstance(value, str) else value
+
+    def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.store.pop(key, None)
+
+    def pttl(self, key: str) -> int:
+        return -1 if key in self.store else -2
+
+    def mget(self, keys):
+        return [self.store.get(key) for key in keys]
+
+    def publish(self, channel: str, message: str) -> int:
+        self.published.append((channel, json.loads(message)))
+        return 0
+
+    def set(self, key: str, value, nx: bool = False, px=None):  # noqa: ARG002
+        if nx and key in self.store:
+            return None
+        self.store[key] = value.encode("utf-8") if isinstance(value, str) else value
+        return True
+
+    def zincrby(self, key: str, amount: float, member: str) -> float:
+        scores = self.sorted_sets.setdefault(key, {})
+        scores[member] = scores.get(member, 0.0) + amount
+        return scores[member]
+
+    def zrevrange(self, key: str, start: int, end: int):
+        ranked = sorted(self.sorted_sets.get(key, {}).items(), key=lambda item: -item[1])
+        return [member.encode("utf-8") for member, _ in ranked[start : end + 1]]
+
+    def zrem(self, key: str, *members: str) -> None:
+        for member in members:
+            self.sorted_sets.get(key, {}).pop(member, None)
+
+    def zunionstore(self, dest: str, keys: dict) -> None:
+        ((source, weight),) = keys.items()
+        self.sorted_sets[dest] = {m: v * weight for m, v in self.sorted_sets.get(source, {}).items()}
+
+    def zremrangebyrank(self, key: str, start: int, end: int) -> None:  # noqa: ARG002
+        ranked = sorted(self.sorted_sets.get(key, {}).items(), key=lambda item: item[1])
+        self.sorted_sets[key] = dict(ranked[end + 1 :] if end < 0 else ranked)
+
+    def incr(self, key: str) -> int:
+        value = int(self.store.get(key, b"0")) + 1
+        self.store[key] = str(value).encode("ascii")
+        return value
+
+    def pipeline(self, transaction: bool = True):  # noqa: ARG002
+        self.pipelines += 1
+        return FakePipeline(self)
+
 
-    def delete(self, key: str) -> None:
-        self.store.pop(key, None)
+class FakePipeline:
+    def __init__(self, redis: FakeRedis) -> None:
+        self._redis = redis
+        self._calls = []
+
+    def __getattr__(self, name: str):
+        def queue(*args, **kwargs):
+            self._calls.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    def execute(self):
+        calls, self._calls = self._calls, []
+        return [getattr(self._redis, name)(*args, **kwargs) for name, args, kwargs in calls]
 
 
 def test_cache_roundtrip():
@@ -36,3 +117,306 @@ def test_cache_roundtrip():
 
     cache.invalidate("123")
     assert cache.get("123") is None
+
+
+def test_redis_clients_share_process_pool():
+    from app import cache as cache_module
+
+    cache_module.close_redis_pool()
+    try:
+        first = cache_module.get_redis_client()
+        second = cache_module.get_redis_client()
+        assert first.connection_pool is second.connection_pool
+        assert first.connection_pool.max_connections == cache_module.settings.redis_max_connections
+    finally:
+        cache_module.close_redis_pool()
+
+
+def test_cache_over_async_client():
+    import asyncio
+
+    from app.concurrency import AwaitingProxy, run_in_greenlet
+
+    class FakeAsyncRedis:
+        def __init__(self) -> None:
+            self.sync = FakeRedis()
+
+        async def get(self, key: str):
+            return self.sync.get(key)
+
+        async def setex(self, key: str, ttl: int, value: str) -> None:
+            self.sync.setex(key, ttl, value)
+
+        async def delete(self, *keys: str) -> None:
+            self.sync.delete(*keys)
+
+        def pipeline(self, transaction: bool = True):  # noqa: ARG002
+            # Como en redis.asyncio: se encola de forma síncrona y sólo ``execute`` se espera.
+            pipe = FakePipeline(self.sync)
+
+            async def execute():
+                return FakePipeline.execute(pipe)
+
+            pipe.execute = execute
+            return pipe
+
+    fake = FakeAsyncRedis()
+    cache = ArticleCache(AwaitingProxy(fake))
+
+    def roundtrip():
+        cache.set("abc", {"id": "abc"})
+        restored = cache.get("abc")
+        cache.invalidate("abc")
+        return restored, cache.get("abc")
+
+    restored, missing = asyncio.run(run_in_greenlet(roundtrip))
+    assert restored == {"id": "abc"}
+    assert missing is None
+
+
+def test_count_cache_is_invalidated_only_by_related_writes():
+    cache = ArticleCache(FakeRedis())
+
+    total, stamp = cache.get_count(author="Ana", tags=[])
+    assert total is None
+    cache.set_count(author="Ana", tags=[], total=7, stamp=stamp)
+    assert cache.get_count(author="Ana", tags=[])[0] == 7
+
+    # Una escritura de otro autor no afecta el conteo de Ana...
+    cache.bump_generations(authors=["Luis"], tags=["redis"])
+    assert cache.get_count(author="Ana", tags=[])[0] == 7
+
+    # ...pero una de Ana sí.
+    cache.bump_generations(authors=["Ana"], tags=[])
+    assert cache.get_count(author="Ana", tags=[])[0] is None
+
+
+def test_count_computed_during_a_write_is_not_trusted():
+    cache = ArticleCache(FakeRedis())
+
+    _, stamp = cache.get_count(author=None, tags=["redis"])
+    cache.bump_generations(authors=["Ana"], tags=["redis"])
+    cache.set_count(author=None, tags=["redis"], total=3, stamp=stamp)
+
+    assert cache.get_count(author=None, tags=["redis"])[0] is None
+
+
+def test_listing_cache_and_batch_reads():
+    fake = FakeRedis()
+    cache = ArticleCache(fake)
+    query = {"author": "Ana", "limit": 10}
+
+    cache.set_many({"1": {"id": "1"}, "2": {"id": "2"}})
+    assert cache.get_many(["1", "3", "2"]) == {"1": {"id": "1"}, "2": {"id": "2"}}
+
+    page, stamp = cache.get_listing(query, author="Ana", tags=[])
+    assert page is None
+    cache.set_listing(query, {"ids": ["1", "2"], "total": 2, "next": None}, stamp=stamp)
+    assert cache.get_listing(query, author="Ana", tags=[])[0]["ids"] == ["1", "2"]
+
+    cache.bump_generations(authors=["Ana"], tags=["redis"])
+    assert cache.get_listing(query, author="Ana", tags=[])[0] is None
+
+
+def test_local_cache_evicts_least_recently_used_by_bytes():
+    local = LocalCache(max_bytes=30, ttl_seconds=60)
+    local.set("a", b"x" * 10, {"id": "a"})
+    local.set("b", b"x" * 10, {"id": "b"})
+    assert local.get("a") is not None  # "a" pasa a ser la más reciente
+
+    local.set("c", b"x" * 15, {"id": "c"})
+
+    assert local.get("b") is None
+    assert local.get("a") is not None
+    assert local.get("c") is not None
+    assert local.size_bytes == 25
+
+
+def test_l1_serves_reads_and_broadcasts_invalidations():
+    fake = FakeRedis()
+    local = LocalCache(max_bytes=1024, ttl_seconds=60)
+    cache = ArticleCache(fake, local=local)
+
+    cache.set("1", {"id": "1", "title": "L1"})
+    assert fake.published[-1][0] == INVALIDATION_CHANNEL
+    assert fake.published[-1][1]["k"] == ["article:1"]
+
+    assert cache.get("1") == {"id": "1", "title": "L1"}
+    fake.store.clear()  # el segundo acierto no llega a Redis
+    assert cache.get("1") == {"id": "1", "title": "L1"}
+    assert cache.get_many(["1", "2"]) == {"1": {"id": "1", "title": "L1"}}
+
+    cache.invalidate("1")
+    assert cache.get("1") is None
+    assert fake.published[-1][1]["k"] == [
+        "article:1",
+        "article:1:json",
+        "article:1:fields",
+        "article:1:meta",
+    ]
+
+
+def test_invalidate_many_evicts_every_key_in_one_pipeline():
+    fake = FakeRedis()
+    local = LocalCache(max_bytes=4096, ttl_seconds=60)
+    cache = ArticleCache(fake, local=local)
+    cache.set_many({str(idx): {"id": str(idx)} for idx in range(3)}, rendered={"0": b"{}"})
+    cache.get("1")
+
+    fake.pipelines = 0
+    cache.invalidate_many(["0", "1", "2"])
+    assert fake.pipelines == 1
+    assert fake.store == {}
+    assert cache.get("1") is None
+    assert "article:2:fields" in fake.published[-1][1]["k"]
+
+
+def test_listener_drops_keys_written_by_other_workers():
+    fake = FakeRedis()
+    local = LocalCache(max_bytes=1024, ttl_seconds=60)
+    cache = ArticleCache(fake, local=local)
+    cache.set("1", {"id": "1"})
+    assert cache.get("1") == {"id": "1"}
+    listener = InvalidationListener(fake, local)
+
+    listener.handle(json.dumps({"o": fake.published[-1][1]["o"], "k": ["article:1"]}).encode())
+    assert local.get("article:1") is not None  # los avisos propios se ignoran
+
+    listener.handle(json.dumps({"o": "otro-worker", "k": ["article:1"]}).encode())
+    assert local.get("article:1") is None
+
+
+@pytest.mark.parametrize("codec_name", ["json", "orjson", "msgpack"])
+def test_codecs_roundtrip_payloads(codec_name):
+    if codec_name != "json":
+        pytest.importorskip(codec_name)
+    cache = ArticleCache(FakeRedis(), codec=get_codec(codec_name))
+    payload = {"id": "1", "title": "Códec", "tags": ["a", "b"], "published_at": None}
+
+    cache.set("1", payload)
+    assert cache.get("1") == payload
+
+    total, stamp = cache.get_count(author=None, tags=[])
+    cache.set_count(author=None, tags=[], total=3, stamp=stamp)
+    assert cache.get_count(author=None, tags=[])[0] == 3
+
+
+def test_entries_from_another_codec_are_misses():
+    pytest.importorskip("msgpack")
+    fake = FakeRedis()
+    ArticleCache(fake, codec=get_codec("msgpack")).set("1", {"id": "1"})
+
+    assert ArticleCache(fake, codec=get_codec("json")).get("1") is None
+
+
+def test_cache_codec_is_resolved_once_and_missing_packages_fail_at_startup(monkeypatch):
+    monkeypatch.setattr(cache_module, "_cache_codec", None)
+    codec = init_cache_codec()
+    assert ArticleCache(FakeRedis())._codec is codec
+    assert ArticleCache(FakeRedis())._codec is ArticleCache(FakeRedis())._codec
+
+    monkeypatch.setattr(cache_module, "_cache_codec", None)
+    monkeypatch.setattr(settings, "cache_codec", "msgpack")
+    monkeypatch.setitem(cache_module._CODECS, "msgpack", (cache_module.MsgpackCodec, None))
+    with pytest.raises(RuntimeError, match="msgpack"):
+        init_cache_codec()
+
+
+def test_rendered_body_is_stored_and_invalidated_with_the_article():
+    fake = FakeRedis()
+    cache = ArticleCache(fake)
+    body = b'{"id":"1"}'
+
+    cache.set("1", {"id": "1"}, rendered=body)
+    assert cache.get_rendered("1")[0] == body
+
+    cache.invalidate("1")
+    assert cache.get_rendered("1") == (None, 0.0, None)
+
+
+def test_updated_at_metadata_is_kept_next_to_the_rendered_body():
+    fake = FakeRedis()
+    cache = ArticleCache(fake, local=LocalCache(max_bytes=4096, ttl_seconds=60))
+    updated_at = "2024-09-16T10:00:00+00:00"
+
+    cache.set("1", {"id": "1", "updated_at": updated_at}, rendered=b'{"id":"1"}')
+    assert fake.store["article:1:meta"] == updated_at.encode("ascii")
+    assert cache.get_last_modified("1") == updated_at
+    assert cache.get_rendered("1")[2] == updated_at
+
+    cache.invalidate("1")
+    assert cache.get_last_modified("1") is None
+
+
+def test_cache_operations_report_latency_and_hits():
+    pytest.importorskip("prometheus_client")
+    from app import metrics
+
+    if not metrics.ENABLED:
+        pytest.skip("METRICS_ENABLED=false")
+
+    def lookups(result: str) -> float:
+        labels = {"operation": "get", "result": result}
+        return metrics.REGISTRY.get_sample_value("articles_cache_lookups_total", labels) or 0.0
+
+    hits, misses = lookups("hit"), lookups("miss")
+    durations = metrics.REGISTRY.get_sample_value(
+        "articles_cache_operation_duration_seconds_count", {"operation": "get"}
+    ) or 0.0
+    cache = ArticleCache(FakeRedis())
+
+    assert cache.get("a1") is None
+    cache.set("a1", {"id": "a1"})
+    assert cache.get("a1") == {"id": "a1"}
+
+    assert lookups("hit") == hits + 1
+    assert lookups("miss") == misses + 1
+    assert metrics.REGISTRY.get_sample_value(
+        "articles_cache_operation_duration_seconds_count", {"operation": "get"}
+    ) == durations + 2
+
+
+def test_reads_are_counted_and_feed_the_hot_ranking():
+    fake = FakeRedis()
+    counter = AccessCounter()
+    cache = ArticleCache(fake, access=counter)
+    for article_id in ("a", "b", "b", "c", "c", "c"):
+        cache.get(article_id)
+    cache.get_entry("c")
+
+    cache.record_accesses(counter.drain())
+    assert counter.drain() == {}
+    assert cache.hot_articles(2) == ["c", "b"]
+
+    cache.decay_hot(0.5, max_keys=2)
+    assert fake.sorted_sets[HOT_KEYS_KEY] == {"b": 1.0, "c": 2.0}
+    cache.forget_hot(["c"])
+    assert cache.hot_articles(5) == ["b"]
+
+
+def test_expiring_reports_missing_and_soon_to_expire_keys():
+    fake = FakeRedis()
+    ttls = {"article:fresh": 90_000, "article:forever": -1, "article:soon": 5_000}
+    fake.pttl = lambda key: ttls.get(key, -2)
+    cache = ArticleCache(fake)
+
+    assert cache.expiring(["fresh", "forever", "soon", "gone"], 30) == ["soon", "gone"]
+    assert cache.expiring(["fresh", "soon", "gone"], 0) == ["gone"]
+    # Sólo un worker por intervalo obtiene el turno de refresco.
+    assert cache.claim_refresh(15_000) is True
+    assert cache.claim_refresh(15_000) is False
+
+
+def test_warmup_writes_through_the_process_l1_and_broadcasts(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(settings, "l1_cache_enabled", True)
+    monkeypatch.setattr(cache_module, "_local_cache", None)
+    monkeypatch.setattr(warmup, "get_redis_client", lambda: fake)
+
+    cache = warmup.shared_cache()
+    assert cache._local is cache_module.get_local_cache()
+
+    # Refrescar una clave caliente avisa a los otros workers para que suelten su L1.
+    cache.set_many({"1": {"id": "1", "title": "Refrescado"}})
+    assert fake.published[-1][0] == INVALIDATION_CHANNEL
+    assert fake.published[-1][1]["k"] == ["article:1"]
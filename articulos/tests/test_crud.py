@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import re
 import uuid
 
 import pytest
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.exc import IntegrityError
 
-from app.crud.article import ArticleRepository
+from app.crud.article import ArticleRepository, columns_for
 from app.models.article import Article
 
 
@@ -79,3 +81,91 @@ def test_delete_article(repository):
     repository.save()
 
     assert repository.get(str(article.id)) is None
+
+
+def test_keyset_pagination_has_no_gaps_or_duplicates(repository):
+    from datetime import datetime, timezone
+
+    published = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    for idx in range(5):
+        repository.create(
+            _build_article(
+                title=f"Keyset {idx}",
+                # Fechas repetidas y nulas: el desempate por id debe mantener el orden total.
+                published_at=None if idx == 4 else published,
+            )
+        )
+    repository.save()
+
+    seen = []
+    after = None
+    while True:
+        page = repository.list(limit=2, after=after)
+        if not page:
+            break
+        seen.extend(article.id for article in page)
+        last = page[-1]
+        after = (last.published_at, last.id)
+
+    assert len(seen) == 5
+    assert len(set(seen)) == 5
+    assert seen == [article.id for article in repository.list(limit=10)]
+
+
+def test_tag_filters_use_gin_index_operators():
+    # El GIN ``ix_articles_tags`` sólo sirve a ``@>``/``&&`` sobre la columna tal cual:
+    # ``ANY(tags)``, ``unnest`` o una expresión sobre ``tags`` lo dejarían sin uso.
+    repository = ArticleRepository(None)
+    queries = {
+        "tag": (repository._list_query(tags=["raro"]), "@>"),
+        "author+tag": (repository._list_query(author="Autor", tags=["raro"]), "@>"),
+        "all": (repository._list_query(tags=["raro", "gin"]), "@>"),
+        "any": (repository._list_query(tags=["raro", "gin"], tag_mode="any"), "&&"),
+    }
+    for label, (stmt, operator) in queries.items():
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert re.search(rf"\barticles\.tags {re.escape(operator)} ", sql), (label, sql)
+
+
+def test_multi_tag_any_and_all(repository):
+    repository.create(_build_article(title="A", tags=["python", "fastapi"]))
+    repository.create(_build_article(title="B", tags=["python"]))
+    repository.create(_build_article(title="C", tags=["redis"]))
+    repository.save()
+
+    assert {a.title for a in repository.list(tags=["python", "fastapi"])} == {"A"}
+    assert {a.title for a in repository.list(tags=["fastapi", "redis"], tag_mode="any")} == {"A", "C"}
+
+
+def test_read_paths_return_core_rows_without_identity_map(repository, db_session):
+    article = _build_article(title="Core")
+    repository.create(article)
+    repository.save()
+    article_id = str(article.id)
+    db_session.expunge_all()
+
+    row = repository.get_row(article_id)
+    assert row.title == "Core"
+    assert repository.get_row("no-es-uuid") is None
+
+    rows = repository.list(columns=columns_for(["title"]))
+    assert set(rows[0]._mapping) == {"id", "title", "published_at", "updated_at"}
+    assert len(db_session.identity_map) == 0
+
+
+def test_search_ranks_title_matches_first_and_pages_by_rank(repository):
+    repository.create(_build_article(title="Guía de Redis", body="Configuración básica"))
+    repository.create(_build_article(title="Notas", body="Se usa redis como caché", tags=["cache"]))
+    repository.create(_build_article(title="Otra", body="Sin relación"))
+    repository.save()
+
+    rows = repository.search("redis", limit=10)
+    assert [row.title for row in rows] == ["Guía de Redis", "Notas"]
+    assert rows[0].rank > rows[1].rank
+    assert "<mark>" in rows[1].snippet
+    assert "body" not in rows[0]._mapping
+
+    first = repository.search("redis", limit=1)[0]
+    rest = repository.search("redis", limit=10, after=(first.rank, first.id))
+    assert [row.title for row in rest] == ["Notas"]
+    assert [row.title for row in repository.search("redis", tags=["cache"])] == ["Notas"]
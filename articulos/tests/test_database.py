@@ -0,0 +1,201 @@
+"""Pruebas de la configuración y las métricas del pool de conexiones."""
+
+from __future__ import annotations
+
+import os
+import uuid
+
+import pytest
+from sqlalchemy import create_engine, delete, insert, select, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import NullPool
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from app import database
+from app.config import settings
+from app.crud.article import ArticleRepository
+from app.database import POOL_STATS, Base, PoolStats, TimedQueuePool
+from app.models.article import Article
+from app.replicas import (
+    STICKY_COOKIE,
+    ReadYourWritesMiddleware,
+    ReplicaSet,
+    RequestRouting,
+    RoutingSession,
+    current_routing,
+    primary_reads,
+)
+
+
+def test_pool_listeners_count_checkouts_overflow_and_timeouts(monkeypatch):
+    stats = PoolStats()
+    monkeypatch.setitem(POOL_STATS, "sync", stats)
+    engine = create_engine(
+        "sqlite://", poolclass=TimedQueuePool, pool_size=1, max_overflow=1, pool_timeout=0.05
+    )
+    database._instrument(engine, stats)
+
+    first = engine.connect()
+    second = engine.connect()  # usa el único lugar de overflow
+    assert engine.pool.checkedout() == 2
+    assert engine.pool.overflow() == 1
+    with pytest.raises(PoolTimeoutError):
+        engine.connect()
+    first.close()
+    second.close()
+    engine.dispose()
+
+    assert stats.checkouts == 2 and stats.checkins == 2
+    assert stats.connects == 2
+    assert stats.timeouts == 1
+    assert stats.wait_seconds_max >= 0.05
+
+
+def test_engine_options_follow_settings(monkeypatch):
+    monkeypatch.setattr(settings, "db_pgbouncer_mode", False)
+    monkeypatch.setattr(settings, "db_statement_timeout_ms", 1500)
+    options = database._engine_options(TimedQueuePool)
+    assert options["pool_size"] == settings.db_pool_size
+    assert options["connect_args"] == {"options": "-c statement_timeout=1500"}
+
+    monkeypatch.setattr(settings, "db_pgbouncer_mode", True)
+    options = database._engine_options(TimedQueuePool)
+    assert options["poolclass"] is NullPool
+    assert options["connect_args"] == {"prepare_threshold": None}
+
+
+def _sqlite_engines(count: int):
+    return [create_engine("sqlite://") for _ in range(count)]
+
+
+def test_routing_session_sends_reads_to_replicas_and_sticks_to_primary_after_writes():
+    primary, first, second = _sqlite_engines(3)
+    replicas = ReplicaSet([first, second], ["postgresql://r1/db", "postgresql://r2/db"])
+    routing = RequestRouting()
+    session = RoutingSession(bind=primary, replicas=replicas, routing=routing)
+
+    reads = {session.get_bind(clause=select(Article.id)) for _ in range(4)}
+    assert len(reads) == 1 and reads <= {first, second}
+    assert session.get_bind(clause=select(Article.id).with_for_update()) is primary
+
+    assert session.get_bind(clause=delete(Article.__table__)) is primary
+    assert routing.wrote
+    assert session.get_bind(clause=select(Article.id)) is primary
+
+    sticky = RoutingSession(bind=primary, replicas=replicas, routing=RequestRouting(force_primary=True))
+    assert sticky.get_bind(clause=select(Article.id)) is primary
+
+
+def test_routing_session_keeps_one_replica_per_session():
+    primary, first, second = _sqlite_engines(3)
+    replicas = ReplicaSet([first, second], ["postgresql://r1/db", "postgresql://r2/db"])
+    sessions = [RoutingSession(bind=primary, replicas=replicas) for _ in range(2)]
+
+    # La página y su conteo salen de la misma réplica; otra sesión usa la siguiente.
+    chosen = [session.get_bind(clause=select(Article.id)) for session in sessions]
+    assert set(chosen) == {first, second}
+    assert [session.get_bind(clause=select(Article.id)) for session in sessions] == chosen
+
+    # Si la réplica elegida cae, la sesión pasa a otra sana.
+    replicas.mark(0, healthy=False)
+    assert {session.get_bind(clause=select(Article.id)) for session in sessions} == {second}
+
+
+def test_primary_reads_pin_only_the_block_to_the_primary():
+    primary, replica = _sqlite_engines(2)
+    replicas = ReplicaSet([replica], ["postgresql://r1/db"])
+    routing = RequestRouting()
+    session = RoutingSession(bind=primary, replicas=replicas, routing=routing)
+
+    with primary_reads(session):
+        assert session.get_bind(clause=select(Article.id)) is primary
+    assert session.get_bind(clause=select(Article.id)) is replica
+    # Leer del primario no cuenta como escritura: no renueva la cookie.
+    assert not routing.wrote
+
+
+def test_replica_set_skips_unhealthy_replicas():
+    primary, first, second = _sqlite_engines(3)
+    replicas = ReplicaSet([first, second], ["postgresql://r1/db", "postgresql://r2/db"])
+    replicas.mark(0, healthy=False)
+    assert {replicas.choose() for _ in range(4)} == {second}
+
+    replicas.mark(1, healthy=False)
+    session = RoutingSession(bind=primary, replicas=replicas)
+    assert session.get_bind(clause=select(Article.id)) is primary
+    assert [replica["healthy"] for replica in replicas.status()] == [False, False]
+
+
+def test_statement_errors_do_not_eject_a_replica_but_connection_failures_do(tmp_path):
+    healthy = create_engine("sqlite://")
+    unreachable = create_engine(f"sqlite:///{tmp_path}/no-existe/replica.db")
+    replicas = ReplicaSet([healthy, unreachable], ["postgresql://r1/db", "postgresql://r2/db"])
+
+    # Un error de la sentencia (como ``QueryCanceled`` por ``statement_timeout``) es
+    # ``OperationalError`` sobre una conexión viva: la réplica sigue en rotación.
+    with pytest.raises(OperationalError):
+        with healthy.connect() as connection:
+            connection.execute(text("SELECT * FROM tabla_inexistente"))
+    with pytest.raises(OperationalError):
+        unreachable.connect()
+
+    assert [replica["healthy"] for replica in replicas.status()] == [True, False]
+
+
+def test_read_your_writes_cookie_pins_following_reads_to_primary():
+    seen = []
+
+    async def endpoint(request):
+        routing = current_routing()
+        seen.append(routing.force_primary)
+        if request.method == "POST":
+            routing.wrote = True
+        return PlainTextResponse("ok")
+
+    inner = Starlette(routes=[Route("/", endpoint, methods=["GET", "POST"])])
+    client = TestClient(ReadYourWritesMiddleware(inner, window_seconds=5))
+
+    assert STICKY_COOKIE not in client.get("/").cookies
+    response = client.post("/")
+    assert STICKY_COOKIE in response.headers["set-cookie"]
+    client.get("/")
+    assert seen == [False, False, True]
+
+
+@pytest.mark.skipif(
+    not os.getenv("TEST_REPLICA_DATABASE_URL"),
+    reason="Requiere una segunda base PostgreSQL en TEST_REPLICA_DATABASE_URL",
+)
+def test_repository_reads_hit_the_replica_and_writes_the_primary(engine):
+    import app.models  # noqa: F401 - asegura el registro de modelos
+
+    replica_engine = create_engine(os.environ["TEST_REPLICA_DATABASE_URL"], future=True)
+    Base.metadata.create_all(bind=replica_engine)
+    replicas = ReplicaSet([replica_engine], [os.environ["TEST_REPLICA_DATABASE_URL"]])
+    only_in_replica = uuid.uuid4()
+    with replica_engine.begin() as connection:
+        connection.execute(
+            insert(Article.__table__).values(
+                id=only_in_replica, title="Réplica", body="x", tags=[], author="Réplica"
+            )
+        )
+    try:
+        session = RoutingSession(bind=engine, replicas=replicas, routing=RequestRouting())
+        repository = ArticleRepository(session)
+        assert repository.get_row(str(only_in_replica)) is not None
+
+        written = repository.insert_row(
+            {"title": "Primario", "body": "x", "tags": [], "author": "Primario", "published_at": None}
+        )
+        # Después de escribir la sesión sólo lee del primario.
+        assert repository.get_row(str(written.id)) is not None
+        assert repository.get_row(str(only_in_replica)) is None
+        session.rollback()
+        session.close()
+    finally:
+        Base.metadata.drop_all(bind=replica_engine)
+        replica_engine.dispose()
@@ -0,0 +1,73 @@
+"""Pruebas de las métricas Prometheus (``/metrics``)."""
+
+from __future__ import annotations
+
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from starlette.testclient import TestClient
+
+pytest.importorskip("prometheus_client")
+
+from app import metrics  # noqa: E402
+from app.main import app  # noqa: E402
+
+pytestmark = pytest.mark.skipif(not metrics.ENABLED, reason="METRICS_ENABLED=false")
+
+
+def _sample(name: str, labels: dict) -> float:
+    return metrics.REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_requests_are_labelled_with_route_templates():
+    demo = FastAPI()
+    demo.add_middleware(metrics.MetricsMiddleware)
+
+    @demo.get("/items/{item_id}")
+    async def read_item(item_id: str) -> dict:
+        return {"id": item_id}
+
+    labels = {"method": "GET", "route": "/items/{item_id}", "status": "200"}
+    unmatched = {"method": "GET", "route": metrics.UNMATCHED_ROUTE, "status": "404"}
+    before = _sample("articles_http_request_duration_seconds_count", labels)
+    before_unmatched = _sample("articles_http_request_duration_seconds_count", unmatched)
+
+    client = TestClient(demo)
+    for item_id in ("a", "b", "c"):
+        assert client.get(f"/items/{item_id}").status_code == 200
+    assert client.get("/nothing/here").status_code == 404
+
+    assert _sample("articles_http_request_duration_seconds_count", labels) == before + 3
+    assert _sample("articles_http_request_duration_seconds_count", unmatched) == before_unmatched + 1
+    assert metrics.http_method_label("BREW") == "OTHER"
+
+
+def test_statements_are_timed_by_operation():
+    engine = create_engine("sqlite://")
+    metrics.instrument_engine(engine, "test")
+    select_labels = {"engine": "test", "operation": "SELECT"}
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        with pytest.raises(OperationalError):
+            connection.execute(text("SELECT * FROM missing_table"))
+        connection.execute(text("SELECT 2"))
+        # El fallo no deja inicios colgados que desfasen las siguientes mediciones.
+        assert connection.info["query_started"] == []
+    engine.dispose()
+
+    assert _sample("articles_db_query_duration_seconds_count", select_labels) == 2
+    assert metrics.sql_operation_label("  with updated AS (...) UPDATE ...") == "WITH"
+    assert metrics.sql_operation_label("VACUUM articles") == "OTHER"
+
+
+def test_metrics_endpoint_exposes_pools_cache_and_threadpool():
+    response = TestClient(app).get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert 'articles_db_pool_connections{pool="sync",state="size"}' in body
+    assert 'articles_cache_tier_events{event="hits",tier="redis"}' in body
+    assert 'articles_threadpool{state="total"}' in body
@@ -0,0 +1,92 @@
+"""Pruebas del perfilado por petición y la cabecera ``Server-Timing``."""
+
+from __future__ import annotations
+
+import time
+
+from fastapi import FastAPI
+from starlette.concurrency import run_in_threadpool
+from starlette.testclient import TestClient
+
+from app.profiling import (
+    PROFILE_ID_HEADER,
+    ProfileStore,
+    ProfilingMiddleware,
+    StoredProfile,
+    in_thread,
+    measure,
+)
+
+API_KEY = "profile-key"
+
+
+def _server_timing(header: str) -> dict:
+    parts = (part.strip().split(";dur=") for part in header.split(","))
+    return {name: float(value) for name, value in parts}
+
+
+def _demo_app(store: ProfileStore, sample_rate: float = 0.0) -> FastAPI:
+    demo = FastAPI()
+    demo.add_middleware(ProfilingMiddleware, api_key=API_KEY, sample_rate=sample_rate, store=store)
+
+    def slow_service_call() -> str:
+        with measure("serialize"):
+            time.sleep(0.02)
+        return "ok"
+
+    @demo.get("/work")
+    async def work() -> dict:
+        return {"result": await run_in_threadpool(in_thread(slow_service_call))}
+
+    return demo
+
+
+def test_profiled_request_reports_server_timing_and_stores_profile():
+    store = ProfileStore(max_items=5)
+    client = TestClient(_demo_app(store))
+
+    response = client.get("/work", headers={"x-profile": API_KEY})
+
+    assert response.status_code == 200
+    timings = _server_timing(response.headers["server-timing"])
+    assert set(timings) == {"db", "cache", "serialize", "total"}
+    assert timings["serialize"] >= 20
+    assert timings["total"] >= timings["serialize"]
+    profile = store.get(response.headers[PROFILE_ID_HEADER])
+    assert profile is not None and profile.path == "/work" and profile.status == 200
+    # El perfil del hilo del threadpool se suma al del event loop.
+    assert "slow_service_call" in profile.as_text(limit=200)
+
+
+def test_only_the_api_key_header_or_sampling_enables_profiling():
+    store = ProfileStore(max_items=5)
+    client = TestClient(_demo_app(store))
+    for headers in ({}, {"x-profile": "otra-clave"}):
+        response = client.get("/work", headers=headers)
+        assert "server-timing" not in response.headers
+    assert store.list() == []
+
+    sampled = TestClient(_demo_app(store, sample_rate=1.0)).get("/work")
+    assert "server-timing" in sampled.headers
+    assert len(store.list()) == 1
+
+
+def test_profile_store_keeps_the_most_recent_profiles(tmp_path):
+    store = ProfileStore(max_items=2, directory=str(tmp_path))
+    for index in range(3):
+        store.add(
+            StoredProfile(
+                id=f"p{index}",
+                method="GET",
+                path="/articles/",
+                status=200,
+                total_ms=1.0,
+                server_timing="total;dur=1.000",
+                created_at=float(index),
+                stats=b"\x7b\x30",
+            )
+        )
+
+    assert [profile["id"] for profile in store.list()] == ["p2", "p1"]
+    assert store.get("p0") is None
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["p0.prof", "p1.prof", "p2.prof"]
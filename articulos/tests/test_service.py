@@ -3,10 +3,30 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+import json
+import uuid
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timezone
 
-from app.services.article_service import ArticleCreateData, ArticleUpdateData
+import pytest
+from sqlalchemy import event
+
+from app.schemas import ArticleBatchResponse, ArticleListItem, ArticleListResponse, ArticleResponse
+from app.services import ArticleService
+
+from app.services.article_service import (
+    ArticleBatch,
+    ArticleCreateData,
+    ArticleDTO,
+    ArticlePage,
+    ArticleUpdateData,
+    BulkStatus,
+    render_article,
+    render_batch,
+    render_page,
+)
 from app.services.exceptions import ArticleAlreadyExistsError, ArticleNotFoundError
+from app.services.export import ExportFormat, iter_export
 
 
 def test_service_create_and_cache(service, cache):
@@ -82,3 +102,246 @@ def test_service_update_and_delete(service, cache):
         assert True
     else:
         assert False, "Se esperaba ArticleNotFoundError tras borrar"
+
+
+@contextmanager
+def _count_round_trips(session):
+    """Registra cada sentencia que la sesión envía a PostgreSQL."""
+    statements = []
+    connection = session.connection()
+
+    def record(conn, cursor, statement, *args):  # noqa: ARG001
+        statements.append(statement)
+
+    event.listen(connection, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(connection, "before_cursor_execute", record)
+
+
+def test_service_writes_use_a_single_round_trip(db_session, cache):
+    service = ArticleService(session=db_session, cache=cache)
+
+    with _count_round_trips(db_session) as statements:
+        created = service.create(
+            ArticleCreateData(title="Viajes", body="Uno", tags=["rt"], author="Autor")
+        )
+    assert len(statements) == 1 and statements[0].startswith("INSERT")
+    assert created.created_at is not None and created.updated_at is not None
+
+    with _count_round_trips(db_session) as statements:
+        updated = service.update(created.id, ArticleUpdateData(tags=["nueva"]))
+    assert len(statements) == 1 and "UPDATE" in statements[0]
+    assert updated.tags == ["nueva"] and updated.updated_at >= created.updated_at
+
+    with _count_round_trips(db_session) as statements:
+        with pytest.raises(ArticleNotFoundError):
+            service.update(str(uuid.uuid4()), ArticleUpdateData(body="Nada"))
+    assert len(statements) == 1
+
+    with _count_round_trips(db_session) as statements:
+        service.delete(created.id)
+    assert len(statements) == 1 and statements[0].startswith("DELETE")
+    assert cache.get(created.id) is None
+
+    with _count_round_trips(db_session) as statements:
+        with pytest.raises(ArticleNotFoundError):
+            service.delete(created.id)
+    assert len(statements) == 1
+
+
+def test_service_delete_many_by_ids_and_filters_evicts_cache(service, cache):
+    created = [
+        service.create(ArticleCreateData(title=f"Borrar {idx}", body="x", tags=[tag], author=author))
+        for idx, (author, tag) in enumerate((("Uno", "a"), ("Uno", "b"), ("Dos", "a"), ("Dos", "c")))
+    ]
+
+    deleted = service.delete_many(article_ids=[created[0].id, "no-es-uuid"])
+    assert deleted == [created[0].id]
+    assert cache.get(created[0].id) is None
+
+    deleted = service.delete_many(tags=["a"])
+    assert deleted == [created[2].id]
+    deleted = service.delete_many(author="Uno", tags=["b", "c"], tag_mode="any")
+    assert deleted == [created[1].id]
+    assert service.delete_many() == []
+    assert cache.get(created[3].id) is not None
+
+
+def test_service_exact_total_is_cached_and_invalidated(service):
+    for idx in range(3):
+        service.create(
+            ArticleCreateData(title=f"Conteo {idx}", body="Contenido", tags=["conteo"], author="Conteo")
+        )
+
+    page = service.list(author="Conteo", limit=1)
+    assert page.total == 3
+
+    service.create(ArticleCreateData(title="Conteo 3", body="Contenido", tags=["conteo"], author="Conteo"))
+    page = service.list(author="Conteo", limit=1)
+    assert page.total == 4
+
+
+def test_service_list_is_served_from_cache_until_a_related_write(service, cache):
+    first = service.create(
+        ArticleCreateData(title="Listado cacheado", body="Contenido", tags=["cache"], author="Lista")
+    )
+    page = service.list(author="Lista")
+    assert [dto.id for dto in page.items] == [first.id]
+
+    # Sin tocar la base, el listado sale de la caché (IDs + MGET de cada artículo).
+    cache.set(first.id, {**first.to_dict(), "title": "Desde caché"})
+    assert service.list(author="Lista").items[0].title == "Desde caché"
+
+    # Una escritura de otro autor no invalida el listado; una del mismo autor sí.
+    service.create(ArticleCreateData(title="Otro", body="Contenido", tags=["x"], author="Otro"))
+    assert len(service.list(author="Lista").items) == 1
+    service.create(ArticleCreateData(title="Listado 2", body="Contenido", tags=["cache"], author="Lista"))
+    assert len(service.list(author="Lista").items) == 2
+
+
+def _bulk_item(idx: int, author: str = "Bulk", tags=None) -> ArticleCreateData:
+    return ArticleCreateData(
+        title=f"Masivo {idx}", body="Contenido", tags=tags or ["bulk"], author=author
+    )
+
+
+def test_service_bulk_create_reports_each_item_and_warms_cache(service, cache):
+    service.create(_bulk_item(0))
+
+    results = service.bulk_create([_bulk_item(0), _bulk_item(1), _bulk_item(1), _bulk_item(2)])
+
+    assert [result.status for result in results] == [
+        BulkStatus.CONFLICT,
+        BulkStatus.CREATED,
+        BulkStatus.CONFLICT,
+        BulkStatus.CREATED,
+    ]
+    for result in (results[1], results[3]):
+        assert cache.get(result.article.id)["title"] == result.article.title
+
+
+def test_service_bulk_create_updates_existing_and_invalidates_old_tags(service):
+    original = service.create(_bulk_item(0, tags=["vieja"]))
+    assert service.list(tags=["vieja"]).total == 1
+
+    results = service.bulk_create([_bulk_item(0, tags=["nueva"])], update_existing=True)
+
+    assert results[0].status is BulkStatus.UPDATED
+    assert results[0].article.id == original.id
+    assert service.list(tags=["vieja"]).total == 0
+    assert service.get(original.id).tags == ["nueva"]
+
+
+def test_service_bulk_create_with_copy(service, monkeypatch):
+    from app.services import article_service
+
+    monkeypatch.setattr(article_service.settings, "bulk_copy_threshold", 1)
+    service.create(_bulk_item(0))
+
+    results = service.bulk_create([_bulk_item(idx) for idx in range(5)])
+
+    assert [result.status for result in results].count(BulkStatus.CREATED) == 4
+    assert results[0].status is BulkStatus.CONFLICT
+
+
+def test_service_get_batch_keeps_order_and_reports_missing(service, cache):
+    first = service.create(_bulk_item(1))
+    second = service.create(_bulk_item(2))
+    cache.invalidate(second.id)
+    unknown = "00000000-0000-0000-0000-000000000000"
+
+    batch = service.get_batch([second.id, "no-es-uuid", first.id.upper(), unknown, second.id])
+
+    assert [dto.id for dto in batch.items] == [second.id, first.id]
+    assert batch.missing == ["no-es-uuid", unknown]
+    # El faltante en caché se cargó con una sola consulta y quedó cacheado.
+    assert cache.get(second.id) is not None
+
+
+def test_service_reload_republishes_articles_and_skips_missing(service, cache):
+    article = service.create(_bulk_item(3))
+    cache.invalidate(article.id)
+
+    assert service.reload([article.id, str(uuid.uuid4())]) == [article.id]
+    assert cache.get(article.id)["title"] == article.title
+
+
+def test_iter_export_yields_one_chunk_per_cursor_batch(db_session, cache, monkeypatch):
+    from app.services import export
+    from app.services.article_service import ArticleService
+
+    monkeypatch.setattr(export.settings, "export_batch_size", 2)
+    service = ArticleService(db_session, cache=cache)
+    for idx in range(5):
+        service.create(_bulk_item(idx, author="Lotes"))
+
+    chunks = list(
+        iter_export(lambda: nullcontext(db_session), ExportFormat.NDJSON, author="Lotes")
+    )
+
+    assert len(chunks) == 3
+    assert sum(chunk.count(b"\n") for chunk in chunks) == 5
+
+
+def test_service_projected_list_is_cached_by_projection(service, cache):
+    created = service.create(_bulk_item(1, author="Ligero"))
+    cache.invalidate(created.id)
+
+    page = service.list(author="Ligero", fields=["title"])
+    assert [(dto.title, dto.body) for dto in page.items] == [("Masivo 1", None)]
+    # Un artículo parcial nunca se publica en ``article:{id}``...
+    assert cache.get(created.id) is None
+    # ...y la página completa no reutiliza la entrada proyectada.
+    assert service.list(author="Ligero").items[0].body == "Contenido"
+
+
+def test_service_get_projection_is_invalidated_by_updates(service, cache):
+    created = service.create(_bulk_item(1, author="Proyecta"))
+    cache.invalidate(created.id)
+
+    assert service.get(created.id, fields=["title"]).title == "Masivo 1"
+    # ``updated_at`` viaja con toda proyección: el API arma con él el ETag y ``Last-Modified``.
+    assert cache.get_projection(created.id, ["id", "title"]) == {
+        "id": created.id,
+        "title": "Masivo 1",
+        "updated_at": created.updated_at.isoformat(),
+    }
+
+    service.update(created.id, ArticleUpdateData(title="Renombrado"))
+    assert service.get(created.id, fields=["title"]).title == "Renombrado"
+
+
+def test_rendered_bodies_match_the_response_schemas():
+    now = datetime.now(timezone.utc)
+    dto = ArticleDTO(
+        id=str(uuid.uuid4()),
+        title="Render",
+        body="Contenido",
+        tags=["json"],
+        author="Ana",
+        published_at=None,
+        created_at=now,
+        updated_at=now,
+    )
+    fields = {"id", "title", "updated_at"}
+
+    assert json.loads(render_article(dto)) == ArticleResponse.model_validate(dto.to_dict()).model_dump(
+        mode="json"
+    )
+    assert json.loads(render_article(dto, fields)) == {
+        "id": dto.id,
+        "title": dto.title,
+        "updated_at": now.isoformat().replace("+00:00", "Z"),
+    }
+    page = ArticlePage(items=[dto], total=1, next_cursor=None)
+    expected_page = ArticleListResponse(
+        items=[ArticleListItem.model_validate(dto.project(fields))], total=1, limit=10, skip=0, next_cursor=None
+    )
+    assert json.loads(render_page(page, limit=10, skip=0, fields=fields)) == expected_page.model_dump(
+        mode="json", exclude_unset=True
+    )
+    batch = ArticleBatch(items=[dto], missing=["otro"])
+    expected_batch = ArticleBatchResponse(items=[ArticleResponse.model_validate(dto.to_dict())], missing=["otro"])
+    assert json.loads(render_batch(batch)) == expected_batch.model_dump(mode="json")
@@ -0,0 +1,164 @@
+"""Prueba de carga: una clave caliente que expira no provoca una estampida en la base."""
+
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from types import SimpleNamespace
+from datetime import datetime, timezone
+
+from app.cache import ArticleCache, should_refresh_early
+from app.config import settings
+from app.models.article import Article
+from app.services import ArticleService
+
+
+class ExpiringRedis:
+    """Redis en memoria, seguro entre hilos y con expiración real de claves."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._store: dict[str, tuple[bytes, float | None]] = {}
+
+    def _alive(self, key: str):
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._store[key]
+            return None
+        return entry
+
+    def get(self, key: str):
+        with self._lock:
+            entry = self._alive(key)
+            return entry[0] if entry else None
+
+    def pttl(self, key: str) -> int:
+        with self._lock:
+            entry = self._alive(key)
+            if entry is None:
+                return -2
+            if entry[1] is None:
+                return -1
+            return int((entry[1] - time.monotonic()) * 1000)
+
+    def setex(self, key: str, ttl: int, value) -> None:
+        with self._lock:
+            data = value.encode("utf-8") if isinstance(value, str) else value
+            self._store[key] = (data, time.monotonic() + ttl)
+
+    def set(self, key: str, value, nx: bool = False, px: int | None = None):
+        with self._lock:
+            if nx and self._alive(key) is not None:
+                return None
+            data = value.encode("utf-8") if isinstance(value, str) else value
+            self._store[key] = (data, time.monotonic() + px / 1000 if px else None)
+            return True
+
+    def delete(self, *keys: str) -> int:
+        with self._lock:
+            return sum(1 for key in keys if self._store.pop(key, None) is not None)
+
+    def eval(self, script: str, numkeys: int, key: str, token: str):  # noqa: ARG002
+        with self._lock:
+            entry = self._alive(key)
+            if entry and entry[0] == token.encode("utf-8"):
+                del self._store[key]
+                return 1
+            return 0
+
+    def pipeline(self, transaction: bool = True):  # noqa: ARG002
+        redis = self
+
+        class _Pipeline:
+            def __init__(self) -> None:
+                self._calls = []
+
+            def __getattr__(self, name):
+                def queue(*args, **kwargs):
+                    self._calls.append((name, args, kwargs))
+                    return self
+
+                return queue
+
+            def execute(self):
+                return [getattr(redis, name)(*args, **kwargs) for name, args, kwargs in self._calls]
+
+        return _Pipeline()
+
+
+class CountingRepository:
+    """Repositorio falso que simula la latencia de PostgreSQL y cuenta las lecturas."""
+
+    def __init__(self, article: Article) -> None:
+        self._article = article
+        self._lock = threading.Lock()
+        self.reads = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def get_row(self, article_id: str, *, columns=None):  # noqa: ARG002
+        with self._lock:
+            self.reads += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.05)
+        with self._lock:
+            self.in_flight -= 1
+        mapping = {column.name: getattr(self._article, column.name) for column in Article.__table__.columns}
+        return SimpleNamespace(_mapping=mapping)
+
+
+def test_hot_key_expiry_triggers_a_single_db_read_per_expiry(monkeypatch):
+    # Sin refresco anticipado: se mide exactamente el comportamiento al expirar.
+    monkeypatch.setattr(settings, "cache_xfetch_beta", 0.0)
+    now = datetime.now(timezone.utc)
+    article = Article(
+        id=uuid.uuid4(),
+        title="Caliente",
+        body="Contenido",
+        tags=["hot"],
+        author="Autor",
+        published_at=None,
+        created_at=now,
+        updated_at=now,
+    )
+    repository = CountingRepository(article)
+    ttl_seconds = 1
+    cache = ArticleCache(ExpiringRedis(), ttl_seconds=ttl_seconds)
+    service = ArticleService(session=None, cache=cache)
+    service._repository = repository
+
+    duration = 2.5
+    deadline = time.monotonic() + duration
+    errors: list[BaseException] = []
+
+    def hammer() -> None:
+        try:
+            while time.monotonic() < deadline:
+                assert service.get(str(article.id)).title == "Caliente"
+        except BaseException as exc:  # pragma: no cover - se reporta abajo
+            errors.append(exc)
+
+    threads = [threading.Thread(target=hammer) for _ in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    # Lectura inicial + una por expiración, nunca dos a la vez (sin el lock serían
+    # hasta 16 lecturas simultáneas en cada expiración).
+    assert repository.max_in_flight == 1
+    expiries = int(duration // ttl_seconds)
+    assert 1 <= repository.reads <= expiries + 1
+
+
+def test_xfetch_refreshes_more_often_near_expiry():
+    far = sum(should_refresh_early(60.0, recompute_seconds=0.05) for _ in range(1000))
+    near = sum(should_refresh_early(0.01, recompute_seconds=0.05) for _ in range(1000))
+    assert far == 0
+    assert near > 500